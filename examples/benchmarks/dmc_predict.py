@@ -0,0 +1,69 @@
+''' Benchmark scoring the legal actions with DMCAgent.predict. The split
+    first layer is compared with repeating the obs for each action
+'''
+import argparse
+import time
+
+import numpy as np
+import torch
+
+import rlcard
+from rlcard.agents.dmc_agent.model import DMCAgent
+
+def predict_with_repeat(agent, state):
+    ''' Score the legal actions by repeating the obs for each action
+    '''
+    obs = state['obs'].astype(np.float32)
+    legal_actions = state['legal_actions']
+    action_keys = np.array(list(legal_actions.keys()))
+    action_values = list(legal_actions.values())
+    for i in range(len(action_values)):
+        if action_values[i] is None:
+            action_values[i] = np.zeros(agent.action_shape[0])
+            action_values[i][action_keys[i]] = 1
+    action_values = np.array(action_values, dtype=np.float32)
+    obs = np.repeat(obs[np.newaxis, :], len(action_keys), axis=0)
+    values = agent.net.forward(torch.from_numpy(obs).to(agent.device),
+                               torch.from_numpy(action_values).to(agent.device))
+    return action_keys, values.cpu().detach().numpy()
+
+def collect_states(env, num_games):
+    ''' Collect the states of a few random games
+
+    Returns:
+        (list): A list of (player_id, state)
+    '''
+    states = []
+    for _ in range(num_games):
+        state, player_id = env.reset()
+        while not env.is_over():
+            states.append((player_id, state))
+            action = np.random.choice(list(state['legal_actions'].keys()))
+            state, player_id = env.step(action)
+    return states
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser("Benchmark of DMCAgent.predict in RLCard")
+    parser.add_argument('--env', type=str, default='doudizhu')
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--num_games', type=int, default=20)
+
+    args = parser.parse_args()
+
+    torch.set_num_threads(1)
+    env = rlcard.make(args.env, config={'seed': args.seed})
+    action_shape = env.action_shape[0] if env.action_shape[0] is not None else [env.num_actions]
+    agents = [DMCAgent(env.state_shape[i], action_shape, device='cpu') for i in range(env.num_players)]
+    states = collect_states(env, args.num_games)
+    num_actions = sum(len(state['legal_actions']) for _, state in states)
+
+    for player_id, state in states[:10]:
+        agent = agents[player_id]
+        assert np.allclose(agent.predict(state)[1], predict_with_repeat(agent, state)[1], atol=1e-5)
+
+    for name, predict in [('split first layer', lambda agent, state: agent.predict(state)), ('repeat obs', predict_with_repeat)]:
+        start = time.perf_counter()
+        for player_id, state in states:
+            predict(agents[player_id], state)
+        elapsed = time.perf_counter() - start
+        print('{}: {:.0f} states/s, {:.0f} actions/s'.format(name, len(states) / elapsed, num_actions / elapsed))
@@ -0,0 +1,74 @@
+''' Benchmark the Doudizhu legal-move generators. The bitmask tables of
+    `get_playable_action_ids`/`get_gt_action_ids` are compared with the
+    string-based `DoudizhuJudger.playable_cards_from_hand`/`get_gt_cards`
+'''
+import argparse
+import time
+
+import numpy as np
+
+from rlcard.games.doudizhu.game import DoudizhuGame
+from rlcard.games.doudizhu.judger import DoudizhuJudger
+from rlcard.games.doudizhu.utils import cards2str, get_gt_cards
+from rlcard.games.doudizhu.utils import get_playable_action_ids, get_gt_action_ids
+
+def collect_positions(num_games, seed):
+    ''' Play random games and collect the positions to generate moves for
+
+    Returns:
+        (list): A list of (player, greater_player) with copies of the hands
+    '''
+    game = DoudizhuGame()
+    game.np_random = np.random.RandomState(seed)
+    positions = []
+    for _ in range(num_games):
+        state, player_id = game.init_game()
+        while not game.is_over():
+            player = game.players[player_id]
+            greater_player = game.round.greater_player
+            if greater_player is not None and greater_player.player_id == player_id:
+                greater_player = None
+            positions.append((cards2str(player.current_hand), player, greater_player and greater_player.played_cards))
+            action = state['actions'][game.np_random.randint(len(state['actions']))]
+            state, player_id = game.step(action)
+    return positions
+
+class _Player:
+    ''' The fields of a player used by get_gt_cards
+    '''
+    def __init__(self, current_hand, played_cards=None):
+        self.current_hand = current_hand
+        self.played_cards = played_cards
+
+def judger_moves(current_hand, target_cards):
+    if target_cards is None:
+        return DoudizhuJudger.playable_cards_from_hand(current_hand)
+    return get_gt_cards(_Player(current_hand), _Player('', target_cards))
+
+def bitmask_moves(current_hand, target_cards):
+    if target_cards is None:
+        return get_playable_action_ids(current_hand)
+    return get_gt_action_ids(current_hand, target_cards)
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser("Benchmark of the Doudizhu legal-move generators in RLCard")
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--num_games', type=int, default=50)
+
+    args = parser.parse_args()
+
+    positions = [(hand, target) for hand, _, target in collect_positions(args.num_games, args.seed)]
+    bitmask_moves('3', None)  # Build the tables
+
+    # get_gt_cards takes players whose hands are lists of cards, the strings work the same
+    import rlcard.games.doudizhu.utils as utils
+    cards2str = utils.cards2str
+    utils.cards2str = lambda cards: cards
+    for name, generate in [('judger', judger_moves), ('bitmask', bitmask_moves)]:
+        for kind, selected in [('leading', [p for p in positions if p[1] is None]), ('following', [p for p in positions if p[1] is not None])]:
+            start = time.perf_counter()
+            for hand, target in selected:
+                generate(hand, target)
+            elapsed = time.perf_counter() - start
+            print('{} {}: {:.0f} positions/s'.format(name, kind, len(selected) / elapsed))
+    utils.cards2str = cards2str
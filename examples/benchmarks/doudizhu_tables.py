@@ -0,0 +1,40 @@
+''' Benchmark the loading of the Doudizhu tables. Each measure is taken
+    in a fresh interpreter: the latency of the first game of Doudizhu,
+    which loads the action space and the tables of the legal-move
+    generator, and the time to compile the tables from the json docs.
+'''
+import argparse
+import subprocess
+import sys
+
+FIRST_GAME = '''
+import time
+start = time.perf_counter()
+from rlcard.games.doudizhu import Game
+Game().init_game()
+print(time.perf_counter() - start)
+'''
+
+COMPILE = '''
+import time
+from rlcard.games.doudizhu import utils
+start = time.perf_counter()
+utils._compile_tables()
+print(time.perf_counter() - start)
+'''
+
+def run(code):
+    ''' Get the time printed by a code in a fresh interpreter
+    '''
+    return float(subprocess.check_output([sys.executable, '-c', code]))
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser("Benchmark of the Doudizhu tables in RLCard")
+    parser.add_argument('--repeats', type=int, default=3)
+
+    args = parser.parse_args()
+
+    first_game = min(run(FIRST_GAME) for _ in range(args.repeats))
+    compile_time = min(run(COMPILE) for _ in range(args.repeats))
+    print('First game, cached tables: {:.1f} ms'.format(first_game * 1000))
+    print('Compiling the tables from json: {:.1f} ms'.format(compile_time * 1000))
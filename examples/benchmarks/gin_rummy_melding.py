@@ -0,0 +1,53 @@
+''' Benchmark the melding of Gin Rummy. The hands of 11 cards met in random
+    games are judged with `judge.get_going_out_cards`, which finds the knock
+    and gin cards over all the meld clusters, and random agents play games
+    with `env.run`, which gets the legal actions of each step
+'''
+import argparse
+import time
+
+import numpy as np
+
+import rlcard
+from rlcard.agents import RandomAgent
+from rlcard.games.gin_rummy import judge
+from rlcard.games.gin_rummy.game import GinRummyGame
+
+def collect_hands(num_games, seed):
+    ''' Collect the hands of 11 cards of the current player in random games
+    '''
+    game = GinRummyGame()
+    game.np_random = np.random.RandomState(seed)
+    hands = []
+    for _ in range(num_games):
+        game.init_game()
+        while not game.is_over():
+            hand = game.get_current_player().hand
+            if len(hand) == 11:
+                hands.append(list(hand))
+            actions = game.judge.get_legal_actions()
+            game.step(actions[game.np_random.randint(len(actions))])
+    return hands
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser("Benchmark of the Gin Rummy melding in RLCard")
+    parser.add_argument('--num_games', type=int, default=100)
+    parser.add_argument('--seed', type=int, default=42)
+
+    args = parser.parse_args()
+
+    hands = collect_hands(args.num_games, args.seed)
+    start = time.perf_counter()
+    for hand in hands:
+        judge.get_going_out_cards(hand, 10)
+    elapsed = time.perf_counter() - start
+    print('get_going_out_cards: {:.1f} us/hand'.format(elapsed / len(hands) * 1e6))
+
+    env = rlcard.make('gin-rummy', config={'seed': args.seed})
+    env.set_agents([RandomAgent(num_actions=env.num_actions) for _ in range(env.num_players)])
+    num_steps = 0
+    start = time.perf_counter()
+    for _ in range(args.num_games):
+        trajectories, _ = env.run(is_training=False)
+        num_steps += sum(len(trajectory) // 2 for trajectory in trajectories)
+    print('Random games: {:.0f} steps/s'.format(num_steps / (time.perf_counter() - start)))
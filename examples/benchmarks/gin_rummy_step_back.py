@@ -0,0 +1,40 @@
+''' Benchmark the cost of stepping back a move of Gin Rummy. At each state
+    of random games, a random legal action is stepped and stepped back with
+    `GinRummyGame.step_back`, which replays the undo log of the move
+'''
+import argparse
+import time
+
+import numpy as np
+
+from rlcard.games.gin_rummy.game import GinRummyGame
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser("Benchmark of the Gin Rummy step_back in RLCard")
+    parser.add_argument('--num_games', type=int, default=200)
+    parser.add_argument('--seed', type=int, default=42)
+
+    args = parser.parse_args()
+
+    game = GinRummyGame(allow_step_back=True)
+    game.np_random = np.random.RandomState(args.seed)
+    num_moves = 0
+    step_time = 0.
+    step_back_time = 0.
+    for _ in range(args.num_games):
+        game.init_game()
+        while not game.is_over():
+            legal_actions = game.judge.get_legal_actions()
+            action = legal_actions[game.np_random.randint(len(legal_actions))]
+            start = time.perf_counter()
+            game.step(action)
+            step_time += time.perf_counter() - start
+            start = time.perf_counter()
+            game.step_back()
+            step_back_time += time.perf_counter() - start
+            num_moves += 1
+            game.step(action)
+
+    print('{} moves'.format(num_moves))
+    print('step: {:.1f} us/move'.format(step_time / num_moves * 1e6))
+    print('step_back: {:.1f} us/move'.format(step_back_time / num_moves * 1e6))
@@ -0,0 +1,51 @@
+''' Benchmark the equity calculator of Texas Hold'em. A sampled estimation
+    is compared with the same estimation made with `compare_hands`
+'''
+import argparse
+import time
+
+import numpy as np
+
+from rlcard.games.limitholdem.equity import EquityCalculator
+from rlcard.games.limitholdem.evaluator import CARD_IDS, evaluate_hand
+from rlcard.games.limitholdem.utils import compare_hands
+
+def compare_hands_equity(hole_cards, public_cards, num_opponents, num_samples, np_random):
+    ''' Estimate the equity by playing showdowns one by one with `compare_hands`
+    '''
+    deck = [c for c in CARD_IDS if c not in hole_cards + public_cards]
+    counts = np.zeros(3)
+    for _ in range(num_samples):
+        draws = list(np_random.choice(deck, 5 - len(public_cards) + 2 * num_opponents, replace=False))
+        board = public_cards + draws[:5-len(public_cards)]
+        hands = [hole_cards + board] + [draws[-2*i-2:len(draws)-2*i] + board for i in range(num_opponents)]
+        winners = compare_hands(hands)
+        if not winners[0]:
+            counts[2] += 1
+        elif sum(winners) > 1:
+            counts[1] += 1
+        else:
+            counts[0] += 1
+    return tuple(counts / num_samples)
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser("Benchmark of the holdem equity in RLCard")
+    parser.add_argument('--num_samples', type=int, default=2000)
+    parser.add_argument('--num_opponents', type=int, default=2)
+    parser.add_argument('--seed', type=int, default=42)
+
+    args = parser.parse_args()
+
+    hole_cards, public_cards = ['SA', 'HK'], ['D2', 'C7', 'HQ']
+    evaluate_hand(list(range(7)))  # Build the tables
+    start = time.perf_counter()
+    old = compare_hands_equity(hole_cards, public_cards, args.num_opponents, args.num_samples, np.random.RandomState(args.seed))
+    old_time = time.perf_counter() - start
+
+    calculator = EquityCalculator(num_samples=args.num_samples, cache_size=0, seed=args.seed)
+    start = time.perf_counter()
+    new = calculator.equity(hole_cards, public_cards, args.num_opponents)
+    new_time = time.perf_counter() - start
+
+    print('compare_hands: {:.3f} s, win/tie/lose {:.3f}/{:.3f}/{:.3f}'.format(old_time, *old))
+    print('EquityCalculator: {:.3f} s, win/tie/lose {:.3f}/{:.3f}/{:.3f}, speedup {:.0f}x'.format(new_time, *new, old_time / new_time))
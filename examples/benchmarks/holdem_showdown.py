@@ -0,0 +1,50 @@
+''' Benchmark the showdown of Texas Hold'em. The lookup-table evaluator,
+    for single hands and for batches, is compared with `compare_hands`
+'''
+import argparse
+import time
+
+import numpy as np
+
+from rlcard.games.limitholdem.evaluator import CARD_IDS, evaluate_hand, evaluate_hands
+from rlcard.games.limitholdem.judger import LimitHoldemJudger
+from rlcard.games.limitholdem.utils import compare_hands
+
+def deal_showdowns(num_showdowns, num_players, seed):
+    ''' Deal random hands of 7 cards sharing the same board
+
+    Returns:
+        (numpy.array): The card ids, of shape (num_showdowns, num_players, 7)
+    '''
+    np_random = np.random.RandomState(seed)
+    card_ids = np.empty((num_showdowns, num_players, 7), dtype=np.int64)
+    for i in range(num_showdowns):
+        deck = np_random.permutation(52)
+        card_ids[i, :, :5] = deck[:5]
+        card_ids[i, :, 5:] = deck[5:5+2*num_players].reshape(num_players, 2)
+    return card_ids
+
+def timeit(fn, num):
+    start = time.perf_counter()
+    fn()
+    return num / (time.perf_counter() - start)
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser("Benchmark of the holdem showdown in RLCard")
+    parser.add_argument('--num_showdowns', type=int, default=20000)
+    parser.add_argument('--num_players', type=int, default=2)
+    parser.add_argument('--seed', type=int, default=42)
+
+    args = parser.parse_args()
+
+    card_ids = deal_showdowns(args.num_showdowns, args.num_players, args.seed)
+    cards = list(CARD_IDS)
+    string_hands = [[[cards[c] for c in hand] for hand in showdown] for showdown in card_ids.tolist()]
+    evaluate_hand(list(range(7)))  # Build the tables
+
+    old = timeit(lambda: [compare_hands(hands) for hands in string_hands], args.num_showdowns)
+    single = timeit(lambda: [LimitHoldemJudger.get_winners(hands) for hands in string_hands], args.num_showdowns)
+    batch = timeit(lambda: evaluate_hands(card_ids), args.num_showdowns)
+    print('compare_hands: {:.0f} showdowns/s'.format(old))
+    print('evaluate_hand: {:.0f} showdowns/s, speedup {:.1f}x'.format(single, single / old))
+    print('evaluate_hands: {:.0f} showdowns/s, speedup {:.1f}x'.format(batch, batch / old))
@@ -0,0 +1,40 @@
+''' Benchmark the startup of RLCard. Each measure is taken in a fresh
+    interpreter: the cumulative time of `import rlcard` and
+    `import rlcard.agents` reported by `python -X importtime`, and the
+    latency of the first `rlcard.make` of each environment.
+'''
+import argparse
+import subprocess
+import sys
+
+from rlcard.envs import registration
+
+def import_time(module):
+    ''' Get the cumulative import time of a module in microseconds
+    '''
+    result = subprocess.run([sys.executable, '-X', 'importtime', '-c', 'import ' + module],
+                            stderr=subprocess.PIPE, universal_newlines=True, check=True)
+    for line in result.stderr.splitlines():
+        _, _, cumulative, name = [field.strip() for field in line.replace(':', '|', 1).split('|')]
+        if name == module:
+            return int(cumulative)
+
+def make_time(env_id):
+    ''' Get the latency of the first `rlcard.make` in seconds
+    '''
+    code = 'import time, rlcard; start = time.perf_counter(); rlcard.make({!r}); print(time.perf_counter() - start)'.format(env_id)
+    return float(subprocess.check_output([sys.executable, '-c', code]))
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser("Benchmark of the startup of RLCard")
+    parser.add_argument('--envs', nargs='*', default=sorted(registration.registry.env_specs))
+    parser.add_argument('--repeats', type=int, default=3)
+
+    args = parser.parse_args()
+
+    for module in ['rlcard', 'rlcard.agents']:
+        best = min(import_time(module) for _ in range(args.repeats))
+        print('import {}: {:.1f} ms'.format(module, best / 1000))
+    for env_id in args.envs:
+        best = min(make_time(env_id) for _ in range(args.repeats))
+        print('rlcard.make({!r}): {:.1f} ms'.format(env_id, best * 1000))
@@ -0,0 +1,54 @@
+''' Benchmark the win detection of Mahjong. The hands of random games are
+    judged with `MahjongJudger.judge_hu`, and the random games are played
+    with `MahjongGame`, which judges all the players after each step
+'''
+import argparse
+import time
+
+import numpy as np
+
+from rlcard.games.mahjong import Game, Judger, Player
+
+def play_random_games(num_games, seed):
+    ''' Play random games
+
+    Returns:
+        (tuple): Tuple containing:
+
+            (list): Copies of the current player after each step
+            (int): The number of steps
+    '''
+    game = Game()
+    game.np_random = np.random.RandomState(seed)
+    players, num_steps = [], 0
+    for _ in range(num_games):
+        state, _ = game.init_game()
+        while not game.is_over():
+            actions = game.get_legal_actions(state)
+            state, _ = game.step(actions[game.np_random.randint(len(actions))])
+            num_steps += 1
+            player = Player(game.round.current_player, game.np_random)
+            player.hand = list(game.players[player.player_id].hand)
+            player.pile = list(game.players[player.player_id].pile)
+            players.append(player)
+    return players, num_steps
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser("Benchmark of the Mahjong win detection in RLCard")
+    parser.add_argument('--num_games', type=int, default=100)
+    parser.add_argument('--seed', type=int, default=42)
+
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    players, num_steps = play_random_games(args.num_games, args.seed)
+    steps_per_second = num_steps / (time.perf_counter() - start)
+
+    judger = Judger(np.random.RandomState(args.seed))
+    start = time.perf_counter()
+    for player in players:
+        judger.judge_hu(player)
+    hands_per_second = len(players) / (time.perf_counter() - start)
+
+    print('judge_hu: {:.0f} hands/s'.format(hands_per_second))
+    print('Random games: {:.0f} steps/s'.format(steps_per_second))
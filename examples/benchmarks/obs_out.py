@@ -0,0 +1,48 @@
+''' Benchmark the encoding of the observations into caller-provided
+    buffers. At each state of random games, the state of the current
+    player is extracted with `env.get_state` into a row of a preallocated
+    rollout buffer, once by copying a new array and once with `obs_out`
+'''
+import argparse
+import time
+
+import numpy as np
+
+import rlcard
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser("Benchmark of the observation buffers in RLCard")
+    parser.add_argument('--env', type=str, nargs='+',
+            default=['leduc-holdem', 'limit-holdem', 'no-limit-holdem', 'uno', 'mahjong', 'gin-rummy', 'doudizhu'])
+    parser.add_argument('--num_games', type=int, default=100)
+    parser.add_argument('--dtype', type=str, default='int8', choices=['int8', 'float32'])
+    parser.add_argument('--seed', type=int, default=42)
+
+    args = parser.parse_args()
+
+    for env_id in args.env:
+        env = rlcard.make(env_id, config={'seed': args.seed})
+        np_random = np.random.RandomState(args.seed)
+        max_state_size = max(int(np.prod(shape)) for shape in env.state_shape)
+        rollout = np.zeros((1024, max_state_size), dtype=args.dtype)
+        num_states = 0
+        new_time = 0.
+        out_time = 0.
+        for _ in range(args.num_games):
+            state, player_id = env.reset()
+            while not env.is_over():
+                shape = tuple(env.state_shape[player_id])
+                row = rollout[num_states % len(rollout), :int(np.prod(shape))].reshape(shape)
+                start = time.perf_counter()
+                row[...] = env.get_state(player_id)['obs']
+                new_time += time.perf_counter() - start
+                start = time.perf_counter()
+                env.get_state(player_id, obs_out=row)
+                out_time += time.perf_counter() - start
+                num_states += 1
+
+                legal_actions = list(state['legal_actions'].keys())
+                state, player_id = env.step(legal_actions[np_random.randint(len(legal_actions))])
+
+        print('{}: {} states, new array and copy {:.1f} us/state, obs_out {:.1f} us/state'.format(
+            env_id, num_states, new_time / num_states * 1e6, out_time / num_states * 1e6))
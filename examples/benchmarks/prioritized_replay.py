@@ -0,0 +1,68 @@
+''' Benchmark the prioritized replay of DQN against the uniform replay.
+    A DQN agent is trained against random agents, and the average payoff
+    of evaluation games is reported over the training episodes and the
+    wall-clock time. The time to reach the target payoff is reported too.
+'''
+import argparse
+import contextlib
+import io
+import time
+
+import torch
+
+import rlcard
+from rlcard.agents import DQNAgent, RandomAgent
+from rlcard.utils import reorganize, set_seed, tournament
+
+def train(env_id, prioritized_replay, args):
+    ''' Train a DQN agent in the first position
+
+    Returns:
+        (list): Tuples of the episode, the training time and the average payoff of each evaluation
+    '''
+    set_seed(args.seed)
+    env = rlcard.make(env_id, config={'seed': args.seed})
+    agent = DQNAgent(num_actions=env.num_actions,
+                     state_shape=env.state_shape[0],
+                     mlp_layers=[64,64],
+                     device=torch.device('cpu'),
+                     prioritized_replay=prioritized_replay)
+    env.set_agents([agent] + [RandomAgent(num_actions=env.num_actions) for _ in range(env.num_players - 1)])
+
+    curve = []
+    training_time = 0
+    for episode in range(1, args.num_episodes + 1):
+        start = time.perf_counter()
+        trajectories, payoffs = env.run(is_training=True)
+        # Silence the training logs
+        with contextlib.redirect_stdout(io.StringIO()):
+            for ts in reorganize(trajectories, payoffs)[0]:
+                agent.feed(ts)
+        training_time += time.perf_counter() - start
+
+        if episode % args.evaluate_every == 0:
+            curve.append((episode, training_time, tournament(env, args.num_eval_games)[0]))
+    return curve
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser("Benchmark of the prioritized replay of DQN in RLCard")
+    parser.add_argument('--envs', nargs='*', default=['leduc-holdem', 'uno'])
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--num_episodes', type=int, default=3000)
+    parser.add_argument('--evaluate_every', type=int, default=500)
+    parser.add_argument('--num_eval_games', type=int, default=1000)
+    parser.add_argument('--target_payoffs', nargs='*', type=float, default=[1.0, 0.1])
+
+    args = parser.parse_args()
+
+    for env_id, target in zip(args.envs, args.target_payoffs):
+        for name, prioritized_replay in (('uniform', False), ('prioritized', True)):
+            curve = train(env_id, prioritized_replay, args)
+            reached = [(episode, seconds) for episode, seconds, payoff in curve if payoff >= target]
+            print('{} {}:'.format(env_id, name))
+            for episode, seconds, payoff in curve:
+                print('  episode {:6d}, {:7.1f} s, payoff {:.3f}'.format(episode, seconds, payoff))
+            if reached:
+                print('  payoff {} reached at episode {}, {:.1f} s'.format(target, *reached[0]))
+            else:
+                print('  payoff {} not reached'.format(target))
@@ -0,0 +1,53 @@
+''' Benchmark the replay memory of DQN. The circular buffer of arrays is
+    compared with a list of transitions that evicts with `pop(0)`
+'''
+import argparse
+import random
+import time
+
+import numpy as np
+
+from rlcard.agents.dqn_agent import Memory, Transition
+
+class ListMemory(Memory):
+    ''' The replay memory that keeps a list of transitions
+    '''
+
+    def __init__(self, memory_size, batch_size, num_actions):
+        self.memory_size = memory_size
+        self.batch_size = batch_size
+        self.memory = []
+
+    def save(self, state, action, reward, next_state, legal_actions, done):
+        if len(self.memory) == self.memory_size:
+            self.memory.pop(0)
+        self.memory.append(Transition(state, action, reward, next_state, legal_actions, done))
+
+    def sample(self):
+        samples = random.sample(self.memory, self.batch_size)
+        return map(np.array, zip(*samples))
+
+def benchmark(memory_class, args):
+    memory = memory_class(args.memory_size, args.batch_size, args.num_actions)
+    states = np.random.random_sample((1000, args.state_size))
+    legal_actions = np.arange(args.num_actions) % 3 == 0
+    start = time.perf_counter()
+    for i in range(args.num_steps):
+        memory.save(states[i % 1000], i % args.num_actions, 0.0, states[(i+1) % 1000], legal_actions, False)
+        if i >= args.batch_size:
+            tuple(memory.sample())
+    return args.num_steps / (time.perf_counter() - start)
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser("Benchmark of the DQN replay memory in RLCard")
+    parser.add_argument('--memory_size', type=int, default=200000)
+    parser.add_argument('--num_steps', type=int, default=400000)
+    parser.add_argument('--batch_size', type=int, default=32)
+    parser.add_argument('--state_size', type=int, default=72)
+    parser.add_argument('--num_actions', type=int, default=4)
+
+    args = parser.parse_args()
+
+    array_memory = benchmark(Memory, args)
+    list_memory = benchmark(ListMemory, args)
+    print('circular buffer {:.0f} steps/s, list {:.0f} steps/s, speedup {:.1f}x'.format(array_memory, list_memory, array_memory / list_memory))
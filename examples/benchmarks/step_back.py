@@ -0,0 +1,74 @@
+''' Benchmark step/step_back in a CFR-style tree traversal. The undo log
+    used by the games is compared with taking deepcopy snapshots of the game
+'''
+import argparse
+import time
+from copy import deepcopy
+
+import rlcard
+
+def use_deepcopy_snapshots(env):
+    ''' Make the game of the environment step back with deepcopy snapshots
+        of its fields instead of the undo log
+    '''
+    game = env.game
+    game.allow_step_back = False
+    step = game.step
+    snapshots = []
+
+    def snapshot_step(action):
+        fields = {k: v for k, v in vars(game).items() if k not in ('np_random', 'history', 'step', 'step_back')}
+        snapshots.append(deepcopy(fields, {id(game): game, id(game.np_random): game.np_random}))
+        return step(action)
+
+    def snapshot_step_back():
+        if not snapshots:
+            return False
+        vars(game).update(snapshots.pop())
+        return True
+
+    game.step = snapshot_step
+    game.step_back = snapshot_step_back
+
+def traverse(env, depth, max_depth, budget):
+    ''' Visit the game tree depth first with step/step_back
+
+    Returns:
+        (int): The number of visited nodes
+    '''
+    if env.is_over() or depth == max_depth or budget <= 0:
+        return 1
+    nodes = 1
+    state = env.get_state(env.get_player_id())
+    for action in state['legal_actions']:
+        env.step(action)
+        nodes += traverse(env, depth+1, max_depth, budget-nodes)
+        env.step_back()
+    return nodes
+
+def benchmark(env_id, mode, args):
+    env = rlcard.make(env_id, config={'allow_step_back': True, 'seed': args.seed})
+    if mode == 'deepcopy':
+        use_deepcopy_snapshots(env)
+    nodes = 0
+    start = time.perf_counter()
+    for _ in range(args.num_games):
+        env.reset()
+        nodes += traverse(env, 0, args.max_depth, args.max_nodes)
+    elapsed = time.perf_counter() - start
+    return nodes / elapsed
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser("Benchmark of step_back in RLCard")
+    parser.add_argument('--envs', nargs='*', default=['leduc-holdem', 'limit-holdem'])
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--num_games', type=int, default=20)
+    parser.add_argument('--max_depth', type=int, default=8)
+    parser.add_argument('--max_nodes', type=int, default=5000)
+
+    args = parser.parse_args()
+
+    for env_id in args.envs:
+        undo = benchmark(env_id, 'undo', args)
+        snapshot = benchmark(env_id, 'deepcopy', args)
+        print('{}: undo log {:.0f} nodes/s, deepcopy {:.0f} nodes/s, speedup {:.1f}x'.format(env_id, undo, snapshot, undo / snapshot))
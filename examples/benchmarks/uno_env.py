@@ -0,0 +1,27 @@
+''' Benchmark the UNO environment. Random agents play games with
+    `env.run`, which encodes the observation and the legal actions of
+    each step
+'''
+import argparse
+import time
+
+import rlcard
+from rlcard.agents import RandomAgent
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser("Benchmark of the UNO environment in RLCard")
+    parser.add_argument('--num_games', type=int, default=200)
+    parser.add_argument('--seed', type=int, default=42)
+
+    args = parser.parse_args()
+
+    env = rlcard.make('uno', config={'seed': args.seed})
+    env.set_agents([RandomAgent(num_actions=env.num_actions) for _ in range(env.num_players)])
+
+    num_steps = 0
+    start = time.perf_counter()
+    for _ in range(args.num_games):
+        trajectories, _ = env.run(is_training=False)
+        num_steps += sum(len(trajectory) // 2 for trajectory in trajectories)
+    elapsed = time.perf_counter() - start
+    print('{} steps in {:.2f}s, {:.0f} steps/s'.format(num_steps, elapsed, num_steps / elapsed))
@@ -5,7 +5,7 @@ import argparse
 
 import rlcard
 from rlcard.agents import DQNAgent, RandomAgent
-from rlcard.utils import get_device, set_seed, tournament
+from rlcard.utils import get_device, set_seed, tournament, parallel_tournament
 
 def load_model(model_path, env=None, position=None, device=None):
     if os.path.isfile(model_path):  # Torch model
@@ -43,9 +43,14 @@ def evaluate(args):
     env.set_agents(agents)
 
     # Evaluate
-    rewards = tournament(env, args.num_games)
-    for position, reward in enumerate(rewards):
-        print(position, args.models[position], reward)
+    if args.num_workers > 1:
+        rewards, stderrs = parallel_tournament(args.env, agents, args.num_games, num_workers=args.num_workers, seed=args.seed)
+        for position, reward in enumerate(rewards):
+            print(position, args.models[position], reward, '+/-', stderrs[position])
+    else:
+        rewards = tournament(env, args.num_games)
+        for position, reward in enumerate(rewards):
+            print(position, args.models[position], reward)
 
 if __name__ == '__main__':
     parser = argparse.ArgumentParser("Evaluation example in RLCard")
@@ -55,6 +60,7 @@ if __name__ == '__main__':
     parser.add_argument('--cuda', type=str, default='')
     parser.add_argument('--seed', type=int, default=42)
     parser.add_argument('--num_games', type=int, default=10000)
+    parser.add_argument('--num_workers', type=int, default=1)
 
     args = parser.parse_args()
 
@@ -1,22 +1,29 @@
-''' An example of solve Leduc Hold'em with CFR (chance sampling)
+''' An example of solve Leduc Hold'em with CFR (chance sampling). The Monte
+    Carlo variants (external and outcome sampling) can also be used for
+    the larger games such as Limit Texas Hold'em
 '''
 import os
 import argparse
 
 import rlcard
-from rlcard.agents import CFRAgent, RandomAgent
+from rlcard.agents import CFRAgent, ExternalSamplingCFRAgent, OutcomeSamplingCFRAgent, RandomAgent
 from rlcard.utils import set_seed, tournament, Logger, plot_curve
 
 def train(args):
-    # Make environments, CFR only supports Leduc Holdem
-    env = rlcard.make('leduc-holdem', config={'seed': 0, 'allow_step_back':True})
-    eval_env = rlcard.make('leduc-holdem', config={'seed': 0})
+    # Make environments, chance sampling CFR only supports Leduc Holdem
+    env = rlcard.make(args.env, config={'seed': 0, 'allow_step_back':True})
+    eval_env = rlcard.make(args.env, config={'seed': 0})
 
     # Seed numpy, torch, random
     set_seed(args.seed)
 
     # Initilize CFR Agent
-    agent = CFRAgent(env, os.path.join(args.log_dir, 'cfr_model'))
+    if args.algorithm == 'chance':
+        agent = CFRAgent(env, os.path.join(args.log_dir, 'cfr_model'))
+    elif args.algorithm == 'external':
+        agent = ExternalSamplingCFRAgent(env, os.path.join(args.log_dir, 'cfr_model'), report_every=args.report_every)
+    else:
+        agent = OutcomeSamplingCFRAgent(env, os.path.join(args.log_dir, 'cfr_model'), report_every=args.report_every)
     agent.load()  # If we have saved model, we first load the model
 
     # Evaluate CFR against random
@@ -26,7 +33,8 @@ def train(args):
     with Logger(args.log_dir) as logger:
         for episode in range(args.num_episodes):
             agent.train()
-            print('\rIteration {}'.format(episode), end='')
+            if args.algorithm == 'chance':
+                print('\rIteration {}'.format(episode), end='')
             # Evaluate the performance. Play with Random agents.
             if episode % args.evaluate_every == 0:
                 agent.save() # Save model
@@ -35,10 +43,13 @@ def train(args):
         # Get the paths
         csv_path, fig_path = logger.csv_path, logger.fig_path
     # Plot the learning curve
-    plot_curve(csv_path, fig_path, 'cfr')
+    plot_curve(csv_path, fig_path, args.algorithm + ' cfr')
 
 if __name__ == '__main__':
     parser = argparse.ArgumentParser("CFR example in RLCard")
+    parser.add_argument('--env', type=str, default='leduc-holdem')
+    parser.add_argument('--algorithm', type=str, default='chance', choices=['chance', 'external', 'outcome'])
+    parser.add_argument('--report_every', type=int, default=100)
     parser.add_argument('--seed', type=int, default=42)
     parser.add_argument('--num_episodes', type=int, default=5000)
     parser.add_argument('--num_eval_games', type=int, default=2000)
@@ -21,7 +21,8 @@ def train(args):
                          save_interval=args.save_interval,
                          num_actor_devices=args.num_actor_devices,
                          num_actors=args.num_actors,
-                         training_device=args.training_device)
+                         training_device=args.training_device,
+                         actor_device_cpu=args.actor_device_cpu)
 
     # Train DMC Agents
     trainer.start()
@@ -43,8 +44,10 @@ if __name__ == '__main__':
                         help='The number of devices used for simulation')
     parser.add_argument('--num_actors', default=5, type=int,
                         help='The number of actors for each simulation device')
-    parser.add_argument('--training_device', default=0, type=int,
-                        help='The index of the GPU used for training models')
+    parser.add_argument('--training_device', default='0', type=str,
+                        help='The index of the GPU used for training models, or `cpu`')
+    parser.add_argument('--actor_device_cpu', action='store_true',
+                        help='Run the actors on the CPU, pinned to one core each')
 
     args = parser.parse_args()
 
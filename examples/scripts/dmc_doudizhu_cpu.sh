@@ -0,0 +1 @@
+python3 examples/run_dmc.py --actor_device_cpu --training_device cpu --num_actors 8 --save_interval 30
@@ -1,18 +1,32 @@
-import subprocess
-import sys
-from distutils.version import LooseVersion
-
-reqs = subprocess.check_output([sys.executable, '-m', 'pip', 'freeze'])
-installed_packages = [r.decode().split('==')[0] for r in reqs.split()]
-
-if 'torch' in installed_packages:
-    from rlcard.agents.dqn_agent import DQNAgent as DQNAgent
-    from rlcard.agents.nfsp_agent import NFSPAgent as NFSPAgent
+import importlib
 
 from rlcard.agents.cfr_agent import CFRAgent
+from rlcard.agents.mccfr_agent import ExternalSamplingCFRAgent, OutcomeSamplingCFRAgent
 from rlcard.agents.human_agents.limit_holdem_human_agent import HumanAgent as LimitholdemHumanAgent
 from rlcard.agents.human_agents.nolimit_holdem_human_agent import HumanAgent as NolimitholdemHumanAgent
 from rlcard.agents.human_agents.leduc_holdem_human_agent import HumanAgent as LeducholdemHumanAgent
 from rlcard.agents.human_agents.blackjack_human_agent import HumanAgent as BlackjackHumanAgent
 from rlcard.agents.human_agents.uno_human_agent import HumanAgent as UnoHumanAgent
 from rlcard.agents.random_agent import RandomAgent
+from rlcard.utils.utils import is_installed
+
+# The agents that depend on torch are only imported when they are used
+_TORCH_AGENTS = {
+    'DQNAgent': 'rlcard.agents.dqn_agent',
+    'NFSPAgent': 'rlcard.agents.nfsp_agent',
+}
+
+def __getattr__(name):
+    if name in _TORCH_AGENTS:
+        if not is_installed('torch'):
+            raise ImportError("{} requires the optional dependency torch, "
+                              "install it with `pip install rlcard[torch]`".format(name))
+        agent = getattr(importlib.import_module(_TORCH_AGENTS[name]), name)
+        globals()[name] = agent
+        return agent
+    raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+
+def __dir__():
+    if is_installed('torch'):
+        return sorted(set(globals()) | set(_TORCH_AGENTS))
+    return sorted(globals())
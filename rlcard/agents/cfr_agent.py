@@ -1,5 +1,4 @@
 import numpy as np
-import collections
 
 import os
 import pickle
@@ -20,15 +19,30 @@ class CFRAgent():
         self.env = env
         self.model_path = model_path
 
-        # A policy is a dict state_str -> action probabilities
-        self.policy = collections.defaultdict(list)
-        self.average_policy = collections.defaultdict(np.array)
-
-        # Regret is a dict state_str -> action regrets
-        self.regrets = collections.defaultdict(np.array)
+        # The policy, the average policy and the regrets are rows
+        # of an array indexed by infoset id
+        self.table = InfosetTable(self.env.num_actions)
 
         self.iteration = 0
 
+    @property
+    def policy(self):
+        ''' (numpy.array): The current policy, (num_infosets, num_actions)
+        '''
+        return self.table.policy[:len(self.table)]
+
+    @property
+    def average_policy(self):
+        ''' (numpy.array): The unnormalized average policy, (num_infosets, num_actions)
+        '''
+        return self.table.average_policy[:len(self.table)]
+
+    @property
+    def regrets(self):
+        ''' (numpy.array): The cumulative regrets, (num_infosets, num_actions)
+        '''
+        return self.table.regrets[:len(self.table)]
+
     def train(self):
         ''' Do one iteration of CFR
         '''
@@ -58,10 +72,11 @@ class CFRAgent():
 
         current_player = self.env.get_player_id()
 
-        action_utilities = {}
+        action_utilities = []
         state_utility = np.zeros(self.env.num_players)
         obs, legal_actions = self.get_state(current_player)
-        action_probs = self.action_probs(obs, legal_actions, self.policy)
+        infoset = self.table.intern(obs)
+        action_probs = remove_illegal(self.table.policy[infoset], legal_actions)
 
         for action in legal_actions:
             action_prob = action_probs[action]
@@ -74,7 +89,7 @@ class CFRAgent():
             self.env.step_back()
 
             state_utility += action_prob * utility
-            action_utilities[action] = utility
+            action_utilities.append(utility[current_player])
 
         if not current_player == player_id:
             return state_utility
@@ -85,61 +100,34 @@ class CFRAgent():
                                 np.prod(probs[current_player + 1:]))
         player_state_utility = state_utility[current_player]
 
-        if obs not in self.regrets:
-            self.regrets[obs] = np.zeros(self.env.num_actions)
-        if obs not in self.average_policy:
-            self.average_policy[obs] = np.zeros(self.env.num_actions)
-        for action in legal_actions:
-            action_prob = action_probs[action]
-            regret = counterfactual_prob * (action_utilities[action][current_player]
-                    - player_state_utility)
-            self.regrets[obs][action] += regret
-            self.average_policy[obs][action] += self.iteration * player_prob * action_prob
+        self.table.regrets[infoset, legal_actions] += counterfactual_prob * \
+            (np.array(action_utilities) - player_state_utility)
+        self.table.average_policy[infoset, legal_actions] += self.iteration * player_prob * \
+            action_probs[legal_actions]
         return state_utility
 
     def update_policy(self):
         ''' Update policy based on the current regrets
         '''
-        for obs in self.regrets:
-            self.policy[obs] = self.regret_matching(obs)
-
-    def regret_matching(self, obs):
-        ''' Apply regret matching
-
-        Args:
-            obs (string): The state_str
-        '''
-        regret = self.regrets[obs]
-        positive_regret_sum = sum([r for r in regret if r > 0])
-
-        action_probs = np.zeros(self.env.num_actions)
-        if positive_regret_sum > 0:
-            for action in range(self.env.num_actions):
-                action_probs[action] = max(0.0, regret[action] / positive_regret_sum)
-        else:
-            for action in range(self.env.num_actions):
-                action_probs[action] = 1.0 / self.env.num_actions
-        return action_probs
+        n = len(self.table)
+        self.table.policy[:n] = regret_matching(self.table.regrets[:n])
 
     def action_probs(self, obs, legal_actions, policy):
         ''' Obtain the action probabilities of the current state
 
         Args:
-            obs (str): state_str
+            obs (bytes): state_str
             legal_actions (list): List of leagel actions
-            player_id (int): The current player
-            policy (dict): The used policy
+            policy (numpy.array): The used policy, e.g., `self.table.policy`
 
         Returns:
-            (tuple) that contains:
-                action_probs(numpy.array): The action probabilities
-                legal_actions (list): Indices of legal actions
+            action_probs(numpy.array): The action probabilities
         '''
-        if obs not in policy.keys():
-            action_probs = np.array([1.0/self.env.num_actions for _ in range(self.env.num_actions)])
-            self.policy[obs] = action_probs
+        infoset = self.table.lookup(obs)
+        if infoset is None:
+            action_probs = np.ones(self.env.num_actions) / self.env.num_actions
         else:
-            action_probs = policy[obs]
+            action_probs = policy[infoset]
         action_probs = remove_illegal(action_probs, legal_actions)
         return action_probs
 
@@ -153,7 +141,7 @@ class CFRAgent():
             action (int): Predicted action
             info (dict): A dictionary containing information
         '''
-        probs = self.action_probs(state['obs'].tostring(), list(state['legal_actions'].keys()), self.average_policy)
+        probs = self.action_probs(state['obs'].tobytes(), list(state['legal_actions'].keys()), self.table.average_policy)
         action = np.random.choice(len(probs), p=probs)
 
         info = {}
@@ -169,53 +157,250 @@ class CFRAgent():
 
         Returns:
             (tuple) that contains:
-                state (str): The state str
+                state (bytes): The state str
                 legal_actions (list): Indices of legal actions
         '''
         state = self.env.get_state(player_id)
-        return state['obs'].tostring(), list(state['legal_actions'].keys())
+        return state['obs'].tobytes(), list(state['legal_actions'].keys())
 
     def save(self):
         ''' Save model
+
+        The infoset keys are sorted and saved in `keys.npy`. The normalized
+        average policy is saved as a float32 table in `average_policy.npy`
+        with the same row order, so that it can be memory-mapped for
+        evaluation. The float64 tables needed to resume training are saved
+        in `tables.npz`.
         '''
         if not os.path.exists(self.model_path):
             os.makedirs(self.model_path)
 
-        policy_file = open(os.path.join(self.model_path, 'policy.pkl'),'wb')
-        pickle.dump(self.policy, policy_file)
-        policy_file.close()
+        n = len(self.table)
+        keys = np.array(self.table.keys, dtype=np.bytes_) if n > 0 else np.array([], dtype='S1')
+        order = np.argsort(keys, kind='stable')
+        np.save(os.path.join(self.model_path, 'keys.npy'), keys[order])
 
-        average_policy_file = open(os.path.join(self.model_path, 'average_policy.pkl'),'wb')
-        pickle.dump(self.average_policy, average_policy_file)
-        average_policy_file.close()
+        average_policy = self.table.average_policy[:n][order]
+        sums = average_policy.sum(axis=1, keepdims=True)
+        average_policy = np.divide(average_policy, sums, out=np.zeros_like(average_policy), where=sums > 0)
+        np.save(os.path.join(self.model_path, 'average_policy.npy'), average_policy.astype(np.float32))
 
-        regrets_file = open(os.path.join(self.model_path, 'regrets.pkl'),'wb')
-        pickle.dump(self.regrets, regrets_file)
-        regrets_file.close()
+        np.savez(os.path.join(self.model_path, 'tables.npz'),
+                 policy=self.table.policy[:n][order],
+                 average_policy=self.table.average_policy[:n][order],
+                 regrets=self.table.regrets[:n][order],
+                 iteration=self.iteration)
 
-        iteration_file = open(os.path.join(self.model_path, 'iteration.pkl'),'wb')
-        pickle.dump(self.iteration, iteration_file)
-        iteration_file.close()
-
-    def load(self):
+    def load(self, policy_only=False):
         ''' Load model
+
+        Args:
+            policy_only (boolean): If True, only the average policy is loaded
+                as a read-only memory-mapped table. It is enough for `eval_step`,
+                but the agent can not be trained any more.
         '''
         if not os.path.exists(self.model_path):
             return
 
+        if not os.path.exists(os.path.join(self.model_path, 'keys.npy')):
+            self._load_pickles()
+            return
+
+        if policy_only:
+            self.table = PolicyTable(self.model_path)
+            return
+
+        keys = np.load(os.path.join(self.model_path, 'keys.npy'))
+        tables = np.load(os.path.join(self.model_path, 'tables.npz'))
+        self.iteration = int(tables['iteration'])
+        self.table = InfosetTable.from_arrays(self.env.num_actions, keys, tables['policy'],
+                                              tables['average_policy'], tables['regrets'])
+
+    def _load_pickles(self):
+        ''' Load model saved as pickled dictionaries by the previous versions
+        '''
         policy_file = open(os.path.join(self.model_path, 'policy.pkl'),'rb')
-        self.policy = pickle.load(policy_file)
+        policy = pickle.load(policy_file)
         policy_file.close()
 
         average_policy_file = open(os.path.join(self.model_path, 'average_policy.pkl'),'rb')
-        self.average_policy = pickle.load(average_policy_file)
+        average_policy = pickle.load(average_policy_file)
         average_policy_file.close()
 
         regrets_file = open(os.path.join(self.model_path, 'regrets.pkl'),'rb')
-        self.regrets = pickle.load(regrets_file)
+        regrets = pickle.load(regrets_file)
         regrets_file.close()
 
         iteration_file = open(os.path.join(self.model_path, 'iteration.pkl'),'rb')
         self.iteration = pickle.load(iteration_file)
         iteration_file.close()
 
+        self.table = InfosetTable.from_dicts(self.env.num_actions, policy, average_policy, regrets)
+
+def regret_matching(regrets):
+    ''' Apply regret matching to a batch of infosets
+
+    Args:
+        regrets (numpy.array): The regrets, (num_infosets, num_actions)
+
+    Returns:
+        (numpy.array): The action probabilities, (num_infosets, num_actions).
+            Uniform for the infosets without positive regret
+    '''
+    positive_regrets = np.maximum(regrets, 0)
+    positive_regret_sums = positive_regrets.sum(axis=1, keepdims=True)
+    has_positive = positive_regret_sums > 0
+    return np.where(has_positive,
+                    positive_regrets / np.where(has_positive, positive_regret_sums, 1),
+                    1.0 / regrets.shape[1])
+
+class InfosetTable(object):
+    ''' Intern infoset keys to dense integer ids, and keep the policy,
+        the average policy (strategy sums) and the regrets of all the
+        infosets in contiguous 2-D arrays that grow in chunks
+    '''
+
+    def __init__(self, num_actions, chunk_size=4096):
+        ''' Initialize an empty table
+
+        Args:
+            num_actions (int): The size of the action space
+            chunk_size (int): The minimum number of rows added when the table grows
+        '''
+        self.num_actions = num_actions
+        self.chunk_size = chunk_size
+        self.index = {}
+        self.keys = []
+        self.policy = np.zeros((0, num_actions))
+        self.average_policy = np.zeros((0, num_actions))
+        self.regrets = np.zeros((0, num_actions))
+
+    def __len__(self):
+        return len(self.keys)
+
+    def lookup(self, key):
+        ''' Get the id of an infoset
+
+        Args:
+            key (bytes): The infoset key
+
+        Returns:
+            (int): The id of the infoset, None if it has never been interned
+        '''
+        return self.index.get(key)
+
+    def intern(self, key):
+        ''' Get the id of an infoset, adding a row with a uniform policy
+            and zero regrets if it is new
+
+        Args:
+            key (bytes): The infoset key
+
+        Returns:
+            (int): The id of the infoset
+        '''
+        infoset = self.index.get(key)
+        if infoset is None:
+            infoset = len(self.keys)
+            if infoset == self.policy.shape[0]:
+                self._grow()
+            self.index[key] = infoset
+            self.keys.append(key)
+            self.policy[infoset] = 1.0 / self.num_actions
+        return infoset
+
+    def _grow(self):
+        ''' Add at least `chunk_size` rows to the arrays
+        '''
+        capacity = self.policy.shape[0]
+        rows = max(self.chunk_size, capacity // 2)
+        for name in ('policy', 'average_policy', 'regrets'):
+            array = getattr(self, name)
+            setattr(self, name, np.concatenate((array, np.zeros((rows, self.num_actions)))))
+
+    @classmethod
+    def from_dicts(cls, num_actions, policy, average_policy, regrets):
+        ''' Build a table from dictionaries keyed by infoset key
+
+        Args:
+            num_actions (int): The size of the action space
+            policy (dict): infoset key -> action probabilities
+            average_policy (dict): infoset key -> strategy sums
+            regrets (dict): infoset key -> regrets
+
+        Returns:
+            (InfosetTable): The table
+        '''
+        table = cls(num_actions)
+        for key in list(regrets) + list(policy) + list(average_policy):
+            table.intern(key)
+        for key, row in policy.items():
+            table.policy[table.index[key]] = row
+        for key, row in average_policy.items():
+            table.average_policy[table.index[key]] = row
+        for key, row in regrets.items():
+            table.regrets[table.index[key]] = row
+        return table
+
+    @classmethod
+    def from_arrays(cls, num_actions, keys, policy, average_policy, regrets):
+        ''' Build a table from the arrays of a checkpoint
+
+        Args:
+            num_actions (int): The size of the action space
+            keys (numpy.array): The infoset keys, a bytes array
+            policy (numpy.array): The policy, (num_infosets, num_actions)
+            average_policy (numpy.array): The strategy sums, (num_infosets, num_actions)
+            regrets (numpy.array): The regrets, (num_infosets, num_actions)
+
+        Returns:
+            (InfosetTable): The table
+        '''
+        table = cls(num_actions)
+        n = len(keys)
+        # numpy strips the trailing zero bytes of the keys
+        table.keys = [bytes(key).ljust(keys.dtype.itemsize, b'\0') for key in keys]
+        table.index = {key: infoset for infoset, key in enumerate(table.keys)}
+        table.policy = np.array(policy, dtype=np.float64).reshape(n, num_actions)
+        table.average_policy = np.array(average_policy, dtype=np.float64).reshape(n, num_actions)
+        table.regrets = np.array(regrets, dtype=np.float64).reshape(n, num_actions)
+        return table
+
+class PolicyTable(object):
+    ''' A read-only average policy memory-mapped from a checkpoint saved
+        by `CFRAgent.save`. Infosets are looked up by binary search in the
+        sorted keys, so nothing but the touched pages is read from disk,
+        and the pages are shared by all the processes that load it.
+
+    Note: All the keys of a checkpoint should have the same length, which
+          is the case for the `obs` bytes of an environment.
+    '''
+
+    def __init__(self, model_path):
+        ''' Memory-map the checkpoint
+
+        Args:
+            model_path (str): The directory of the checkpoint
+        '''
+        self.keys = np.load(os.path.join(model_path, 'keys.npy'), mmap_mode='r')
+        self.average_policy = np.load(os.path.join(model_path, 'average_policy.npy'), mmap_mode='r')
+
+    def __len__(self):
+        return len(self.keys)
+
+    def lookup(self, key):
+        ''' Get the row of an infoset
+
+        Args:
+            key (bytes): The infoset key
+
+        Returns:
+            (int): The row of the infoset, None if it is not in the checkpoint
+        '''
+        if len(key) > self.keys.dtype.itemsize:
+            return None
+        key = np.array(key, dtype=self.keys.dtype)
+        infoset = int(np.searchsorted(self.keys, key))
+        if infoset < len(self.keys) and self.keys[infoset] == key:
+            return infoset
+        return None
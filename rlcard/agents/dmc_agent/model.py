@@ -13,11 +13,15 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import itertools
+
 import numpy as np
 
 import torch
 from torch import nn
 
+from .utils import get_torch_device
+
 class DMCNet(nn.Module):
     def __init__(self,
                  state_shape,
@@ -40,6 +44,30 @@ class DMCNet(nn.Module):
         values = self.fc_layers(x).flatten()
         return values
 
+    def forward_actions(self, obs, actions):
+        ''' Score a batch of actions for a single observation. The first
+            layer is split into an obs part, which is computed only once,
+            and an action part. This is equivalent to repeating the obs
+            for each action and calling `forward`.
+
+        Args:
+            obs (torch.Tensor): The observation, (1, obs_dim)
+            actions (torch.Tensor): The action features, (num_actions, action_dim)
+
+        Returns:
+            (torch.Tensor): The values of the actions, (num_actions,)
+        '''
+        first_layer = self.fc_layers[0]
+        obs = torch.flatten(obs, 1)
+        actions = torch.flatten(actions, 1)
+        # Padding the obs with zeros keeps the full contiguous weight, which
+        # is faster than multiplying by a slice of it
+        obs_part = first_layer(torch.cat((obs, obs.new_zeros((1, actions.shape[1]))), dim=1))
+        x = torch.addmm(obs_part, actions, first_layer.weight[:, obs.shape[1]:].t())
+        for layer in itertools.islice(self.fc_layers, 1, None):
+            x = layer(x)
+        return x.flatten()
+
 class DMCAgent:
     def __init__(self,
                  state_shape,
@@ -48,10 +76,12 @@ class DMCAgent:
                  exp_epsilon=0.01,
                  device=0):
         self.use_raw = False
-        self.device = torch.device('cuda:'+str(device))
+        self.device = get_torch_device(device)
         self.net = DMCNet(state_shape, action_shape, mlp_layers).to(self.device)
         self.exp_epsilon = exp_epsilon
         self.action_shape = action_shape
+        # Preallocated action features, grown when there are more legal actions
+        self.action_buffer = None
 
     def step(self, state):
         action_keys, values = self.predict(state)
@@ -88,22 +118,40 @@ class DMCAgent:
         # Prepare obs and actions
         obs = state['obs'].astype(np.float32)
         legal_actions = state['legal_actions']
-        action_keys = np.array(list(legal_actions.keys()))
-        action_values = list(legal_actions.values())
-        # One-hot encoding if there is no action features
-        for i in range(len(action_values)):
-            if action_values[i] is None:
-                action_values[i] = np.zeros(self.action_shape[0])
-                action_values[i][action_keys[i]] = 1
-        action_values = np.array(action_values, dtype=np.float32)
-
-        obs = np.repeat(obs[np.newaxis, :], len(action_keys), axis=0)
+        action_keys = np.fromiter(legal_actions.keys(), dtype=np.int64, count=len(legal_actions))
+        action_values = self._get_action_features(action_keys, legal_actions.values())
 
         # Predict Q values
-        values = self.net.forward(torch.from_numpy(obs).to(self.device),
-                                  torch.from_numpy(action_values).to(self.device))
-
-        return action_keys, values.cpu().detach().numpy()
+        with torch.no_grad():
+            values = self.net.forward_actions(torch.from_numpy(obs[np.newaxis, :]).to(self.device),
+                                              torch.from_numpy(action_values).to(self.device))
+
+        return action_keys, values.cpu().numpy()
+
+    def _get_action_features(self, action_keys, features):
+        ''' Fill the action buffer with the features of the legal actions
+
+        Args:
+            action_keys (numpy.array): The ids of the legal actions
+            features (iterable): The features of the legal actions, None for one-hot encoding
+
+        Returns:
+            (numpy.array): A view of the buffer, (num_actions, action_dim)
+        '''
+        num_actions = len(action_keys)
+        # The agents saved by the previous versions have no buffer
+        capacity = 0 if getattr(self, 'action_buffer', None) is None else self.action_buffer.shape[0]
+        if num_actions > capacity:
+            self.action_buffer = np.zeros((max(num_actions, 2 * capacity), int(np.prod(self.action_shape))), dtype=np.float32)
+        action_values = self.action_buffer[:num_actions]
+        features = list(features)
+        # One-hot encoding if there is no action features
+        if features[0] is None:
+            action_values.fill(0)
+            action_values[np.arange(num_actions), action_keys] = 1
+        else:
+            np.stack(features, out=action_values)
+        return action_values
 
     def forward(self, obs, actions):
         return self.net.forward(obs, actions)
@@ -26,7 +26,7 @@ from torch import nn
 
 from .file_writer import FileWriter
 from .model import DMCModel
-from .utils import get_batch, create_buffers, create_optimizers, act, log
+from .utils import get_batch, create_buffers, create_optimizers, act, log, get_torch_device, get_num_cores
 
 def compute_loss(logits, targets):
     loss = ((logits - targets)**2).mean()
@@ -42,7 +42,7 @@ def learn(position,
           mean_episode_return_buf,
           lock):
     """Performs a learning (optimization) step."""
-    device = torch.device('cuda:'+str(training_device))
+    device = get_torch_device(training_device)
     state = torch.flatten(batch['state'].to(device), 0, 1).float()
     action = torch.flatten(batch['action'].to(device), 0, 1).float()
     target = torch.flatten(batch['target'].to(device), 0, 1)
@@ -62,7 +62,7 @@ def learn(position,
         nn.utils.clip_grad_norm_(agent.parameters(), max_grad_norm)
         optimizer.step()
 
-        for actor_model in actor_models:
+        for actor_model in actor_models.values():
             actor_model.get_agent(position).load_state_dict(agent.state_dict())
         return stats
 
@@ -76,6 +76,7 @@ class DMCTrainer:
                  num_actor_devices=1,
                  num_actors = 5,
                  training_device=0,
+                 actor_device_cpu=False,
                  savedir='experiments/dmc_result',
                  total_frames=100000000000,
                  exp_epsilon=0.01,
@@ -98,7 +99,10 @@ class DMCTrainer:
             save_interval (int): Time interval (in minutes) at which to save the model
             num_actor_devices (int): The number devices used for simulation
             num_actors (int): Number of actors for each simulation device
-            training_device (int): The index of the GPU used for training models
+            training_device (int or str): The index of the GPU used for training models,
+                or 'cpu' to train on the CPU
+            actor_device_cpu (boolean): Whether running the actors on the CPU. The
+                actors are pinned to one core each
             savedir (string): Root dir where experiment data will be saved
             total_frames (int): Total environment frames to train for
             exp_epsilon (float): The prbability for exploration
@@ -132,6 +136,7 @@ class DMCTrainer:
         self.num_actor_devices = num_actor_devices
         self.num_actors = num_actors
         self.training_device = training_device
+        self.actor_device_cpu = actor_device_cpu
         self.total_frames = total_frames
         self.exp_epsilon = exp_epsilon
         self.num_buffers = num_buffers
@@ -149,33 +154,50 @@ class DMCTrainer:
         self.mean_episode_return_buf = [deque(maxlen=100) for _ in range(self.env.num_players)]
 
     def start(self):
+        if not self.actor_device_cpu or self.training_device != 'cpu':
+            if not torch.cuda.is_available():
+                raise AssertionError('CUDA is not available. Please train on the CPU with '
+                                     '`actor_device_cpu=True` and `training_device=\'cpu\'`')
+
+        if self.actor_device_cpu:
+            device_iterator = ['cpu']
+        else:
+            device_iterator = range(self.num_actor_devices)
+
+        if self.training_device == 'cpu':
+            # The actors are pinned to the first cores, use the others for learning
+            num_learner_cores = max(1, get_num_cores() - (self.num_actors if self.actor_device_cpu else 0))
+            torch.set_num_threads(num_learner_cores)
+            log.info('Learning on the CPU with %i threads', num_learner_cores)
+
         # Initialize actor models
-        models = []
-        for device in range(self.num_actor_devices):
+        models = {}
+        for device in device_iterator:
             model = DMCModel(self.env.state_shape,
                              self.action_shape,
                              exp_epsilon=self.exp_epsilon,
                              device=device)
             model.share_memory()
             model.eval()
-            models.append(model)
+            models[device] = model
 
         # Initialize buffers
         buffers = create_buffers(self.T,
                                  self.num_buffers,
                                  self.env.state_shape,
-                                 self.action_shape)
+                                 self.action_shape,
+                                 device_iterator)
 
         # Initialize queues
         actor_processes = []
         ctx = mp.get_context('spawn')
-        free_queue = []
-        full_queue = []
-        for device in range(self.num_actor_devices):
+        free_queue = {}
+        full_queue = {}
+        for device in device_iterator:
             _free_queue = [ctx.SimpleQueue() for _ in range(self.env.num_players)]
             _full_queue = [ctx.SimpleQueue() for _ in range(self.env.num_players)]
-            free_queue.append(_free_queue)
-            full_queue.append(_full_queue)
+            free_queue[device] = _free_queue
+            full_queue[device] = _full_queue
 
         # Learner model for training
         learner_model = DMCModel(self.env.state_shape,
@@ -200,12 +222,12 @@ class DMCTrainer:
         # Load models if any
         if self.load_model and os.path.exists(self.checkpointpath):
             checkpoint_states = torch.load(
-                    self.checkpointpath, map_location="cuda:"+str(self.training_device)
+                    self.checkpointpath, map_location=get_torch_device(self.training_device)
             )
             for p in range(self.env.num_players):
                 learner_model.get_agent(p).load_state_dict(checkpoint_states["model_state_dict"][p])
                 optimizers[p].load_state_dict(checkpoint_states["optimizer_state_dict"][p])
-                for device in range(self.num_actor_devices):
+                for device in device_iterator:
                     models[device].get_agent(p).load_state_dict(learner_model.get_agent(p).state_dict())
             stats = checkpoint_states["stats"]
             frames = checkpoint_states["frames"]
@@ -213,7 +235,7 @@ class DMCTrainer:
 
 
         # Starting actor processes
-        for device in range(self.num_actor_devices):
+        for device in device_iterator:
             num_actors = self.num_actors
             for i in range(self.num_actors):
                 actor = ctx.Process(
@@ -238,16 +260,16 @@ class DMCTrainer:
                     self.plogger.log(to_log)
                     frames += self.T * self.B
 
-        for device in range(self.num_actor_devices):
+        for device in device_iterator:
             for m in range(self.num_buffers):
                 for p in range(self.env.num_players):
                     free_queue[device][p].put(m)
 
         threads = []
-        locks = [[threading.Lock() for _ in range(self.env.num_players)] for _ in range(self.num_actor_devices)]
+        locks = {device: [threading.Lock() for _ in range(self.env.num_players)] for device in device_iterator}
         position_locks = [threading.Lock() for _ in range(self.env.num_players)]
 
-        for device in range(self.num_actor_devices):
+        for device in device_iterator:
             for i in range(self.num_threads):
                 for position in range(self.env.num_players):
                     thread = threading.Thread(
@@ -297,4 +319,4 @@ class DMCTrainer:
             log.info('Learning finished after %d frames.', frames)
 
         checkpoint(frames)
-        plogger.close()
+        self.plogger.close()
@@ -14,6 +14,7 @@
 # limitations under the License.
 
 import logging
+import os
 import traceback
 
 import numpy as np
@@ -29,6 +30,36 @@ log.propagate = False
 log.addHandler(shandle)
 log.setLevel(logging.INFO)
 
+def get_torch_device(device):
+    ''' Get the torch device of a device id
+
+    Args:
+        device (int or str): The index of a GPU, or 'cpu'
+
+    Returns:
+        (torch.device): The torch device
+    '''
+    if device == 'cpu':
+        return torch.device('cpu')
+    return torch.device('cuda:'+str(device))
+
+def get_num_cores():
+    ''' Get the number of CPU cores that this process can run on
+    '''
+    if hasattr(os, 'sched_getaffinity'):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count()
+
+def pin_to_core(i):
+    ''' Pin the current process to a CPU core, if the platform supports it
+
+    Args:
+        i (int): The index of the core. It wraps around the available cores
+    '''
+    if hasattr(os, 'sched_setaffinity'):
+        cores = sorted(os.sched_getaffinity(0))
+        os.sched_setaffinity(0, {cores[i % len(cores)]})
+
 def get_batch(free_queue,
               full_queue,
               buffers,
@@ -44,10 +75,10 @@ def get_batch(free_queue,
         free_queue.put(m)
     return batch
 
-def create_buffers(T, num_buffers, state_shape, action_shape):
-    buffers = []
-    for device in range(torch.cuda.device_count()):
-        buffers.append([])
+def create_buffers(T, num_buffers, state_shape, action_shape, device_iterator):
+    buffers = {}
+    for device in device_iterator:
+        buffers[device] = []
         for player_id in range(len(state_shape)):
             specs = dict(
                 done=dict(size=(T,), dtype=torch.bool),
@@ -59,7 +90,7 @@ def create_buffers(T, num_buffers, state_shape, action_shape):
             _buffers: Buffers = {key: [] for key in specs}
             for _ in range(num_buffers):
                 for key in _buffers:
-                    _buffer = torch.empty(**specs[key]).to(torch.device('cuda:'+str(device))).share_memory_()
+                    _buffer = torch.empty(**specs[key]).to(get_torch_device(device)).share_memory_()
                     _buffers[key].append(_buffer)
             buffers[device].append(_buffers)
     return buffers
@@ -78,8 +109,11 @@ def create_optimizers(num_players, learning_rate, momentum, epsilon, alpha, lear
 
 def act(i, device, T, free_queue, full_queue, model, buffers, env):
     try:
-        log.info('Device %i Actor %i started.', device, i)
-        torch_device = torch.device('cuda:'+str(device))
+        log.info('Device %s Actor %i started.', str(device), i)
+        if device == 'cpu':
+            # One actor per core, each running single-threaded inference
+            pin_to_core(i)
+            torch.set_num_threads(1)
 
         # Configure environment
         env.seed(i)
@@ -108,7 +142,7 @@ def act(i, device, T, free_queue, full_queue, model, buffers, env):
                         state = trajectories[p][i]['obs']
                         action = env.get_action_feature(trajectories[p][i+1])
                         state_buf[p].append(torch.from_numpy(state))
-                        action_buf[p].append(torch.from_numpy(action))
+                        action_buf[p].append(torch.tensor(action))
                 
                 while size[p] > T:
                     index = free_queue[p].get()
@@ -25,14 +25,13 @@ OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 SOFTWARE.
 '''
 
-import random
 import numpy as np
 import torch
 import torch.nn as nn
 from collections import namedtuple
 from copy import deepcopy
 
-from rlcard.utils.utils import remove_illegal
+from rlcard.utils.utils import get_legal_actions_mask
 
 Transition = namedtuple('Transition', ['state', 'action', 'reward', 'next_state', 'legal_actions', 'done'])
 
@@ -56,7 +55,11 @@ class DQNAgent(object):
                  train_every=1,
                  mlp_layers=None,
                  learning_rate=0.00005,
-                 device=None):
+                 device=None,
+                 prioritized_replay=False,
+                 priority_alpha=0.6,
+                 priority_beta_start=0.4,
+                 priority_beta_steps=20000):
 
         '''
         Q-Learning algorithm for off-policy TD control using Function Approximation.
@@ -81,6 +84,13 @@ class DQNAgent(object):
             mlp_layers (list): The layer number and the dimension of each layer in MLP
             learning_rate (float): The learning rate of the DQN agent.
             device (torch.device): whether to use the cpu or gpu
+            prioritized_replay (bool): Sample the transitions in proportion to their TD errors
+              instead of uniformly
+            priority_alpha (float): How much the TD errors are used in the priorities,
+              0 being uniform sampling
+            priority_beta_start (float): The start value of the exponent of the importance
+              sampling weights. It is annealed to 1 over the training steps
+            priority_beta_steps (int): Number of training steps to anneal the exponent over
         '''
         self.use_raw = False
         self.replay_memory_init_size = replay_memory_init_size
@@ -90,6 +100,7 @@ class DQNAgent(object):
         self.batch_size = batch_size
         self.num_actions = num_actions
         self.train_every = train_every
+        self.prioritized_replay = prioritized_replay
 
         # Torch device
         if device is None:
@@ -112,8 +123,14 @@ class DQNAgent(object):
         self.target_estimator = Estimator(num_actions=num_actions, learning_rate=learning_rate, state_shape=state_shape, \
             mlp_layers=mlp_layers, device=self.device)
 
+        # The importance sampling exponent scheduler
+        self.priority_betas = np.linspace(priority_beta_start, 1.0, priority_beta_steps)
+
         # Create replay memory
-        self.memory = Memory(replay_memory_size, batch_size)
+        if prioritized_replay:
+            self.memory = PrioritizedMemory(replay_memory_size, batch_size, num_actions, priority_alpha)
+        else:
+            self.memory = Memory(replay_memory_size, batch_size, num_actions)
 
     def feed(self, ts):
         ''' Store data in to replay buffer and train the agent. There are two stages.
@@ -124,7 +141,7 @@ class DQNAgent(object):
             ts (list): a list of 5 elements that represent the transition
         '''
         (state, action, reward, next_state, done) = tuple(ts)
-        self.feed_memory(state['obs'], action, reward, next_state['obs'], list(next_state['legal_actions'].keys()), done)
+        self.feed_memory(state['obs'], action, reward, next_state['obs'], get_legal_actions_mask(next_state, self.num_actions), done)
         self.total_t += 1
         tmp = self.total_t - self.replay_memory_init_size
         if tmp>=0 and tmp%self.train_every == 0:
@@ -140,15 +157,11 @@ class DQNAgent(object):
         Returns:
             action (int): an action id
         '''
-        q_values = self.predict(state)
         epsilon = self.epsilons[min(self.total_t, self.epsilon_decay_steps-1)]
-        legal_actions = list(state['legal_actions'].keys())
-        probs = np.ones(len(legal_actions), dtype=float) * epsilon / len(legal_actions)
-        best_action_idx = legal_actions.index(np.argmax(q_values))
-        probs[best_action_idx] += (1.0 - epsilon)
-        action_idx = np.random.choice(np.arange(len(probs)), p=probs)
+        if np.random.rand() < epsilon:
+            return np.random.choice(np.flatnonzero(get_legal_actions_mask(state, self.num_actions)))
 
-        return legal_actions[action_idx]
+        return np.argmax(self.predict(state))
 
     def eval_step(self, state):
         ''' Predict the action for evaluation purpose.
@@ -168,6 +181,54 @@ class DQNAgent(object):
 
         return best_action, info
 
+    def step_batch(self, batch):
+        ''' Predict the actions of a batch of states, e.g., stacked by `VectorEnv`,
+            with epsilon-greedy exploration
+
+        Args:
+            batch (dict): A dictionary with the stacked 'obs' and the boolean legal action mask in 'legal_actions'
+
+        Returns:
+            actions (list): The action ids
+        '''
+        q_values = self.predict_batch(batch)
+        epsilon = self.epsilons[min(self.total_t, self.epsilon_decay_steps-1)]
+        actions = np.argmax(q_values, axis=1)
+        explore = np.flatnonzero(np.random.rand(len(actions)) < epsilon)
+        for i in explore:
+            actions[i] = np.random.choice(np.flatnonzero(batch['legal_actions'][i]))
+
+        return list(actions)
+
+    def eval_step_batch(self, batch):
+        ''' Predict the actions of a batch of states for evaluation purpose.
+            All the states are evaluated in one forward pass.
+
+        Args:
+            batch (dict): A dictionary with the stacked 'obs' and the boolean legal action mask in 'legal_actions'
+
+        Returns:
+            actions (list): The action ids
+            info (dict): A dictionary containing the masked Q values
+        '''
+        q_values = self.predict_batch(batch)
+
+        info = {}
+        info['values'] = q_values
+
+        return list(np.argmax(q_values, axis=1)), info
+
+    def predict_batch(self, batch):
+        ''' Predict the masked Q-values of a batch of states
+
+        Args:
+            batch (dict): A dictionary with the stacked 'obs' and the boolean legal action mask in 'legal_actions'
+
+        Returns:
+            q_values (numpy.array): a 2-d array of shape (batch, num_actions)
+        '''
+        return self.q_estimator.predict_nograd(batch['obs'], batch['legal_actions'])
+
     def predict(self, state):
         ''' Predict the masked Q-values
 
@@ -177,13 +238,8 @@ class DQNAgent(object):
         Returns:
             q_values (numpy.array): a 1-d array where each entry represents a Q value
         '''
-        
-        q_values = self.q_estimator.predict_nograd(np.expand_dims(state['obs'], 0))[0]
-        masked_q_values = -np.inf * np.ones(self.num_actions, dtype=float)
-        legal_actions = list(state['legal_actions'].keys())
-        masked_q_values[legal_actions] = q_values[legal_actions]
-
-        return masked_q_values
+        mask = get_legal_actions_mask(state, self.num_actions)
+        return self.q_estimator.predict_nograd(np.expand_dims(state['obs'], 0), np.expand_dims(mask, 0))[0]
 
     def train(self):
         ''' Train the network
@@ -191,27 +247,31 @@ class DQNAgent(object):
         Returns:
             loss (float): The loss of the current batch.
         '''
-        state_batch, action_batch, reward_batch, next_state_batch, legal_actions_batch, done_batch = self.memory.sample()
-
-        # Calculate best next actions using Q-network (Double DQN)
-        q_values_next = self.q_estimator.predict_nograd(next_state_batch)
-        legal_actions = []
-        for b in range(self.batch_size):
-            legal_actions.extend([i + b * self.num_actions for i in legal_actions_batch[b]])
-        masked_q_values = -np.inf * np.ones(self.num_actions * self.batch_size, dtype=float)
-        masked_q_values[legal_actions] = q_values_next.flatten()[legal_actions]
-        masked_q_values = masked_q_values.reshape((self.batch_size, self.num_actions))
-        best_actions = np.argmax(masked_q_values, axis=1)
-
-        # Evaluate best next actions using Target-network (Double DQN)
-        q_values_next_target = self.target_estimator.predict_nograd(next_state_batch)
-        target_batch = reward_batch + np.invert(done_batch).astype(np.float32) * \
-            self.discount_factor * q_values_next_target[np.arange(self.batch_size), best_actions]
+        if self.prioritized_replay:
+            beta = self.priority_betas[min(self.train_t, len(self.priority_betas)-1)]
+            state_batch, action_batch, reward_batch, next_state_batch, legal_actions_batch, done_batch, \
+                indices, weights = self.memory.sample(beta)
+        else:
+            state_batch, action_batch, reward_batch, next_state_batch, legal_actions_batch, done_batch = self.memory.sample()
+            weights = None
 
-        # Perform gradient descent update
-        state_batch = np.array(state_batch)
+        next_state_batch = torch.from_numpy(next_state_batch).float().to(self.device)
+        legal_actions_batch = torch.from_numpy(legal_actions_batch).to(self.device)
+        with torch.no_grad():
+            # Calculate best next actions using Q-network (Double DQN)
+            q_values_next = self.q_estimator.qnet(next_state_batch)
+            best_actions = mask_illegal(q_values_next, legal_actions_batch).argmax(dim=1, keepdim=True)
 
-        loss = self.q_estimator.update(state_batch, action_batch, target_batch)
+            # Evaluate best next actions using Target-network (Double DQN)
+            q_values_next_target = self.target_estimator.qnet(next_state_batch).gather(1, best_actions).squeeze(1)
+            not_done = torch.from_numpy(~done_batch).float().to(self.device)
+            target_batch = torch.from_numpy(reward_batch).to(self.device) + \
+                not_done * self.discount_factor * q_values_next_target
+
+        # Perform gradient descent update
+        loss = self.q_estimator.update(state_batch, action_batch, target_batch, weights)
+        if self.prioritized_replay:
+            self.memory.update_priorities(indices, self.q_estimator.td_errors)
         print('\rINFO - Step {}, rl-loss: {}'.format(self.total_t, loss), end='')
 
         # Update the target estimator
@@ -229,7 +289,7 @@ class DQNAgent(object):
             action (int): the performed action ID
             reward (float): the reward received
             next_state (numpy.array): the next state after performing the action
-            legal_actions (list): the legal actions of the next state
+            legal_actions (numpy.array): the boolean legal action mask of the next state
             done (boolean): whether the episode is finished
         '''
         self.memory.save(state, action, reward, next_state, legal_actions, done)
@@ -239,6 +299,18 @@ class DQNAgent(object):
         self.q_estimator.device = device
         self.target_estimator.device = device
 
+def mask_illegal(values, legal_actions_mask):
+    ''' Set the values of the illegal actions to -inf
+
+    Args:
+        values (Tensor): (batch, num_actions) action values
+        legal_actions_mask (Tensor): (batch, num_actions) boolean mask of the legal actions
+
+    Returns:
+        (Tensor): The masked values
+    '''
+    return torch.where(legal_actions_mask, values, torch.tensor(-np.inf, device=values.device))
+
 class Estimator(object):
     '''
     Approximate clone of rlcard.agents.dqn_agent.Estimator that
@@ -263,6 +335,9 @@ class Estimator(object):
         self.mlp_layers = mlp_layers
         self.device = device
 
+        # The TD errors of the last update
+        self.td_errors = None
+
         # set up Q model and place it in eval mode
         qnet = EstimatorNetwork(num_actions, state_shape, mlp_layers)
         qnet = qnet.to(self.device)
@@ -280,13 +355,15 @@ class Estimator(object):
         # set up optimizer
         self.optimizer =  torch.optim.Adam(self.qnet.parameters(), lr=self.learning_rate)
 
-    def predict_nograd(self, s):
+    def predict_nograd(self, s, legal_actions_mask=None):
         ''' Predicts action values, but prediction is not included
             in the computation graph.  It is used to predict optimal next
             actions in the Double-DQN algorithm.
 
         Args:
           s (np.ndarray): (batch, state_len)
+          legal_actions_mask (np.ndarray): (batch, num_actions) boolean mask of the legal
+            actions. The values of the illegal actions are set to -inf on the device
 
         Returns:
           np.ndarray of shape (batch_size, NUM_VALID_ACTIONS) containing the estimated
@@ -294,10 +371,13 @@ class Estimator(object):
         '''
         with torch.no_grad():
             s = torch.from_numpy(s).float().to(self.device)
-            q_as = self.qnet(s).cpu().numpy()
+            q_as = self.qnet(s)
+            if legal_actions_mask is not None:
+                q_as = mask_illegal(q_as, torch.from_numpy(legal_actions_mask).to(self.device))
+            q_as = q_as.cpu().numpy()
         return q_as
 
-    def update(self, s, a, y):
+    def update(self, s, a, y, weights=None):
         ''' Updates the estimator towards the given targets.
             In this case y is the target-network estimated
             value of the Q-network optimal actions, which
@@ -306,7 +386,9 @@ class Estimator(object):
         Args:
           s (np.ndarray): (batch, state_shape) state representation
           a (np.ndarray): (batch,) integer sampled actions
-          y (np.ndarray): (batch,) value of optimal actions according to Q-target
+          y (np.ndarray or Tensor): (batch,) value of optimal actions according to Q-target
+          weights (np.ndarray): (batch,) importance sampling weights of the squared errors,
+            None for the plain mean
 
         Returns:
           The calculated loss on the batch.
@@ -315,9 +397,9 @@ class Estimator(object):
 
         self.qnet.train()
 
-        s = torch.from_numpy(s).float().to(self.device)
-        a = torch.from_numpy(a).long().to(self.device)
-        y = torch.from_numpy(y).float().to(self.device)
+        s = torch.as_tensor(s, dtype=torch.float32, device=self.device)
+        a = torch.as_tensor(a, dtype=torch.long, device=self.device)
+        y = torch.as_tensor(y, dtype=torch.float32, device=self.device)
 
         # (batch, state_shape) -> (batch, num_actions)
         q_as = self.qnet(s)
@@ -326,10 +408,15 @@ class Estimator(object):
         Q = torch.gather(q_as, dim=-1, index=a.unsqueeze(-1)).squeeze(-1)
 
         # update model
-        batch_loss = self.mse_loss(Q, y)
+        if weights is None:
+            batch_loss = self.mse_loss(Q, y)
+        else:
+            weights = torch.from_numpy(weights).float().to(self.device)
+            batch_loss = torch.mean(weights * (Q - y) ** 2)
         batch_loss.backward()
         self.optimizer.step()
         batch_loss = batch_loss.item()
+        self.td_errors = (y - Q).detach().cpu().numpy()
 
         self.qnet.eval()
 
@@ -374,17 +461,37 @@ class EstimatorNetwork(nn.Module):
         return self.fc_layers(s)
 
 class Memory(object):
-    ''' Memory for saving transitions
+    ''' Memory for saving transitions. The transitions are stored in
+        preallocated arrays used as a circular buffer, so that the oldest
+        transition is overwritten when the memory is full, and a minibatch
+        is gathered from the arrays in one indexing. The transitions of a
+        minibatch are sampled uniformly with replacement.
     '''
 
-    def __init__(self, memory_size, batch_size):
+    def __init__(self, memory_size, batch_size, num_actions):
         ''' Initialize
         Args:
             memory_size (int): the size of the memroy buffer
+            batch_size (int): the size of the sampled minibatches
+            num_actions (int): the width of the legal action masks
         '''
         self.memory_size = memory_size
         self.batch_size = batch_size
-        self.memory = []
+        self.num_actions = num_actions
+        self.size = 0
+        self.position = 0
+
+        # The state arrays are allocated with the first transition, whose
+        # shape and dtype are not known before
+        self.states = None
+        self.next_states = None
+        self.actions = np.zeros(memory_size, dtype=np.int64)
+        self.rewards = np.zeros(memory_size, dtype=np.float32)
+        self.legal_actions = np.zeros((memory_size, num_actions), dtype=bool)
+        self.dones = np.zeros(memory_size, dtype=bool)
+
+    def __len__(self):
+        return self.size
 
     def save(self, state, action, reward, next_state, legal_actions, done):
         ''' Save transition into memory
@@ -394,23 +501,167 @@ class Memory(object):
             action (int): the performed action ID
             reward (float): the reward received
             next_state (numpy.array): the next state after performing the action
-            legal_actions (list): the legal actions of the next state
+            legal_actions (numpy.array): the boolean legal action mask of the next state
             done (boolean): whether the episode is finished
         '''
-        if len(self.memory) == self.memory_size:
-            self.memory.pop(0)
-        transition = Transition(state, action, reward, next_state, legal_actions, done)
-        self.memory.append(transition)
+        legal_actions = np.asarray(legal_actions)
+        if legal_actions.dtype != bool or legal_actions.shape != (self.num_actions,):
+            raise ValueError("legal_actions should be a boolean mask of shape ({},), got {} of shape {}".format(
+                self.num_actions, legal_actions.dtype, legal_actions.shape))
+        if self.states is None:
+            state = np.asarray(state)
+            self.states = np.zeros((self.memory_size,) + state.shape, dtype=state.dtype)
+            self.next_states = np.zeros((self.memory_size,) + state.shape, dtype=state.dtype)
+
+        i = self.position
+        self.states[i] = state
+        self.actions[i] = action
+        self.rewards[i] = reward
+        self.next_states[i] = next_state
+        self.legal_actions[i] = legal_actions
+        self.dones[i] = done
+
+        self.position = (i + 1) % self.memory_size
+        self.size = min(self.size + 1, self.memory_size)
 
     def sample(self):
         ''' Sample a minibatch from the replay memory
 
         Returns:
-            state_batch (list): a batch of states
-            action_batch (list): a batch of actions
-            reward_batch (list): a batch of rewards
-            next_state_batch (list): a batch of states
-            done_batch (list): a batch of dones
+            state_batch (numpy.array): a batch of states
+            action_batch (numpy.array): a batch of actions
+            reward_batch (numpy.array): a batch of rewards
+            next_state_batch (numpy.array): a batch of states
+            legal_actions_batch (numpy.array): a batch of boolean legal action masks of the next states
+            done_batch (numpy.array): a batch of dones
+        '''
+        indices = np.random.randint(self.size, size=self.batch_size)
+        return self.states[indices], self.actions[indices], self.rewards[indices], \
+            self.next_states[indices], self.legal_actions[indices], self.dones[indices]
+
+class SumTree(object):
+    ''' Binary tree stored in an array, where each node is the sum of its
+        two children. The leaves hold the priorities of the transitions,
+        which are updated and sampled in O(log n) for a whole batch.
+    '''
+
+    def __init__(self, capacity):
+        ''' Initialize
+        Args:
+            capacity (int): the number of leaves
+        '''
+        self.capacity = capacity
+        self.num_leaves = 1 << max(capacity - 1, 0).bit_length()
+        self.depth = self.num_leaves.bit_length() - 1
+        # The root is the node 1 and the children of node i are 2i and 2i+1
+        self.nodes = np.zeros(2 * self.num_leaves)
+
+    def total(self):
+        ''' The sum of all the priorities
+        '''
+        return self.nodes[1]
+
+    def get(self, indices):
+        ''' Get the priorities of leaves
+        '''
+        return self.nodes[np.asarray(indices) + self.num_leaves]
+
+    def update(self, indices, priorities):
+        ''' Set the priorities of leaves and update their ancestors
+
+        Args:
+            indices (numpy.array): the indices of the leaves
+            priorities (numpy.array): the new priorities
+        '''
+        nodes = np.asarray(indices) + self.num_leaves
+        self.nodes[nodes] = priorities
+        for _ in range(self.depth):
+            nodes = np.unique(nodes // 2)
+            self.nodes[nodes] = self.nodes[2 * nodes] + self.nodes[2 * nodes + 1]
+
+    def find(self, values):
+        ''' Find the leaves where the prefix sums of the priorities reach the values
+
+        Args:
+            values (numpy.array): values between 0 and the total priority
+
+        Returns:
+            (numpy.array): the indices of the leaves
+        '''
+        nodes = np.ones(len(values), dtype=np.int64)
+        for _ in range(self.depth):
+            left = self.nodes[2 * nodes]
+            # Never go to an empty subtree because of rounding errors
+            go_right = (values >= left) & (self.nodes[2 * nodes + 1] > 0)
+            values = values - left * go_right
+            nodes = 2 * nodes + go_right
+        return nodes - self.num_leaves
+
+class PrioritizedMemory(Memory):
+    ''' Memory for prioritized experience replay (Schaul et al., 2016).
+        A transition is sampled with a probability proportional to its
+        priority, (|TD error| + e) ** alpha, found in a sum tree. The new
+        transitions get the highest priority seen so far.
+    '''
+
+    def __init__(self, memory_size, batch_size, num_actions, alpha=0.6, epsilon=1e-6):
+        ''' Initialize
+        Args:
+            memory_size (int): the size of the memroy buffer
+            batch_size (int): the size of the sampled minibatches
+            num_actions (int): the width of the legal action masks
+            alpha (float): the exponent of the TD errors in the priorities
+            epsilon (float): the constant added to the TD errors, so that all transitions can be sampled
+        '''
+        super().__init__(memory_size, batch_size, num_actions)
+        self.alpha = alpha
+        self.epsilon = epsilon
+        self.max_priority = 1.0
+        self.tree = SumTree(memory_size)
+
+    def save(self, state, action, reward, next_state, legal_actions, done):
+        ''' Save transition into memory with the highest priority
+        '''
+        self.tree.update([self.position], [self.max_priority])
+        super().save(state, action, reward, next_state, legal_actions, done)
+
+    def sample(self, beta=1.0):
+        ''' Sample a minibatch from the replay memory by priority. The
+            priority range is split into `batch_size` segments, with one
+            transition sampled in each segment.
+
+        Args:
+            beta (float): the exponent of the importance sampling weights
+
+        Returns:
+            state_batch (numpy.array): a batch of states
+            action_batch (numpy.array): a batch of actions
+            reward_batch (numpy.array): a batch of rewards
+            next_state_batch (numpy.array): a batch of states
+            legal_actions_batch (numpy.array): a batch of boolean legal action masks of the next states
+            done_batch (numpy.array): a batch of dones
+            indices (numpy.array): the indices of the transitions, to update their priorities
+            weights (numpy.array): the importance sampling weights, normalized by their maximum
+        '''
+        total = self.tree.total()
+        values = (np.arange(self.batch_size) + np.random.rand(self.batch_size)) * (total / self.batch_size)
+        indices = np.minimum(self.tree.find(values), self.size - 1)
+
+        probs = self.tree.get(indices) / total
+        weights = (self.size * probs) ** -beta
+        weights /= weights.max()
+
+        return self.states[indices], self.actions[indices], self.rewards[indices], \
+            self.next_states[indices], self.legal_actions[indices], self.dones[indices], \
+            indices, weights.astype(np.float32)
+
+    def update_priorities(self, indices, td_errors):
+        ''' Update the priorities of sampled transitions
+
+        Args:
+            indices (numpy.array): the indices of the transitions
+            td_errors (numpy.array): their new TD errors
         '''
-        samples = random.sample(self.memory, self.batch_size)
-        return map(np.array, zip(*samples))
+        priorities = (np.abs(td_errors) + self.epsilon) ** self.alpha
+        self.max_priority = max(self.max_priority, priorities.max())
+        self.tree.update(indices, priorities)
@@ -0,0 +1,189 @@
+''' Monte Carlo CFR agents. Instead of enumerating the whole game tree
+    in each iteration like `CFRAgent`, they only visit a sampled part of it,
+    which makes CFR usable on the larger games.
+'''
+import time
+from abc import ABC, abstractmethod
+
+import numpy as np
+
+from rlcard.agents.cfr_agent import CFRAgent, regret_matching
+from rlcard.utils.utils import remove_illegal
+
+class MCCFRAgent(CFRAgent, ABC):
+    ''' The abstract base class of the Monte Carlo CFR agents. The chance
+        events are sampled by the environment when it is reset. The
+        subclasses implement `traverse_tree(player_id)`, which is called
+        once per player in each iteration.
+    '''
+
+    def __init__(self, env, model_path='./mccfr_model', report_every=None):
+        ''' Initilize Agent
+
+        Args:
+            env (Env): Env class
+            model_path (str): The directory of the checkpoints
+            report_every (int): Print the number of iterations per second
+                every `report_every` iterations. Default is None, which
+                means no report.
+        '''
+        super().__init__(env, model_path)
+        self.report_every = report_every
+        self.iterations_per_second = 0.0
+        # The clock starts with the first iteration, the setup is not counted
+        self._report_start = None
+        self._report_iteration = 0
+
+    def train(self):
+        ''' Do one iteration of Monte Carlo CFR
+        '''
+        if self._report_start is None:
+            self._report_start, self._report_iteration = time.perf_counter(), self.iteration
+        self.iteration += 1
+        for player_id in range(self.env.num_players):
+            self.env.reset()
+            self.traverse_tree(player_id)
+
+        if self.report_every and self.iteration % self.report_every == 0:
+            now = time.perf_counter()
+            self.iterations_per_second = (self.iteration - self._report_iteration) / (now - self._report_start)
+            self._report_start, self._report_iteration = now, self.iteration
+            print('\rINFO - Iteration {}, {:.1f} it/s'.format(self.iteration, self.iterations_per_second), end='')
+
+    @abstractmethod
+    def traverse_tree(self, player_id):
+        ''' Traverse a sampled part of the game tree and update the regrets
+            and the average policy of the infosets of `player_id`
+
+        Args:
+            player_id (int): The player to update the value
+        '''
+
+    def update_policy(self):
+        ''' The policy of an infoset is updated when it is visited
+        '''
+        pass
+
+    def current_policy(self, infoset, legal_actions):
+        ''' Compute the policy of an infoset with regret matching and
+            store it in the policy table
+
+        Args:
+            infoset (int): The id of the infoset
+            legal_actions (list): Indices of legal actions
+
+        Returns:
+            (numpy.array): The action probabilities
+        '''
+        self.table.policy[infoset] = regret_matching(self.table.regrets[infoset:infoset+1])[0]
+        return remove_illegal(self.table.policy[infoset], legal_actions)
+
+class ExternalSamplingCFRAgent(MCCFRAgent):
+    ''' Implement external sampling MCCFR. All the actions of the updated
+        player are explored, and a single action is sampled at the nodes
+        of the other players.
+    '''
+
+    def traverse_tree(self, player_id):
+        ''' Traverse the game tree, update the regrets
+
+        Args:
+            player_id: The player to update the value
+
+        Returns:
+            (float): The sampled utility of `player_id`
+        '''
+        if self.env.is_over():
+            return self.env.get_payoffs()[player_id]
+
+        current_player = self.env.get_player_id()
+        obs, legal_actions = self.get_state(current_player)
+        infoset = self.table.intern(obs)
+        action_probs = self.current_policy(infoset, legal_actions)
+
+        if not current_player == player_id:
+            # The average policy is updated at the nodes of the other players
+            # because they are sampled with their current policy
+            self.table.average_policy[infoset, legal_actions] += action_probs[legal_actions]
+            action = np.random.choice(len(action_probs), p=action_probs)
+            self.env.step(action)
+            utility = self.traverse_tree(player_id)
+            self.env.step_back()
+            return utility
+
+        action_utilities = np.zeros(len(legal_actions))
+        for i, action in enumerate(legal_actions):
+            self.env.step(action)
+            action_utilities[i] = self.traverse_tree(player_id)
+            self.env.step_back()
+
+        state_utility = np.dot(action_probs[legal_actions], action_utilities)
+        self.table.regrets[infoset, legal_actions] += action_utilities - state_utility
+        return state_utility
+
+class OutcomeSamplingCFRAgent(MCCFRAgent):
+    ''' Implement outcome sampling MCCFR. A single terminal history is
+        sampled in each traversal. The updated player explores with
+        an epsilon-greedy mixture of its policy and the uniform policy.
+    '''
+
+    def __init__(self, env, model_path='./mccfr_model', report_every=None, epsilon=0.6):
+        ''' Initilize Agent
+
+        Args:
+            env (Env): Env class
+            model_path (str): The directory of the checkpoints
+            report_every (int): Print the number of iterations per second
+                every `report_every` iterations
+            epsilon (float): The exploration of the updated player
+        '''
+        super().__init__(env, model_path, report_every)
+        self.epsilon = epsilon
+
+    def traverse_tree(self, player_id, player_prob=1.0, opponent_prob=1.0, sample_prob=1.0):
+        ''' Traverse a sampled history, update the regrets
+
+        Args:
+            player_id: The player to update the value
+            player_prob (float): The reach probability of `player_id`
+            opponent_prob (float): The reach probability of the other players
+            sample_prob (float): The probability of sampling the current node
+
+        Returns:
+            (tuple): Tuple containing:
+
+                (float): The sampled utility of `player_id`, divided by the sampling probability
+                (float): The probability of reaching the terminal from the current node
+        '''
+        if self.env.is_over():
+            return self.env.get_payoffs()[player_id] / sample_prob, 1.0
+
+        current_player = self.env.get_player_id()
+        obs, legal_actions = self.get_state(current_player)
+        infoset = self.table.intern(obs)
+        action_probs = self.current_policy(infoset, legal_actions)
+
+        if current_player == player_id:
+            sample_probs = (1 - self.epsilon) * action_probs
+            sample_probs[legal_actions] += self.epsilon / len(legal_actions)
+        else:
+            sample_probs = action_probs
+        action = np.random.choice(len(sample_probs), p=sample_probs)
+
+        if current_player == player_id:
+            next_player_prob, next_opponent_prob = player_prob * action_probs[action], opponent_prob
+        else:
+            next_player_prob, next_opponent_prob = player_prob, opponent_prob * action_probs[action]
+        self.env.step(action)
+        utility, tail_prob = self.traverse_tree(player_id, next_player_prob, next_opponent_prob,
+                                                sample_prob * sample_probs[action])
+        self.env.step_back()
+
+        if current_player == player_id:
+            weight = utility * opponent_prob
+            regrets = -weight * tail_prob * action_probs[action] * np.ones(len(legal_actions))
+            regrets[legal_actions.index(action)] += weight * tail_prob
+            self.table.regrets[infoset, legal_actions] += regrets
+            self.table.average_policy[infoset, legal_actions] += player_prob / sample_prob * action_probs[legal_actions]
+
+        return utility, tail_prob * action_probs[action]
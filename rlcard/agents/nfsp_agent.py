@@ -20,7 +20,6 @@ See the paper https://arxiv.org/abs/1603.01121 for more details.
 '''
 
 import random
-import collections
 import enum
 import numpy as np
 import torch
@@ -28,9 +27,8 @@ import torch.nn as nn
 import torch.nn.functional as F
 
 from rlcard.agents.dqn_agent import DQNAgent
-from rlcard.utils.utils import remove_illegal
-
-Transition = collections.namedtuple('Transition', 'info_state action_probs')
+from rlcard.agents.dqn_agent import mask_illegal
+from rlcard.utils.utils import get_legal_actions_mask
 
 class NFSPAgent(object):
     ''' An approximate clone of rlcard.agents.nfsp_agent that uses
@@ -167,16 +165,12 @@ class NFSPAgent(object):
             action (int): An action id
         '''
         obs = state['obs']
-        legal_actions = list(state['legal_actions'].keys())
         if self._mode == 'best_response':
             action = self._rl_agent.step(state)
-            one_hot = np.zeros(self._num_actions)
-            one_hot[action] = 1
-            self._add_transition(obs, one_hot)
+            self._add_transition(obs, action)
 
         elif self._mode == 'average_policy':
-            probs = self._act(obs)
-            probs = remove_illegal(probs, legal_actions)
+            probs = self._act(obs, get_legal_actions_mask(state, self._num_actions))
             action = np.random.choice(len(probs), p=probs)
 
         return action
@@ -195,9 +189,7 @@ class NFSPAgent(object):
             action, info = self._rl_agent.eval_step(state)
         elif self.evaluate_with == 'average_policy':
             obs = state['obs']
-            legal_actions = list(state['legal_actions'].keys())
-            probs = self._act(obs)
-            probs = remove_illegal(probs, legal_actions)
+            probs = self._act(obs, get_legal_actions_mask(state, self._num_actions))
             action = np.random.choice(len(probs), p=probs)
             info = {}
             info['probs'] = {state['raw_legal_actions'][i]: float(probs[list(state['legal_actions'].keys())[i]]) for i in range(len(state['legal_actions']))}
@@ -213,11 +205,13 @@ class NFSPAgent(object):
         else:
             self._mode = 'average_policy'
 
-    def _act(self, info_state):
+    def _act(self, info_state, legal_actions_mask=None):
         ''' Predict action probability givin the observation and legal actions
             Not connected to computation graph
         Args:
             info_state (numpy.array): An obervation.
+            legal_actions_mask (numpy.array): The boolean mask of the legal actions. The
+                probabilities are renormalized over the legal actions on the device
 
         Returns:
             action_probs (numpy.array): The predicted action probability.
@@ -226,25 +220,28 @@ class NFSPAgent(object):
         info_state = torch.from_numpy(info_state).float().to(self.device)
 
         with torch.no_grad():
-            log_action_probs = self.policy_network(info_state).cpu().numpy()
-
-        action_probs = np.exp(log_action_probs)[0]
-
+            log_action_probs = self.policy_network(info_state)
+            if legal_actions_mask is not None:
+                mask = torch.from_numpy(legal_actions_mask).to(self.device).unsqueeze(0)
+                log_action_probs = torch.log_softmax(mask_illegal(log_action_probs, mask), dim=-1)
+            action_probs = torch.exp(log_action_probs).cpu().numpy()[0].astype(np.float64)
+
+        if legal_actions_mask is not None:
+            # Remove the rounding errors of float32 for sampling
+            action_probs /= action_probs.sum()
         return action_probs
 
-    def _add_transition(self, state, probs):
+    def _add_transition(self, state, action):
         ''' Adds the new transition to the reservoir buffer.
 
-        Transitions are in the form (state, probs).
+        Transitions are in the form (state, action), where the action is
+        the one of the best response policy.
 
         Args:
             state (numpy.array): The state.
-            probs (numpy.array): The probabilities of each action.
+            action (int): The action id.
         '''
-        transition = Transition(
-                info_state=state,
-                action_probs=probs)
-        self._reservoir_buffer.add(transition)
+        self._reservoir_buffer.add(state, action)
 
     def train_sl(self):
         ''' Compute the loss on sampled transitions and perform a avg-network update.
@@ -259,23 +256,22 @@ class NFSPAgent(object):
                 len(self._reservoir_buffer) < self._min_buffer_size_to_learn):
             return None
 
-        transitions = self._reservoir_buffer.sample(self._batch_size)
-        info_states = [t.info_state for t in transitions]
-        action_probs = [t.action_probs for t in transitions]
+        info_states, actions = self._reservoir_buffer.sample(self._batch_size)
 
         self.policy_network_optimizer.zero_grad()
         self.policy_network.train()
 
         # (batch, state_size)
-        info_states = torch.from_numpy(np.array(info_states)).float().to(self.device)
+        info_states = torch.from_numpy(info_states).float().to(self.device)
 
-        # (batch, num_actions)
-        eval_action_probs = torch.from_numpy(np.array(action_probs)).float().to(self.device)
+        # (batch, 1)
+        actions = torch.from_numpy(actions).long().to(self.device).unsqueeze(-1)
 
         # (batch, num_actions)
         log_forecast_action_probs = self.policy_network(info_states)
 
-        ce_loss = - (eval_action_probs * log_forecast_action_probs).sum(dim=-1).mean()
+        # The cross entropy with the one-hot action probabilities of the best response
+        ce_loss = - log_forecast_action_probs.gather(-1, actions).mean()
         ce_loss.backward()
 
         self.policy_network_optimizer.step()
@@ -337,8 +333,9 @@ class AveragePolicyNetwork(nn.Module):
 class ReservoirBuffer(object):
     ''' Allows uniform sampling over a stream of data.
 
-    This class supports the storage of arbitrary elements, such as observation
-    tensors, integer actions, etc.
+    The buffer stores the observations and the integer actions of the
+    transitions in preallocated arrays, allocated with the first
+    observation, since its shape and dtype are not known before.
 
     See https://en.wikipedia.org/wiki/Reservoir_sampling for more details.
     '''
@@ -347,49 +344,100 @@ class ReservoirBuffer(object):
         ''' Initialize the buffer.
         '''
         self._reservoir_buffer_capacity = reservoir_buffer_capacity
-        self._data = []
+        self._info_states = None
+        self._actions = np.zeros(reservoir_buffer_capacity, dtype=np.int32)
+        self._size = 0
         self._add_calls = 0
 
-    def add(self, element):
-        ''' Potentially adds `element` to the reservoir buffer.
+    def add(self, info_state, action):
+        ''' Potentially adds a transition to the reservoir buffer.
 
         Args:
-            element (object): data to be added to the reservoir buffer.
+            info_state (numpy.array): The observation.
+            action (int): The action id.
         '''
-        if len(self._data) < self._reservoir_buffer_capacity:
-            self._data.append(element)
+        if self._info_states is None:
+            self._allocate(np.asarray(info_state))
+        if self._size < self._reservoir_buffer_capacity:
+            idx = self._size
+            self._size += 1
         else:
             idx = np.random.randint(0, self._add_calls + 1)
-            if idx < self._reservoir_buffer_capacity:
-                self._data[idx] = element
+        if idx < self._reservoir_buffer_capacity:
+            self._info_states[idx] = info_state
+            self._actions[idx] = action
         self._add_calls += 1
 
+    def add_batch(self, info_states, actions):
+        ''' Potentially adds a batch of transitions to the reservoir buffer.
+            The result is distributed as adding them one by one.
+
+        Args:
+            info_states (numpy.array): The observations, (batch, state_shape).
+            actions (numpy.array): The action ids, (batch,).
+        '''
+        if len(actions) == 0:
+            return
+        info_states, actions = np.asarray(info_states), np.asarray(actions)
+        if self._info_states is None:
+            self._allocate(info_states[0])
+
+        # The first transitions fill the buffer, the others replace a slot
+        # uniformly sampled among all the transitions added so far
+        num_free = min(self._reservoir_buffer_capacity - self._size, len(actions))
+        indices = np.empty(len(actions), dtype=np.int64)
+        indices[:num_free] = np.arange(self._size, self._size + num_free)
+        add_calls = self._add_calls + np.arange(num_free, len(actions))
+        indices[num_free:] = np.random.randint(0, add_calls + 1)
+        kept = np.flatnonzero(indices < self._reservoir_buffer_capacity)
+
+        # When a slot is replaced several times, the last transition stays.
+        # Assigning to repeated indices has no defined order in NumPy, so
+        # only the last occurrence of each slot is assigned
+        _, last = np.unique(indices[kept][::-1], return_index=True)
+        kept = kept[len(kept) - 1 - last]
+        self._info_states[indices[kept]] = info_states[kept]
+        self._actions[indices[kept]] = actions[kept]
+        self._size += num_free
+        self._add_calls += len(actions)
+
     def sample(self, num_samples):
-        ''' Returns `num_samples` uniformly sampled from the buffer.
+        ''' Returns `num_samples` uniformly sampled from the buffer, without
+            replacement.
 
         Args:
             num_samples (int): The number of samples to draw.
 
         Returns:
-            An iterable over `num_samples` random elements of the buffer.
+            (tuple): Tuple containing:
+
+                (numpy.array): The observations, (num_samples, state_shape)
+                (numpy.array): The action ids, (num_samples,)
 
         Raises:
             ValueError: If there are less than `num_samples` elements in the buffer
         '''
-        if len(self._data) < num_samples:
+        if self._size < num_samples:
             raise ValueError("{} elements could not be sampled from size {}".format(
-                    num_samples, len(self._data)))
-        return random.sample(self._data, num_samples)
+                    num_samples, self._size))
+        indices = random.sample(range(self._size), num_samples)
+        return self._info_states[indices], self._actions[indices]
 
     def clear(self):
         ''' Clear the buffer
         '''
-        self._data = []
+        self._size = 0
         self._add_calls = 0
 
+    def _allocate(self, info_state):
+        ''' Allocate the observation array after the first observation
+        '''
+        self._info_states = np.zeros((self._reservoir_buffer_capacity,) + info_state.shape, dtype=info_state.dtype)
+
     def __len__(self):
-        return len(self._data)
+        return self._size
 
     def __iter__(self):
-        return iter(self._data)
-
+        if self._info_states is None:
+            return iter(())
+        return zip(self._info_states[:self._size], self._actions[:self._size])
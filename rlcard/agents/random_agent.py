@@ -45,3 +45,31 @@ class RandomAgent(object):
         info['probs'] = {state['raw_legal_actions'][i]: probs[list(state['legal_actions'].keys())[i]] for i in range(len(state['legal_actions']))}
 
         return self.step(state), info
+
+    @staticmethod
+    def step_batch(batch):
+        ''' Predict the actions for a batch of states, e.g., stacked by `VectorEnv`
+
+        Args:
+            batch (dict): A dictionary with the boolean legal action mask in 'legal_actions'
+
+        Returns:
+            actions (list): The actions predicted (randomly chosen) by the random agent
+        '''
+        return [np.random.choice(np.flatnonzero(mask)) for mask in batch['legal_actions']]
+
+    def eval_step_batch(self, batch):
+        ''' Predict the actions for a batch of states for evaluation.
+
+        Args:
+            batch (dict): A dictionary with the boolean legal action mask in 'legal_actions'
+
+        Returns:
+            actions (list): The actions predicted (randomly chosen) by the random agent
+            info (dict): A dictionary containing the action probabilities
+        '''
+        mask = batch['legal_actions']
+        info = {}
+        info['probs'] = mask / mask.sum(axis=1, keepdims=True)
+
+        return self.step_batch(batch), info
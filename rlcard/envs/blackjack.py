@@ -36,11 +36,12 @@ class BlackjackEnv(Env):
             encoded_action_list.append(i)
         return encoded_action_list
 
-    def _extract_state(self, state):
+    def _extract_state(self, state, obs_out=None):
         ''' Extract the state representation from state dictionary for agent
 
         Args:
             state (dict): Original state from the game
+            obs_out (numpy.array): The array to write the observation into, see `Env._extract_state`
 
         Returns:
             observation (list): combine the player's score and dealer's observable score for observation
@@ -62,7 +63,9 @@ class BlackjackEnv(Env):
 
         my_score, _ = get_scores_and_A(my_cards)
         dealer_score, _ = get_scores_and_A(dealer_cards)
-        obs = np.array([my_score, dealer_score])
+        obs = self._get_obs_array((2,), int, obs_out)
+        obs[0] = my_score
+        obs[1] = dealer_score
 
         legal_actions = OrderedDict({i: None for i in range(len(self.actions))})
         extracted_state = {'obs': obs, 'legal_actions': legal_actions}
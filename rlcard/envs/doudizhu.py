@@ -9,28 +9,30 @@ class DoudizhuEnv(Env):
     '''
 
     def __init__(self, config):
-        from rlcard.games.doudizhu.utils import ACTION_2_ID, ID_2_ACTION
+        from rlcard.games.doudizhu.utils import get_action_space, get_action_features
         from rlcard.games.doudizhu.utils import cards2str, cards2str_with_suit
         from rlcard.games.doudizhu import Game
         self._cards2str = cards2str
         self._cards2str_with_suit = cards2str_with_suit
-        self._ACTION_2_ID = ACTION_2_ID
-        self._ID_2_ACTION = ID_2_ACTION
-        
+        self._ID_2_ACTION, self._ACTION_2_ID = get_action_space()
+        self._action_features = get_action_features()
+
         self.name = 'doudizhu'
         self.game = Game()
         super().__init__(config)
         self.state_shape = [[790], [901], [901]]
         self.action_shape = [[54] for _ in range(self.num_players)]
 
-    def _extract_state(self, state):
+    def _extract_state(self, state, obs_out=None):
         ''' Encode state
 
         Args:
             state (dict): dict of original state
+            obs_out (numpy.array): The array to write the observation into, see `Env._extract_state`
         '''
-        current_hand = _cards2array(state['current_hand'])
-        others_hand = _cards2array(state['others_hand'])
+        obs = self._get_obs_array(self.state_shape[state['self']], np.int8, obs_out)
+        _cards2array(state['current_hand'], obs[:54])
+        _cards2array(state['others_hand'], obs[54:108])
 
         last_action = ''
         if len(state['trace']) != 0:
@@ -38,49 +40,31 @@ class DoudizhuEnv(Env):
                 last_action = state['trace'][-2][1]
             else:
                 last_action = state['trace'][-1][1]
-        last_action = _cards2array(last_action)
+        self._action2array(last_action, obs[108:162])
 
-        last_9_actions = _action_seq2array(_process_action_seq(state['trace']))
+        self._action_seq2array(_process_action_seq(state['trace']), obs[162:648])
 
         if state['self'] == 0: # landlord
-            landlord_up_played_cards = _cards2array(state['played_cards'][2])
-            landlord_down_played_cards = _cards2array(state['played_cards'][1])
-            landlord_up_num_cards_left = _get_one_hot_array(state['num_cards_left'][2], 17) 
-            landlord_down_num_cards_left = _get_one_hot_array(state['num_cards_left'][1], 17)
-            obs = np.concatenate((current_hand,
-                                  others_hand,
-                                  last_action,
-                                  last_9_actions,
-                                  landlord_up_played_cards,
-                                  landlord_down_played_cards,
-                                  landlord_up_num_cards_left,
-                                  landlord_down_num_cards_left))
+            _cards2array(state['played_cards'][2], obs[648:702])
+            _cards2array(state['played_cards'][1], obs[702:756])
+            _get_one_hot_array(state['num_cards_left'][2], 17, obs[756:773])
+            _get_one_hot_array(state['num_cards_left'][1], 17, obs[773:790])
         else:
-            landlord_played_cards = _cards2array(state['played_cards'][0])
+            _cards2array(state['played_cards'][0], obs[648:702])
             for i, action in reversed(state['trace']):
                 if i == 0:
                     last_landlord_action = action
-            last_landlord_action = _cards2array(last_landlord_action)
-            landlord_num_cards_left = _get_one_hot_array(state['num_cards_left'][0], 20)
 
             teammate_id = 3 - state['self']
-            teammate_played_cards = _cards2array(state['played_cards'][teammate_id])
+            _cards2array(state['played_cards'][teammate_id], obs[702:756])
             last_teammate_action = 'pass'
             for i, action in reversed(state['trace']):
                 if i == teammate_id:
                     last_teammate_action = action
-            last_teammate_action = _cards2array(last_teammate_action)
-            teammate_num_cards_left = _get_one_hot_array(state['num_cards_left'][teammate_id], 17)
-            obs = np.concatenate((current_hand,
-                                  others_hand,
-                                  last_action,
-                                  last_9_actions,
-                                  landlord_played_cards,
-                                  teammate_played_cards,
-                                  last_landlord_action,
-                                  last_teammate_action,
-                                  landlord_num_cards_left,
-                                  teammate_num_cards_left))
+            self._action2array(last_landlord_action, obs[756:810])
+            self._action2array(last_teammate_action, obs[810:864])
+            _get_one_hot_array(state['num_cards_left'][0], 20, obs[864:884])
+            _get_one_hot_array(state['num_cards_left'][teammate_id], 17, obs[884:901])
 
         extracted_state = OrderedDict({'obs': obs, 'legal_actions': self._get_legal_actions()})
         extracted_state['raw_obs'] = state
@@ -114,7 +98,7 @@ class DoudizhuEnv(Env):
             legal_actions (list): a list of legal actions' id
         '''
         legal_actions = self.game.state['actions']
-        legal_actions = {self._ACTION_2_ID[action]: _cards2array(action) for action in legal_actions}
+        legal_actions = {self._ACTION_2_ID[action]: self._action_features[self._ACTION_2_ID[action]] for action in legal_actions}
         return legal_actions
 
     def get_perfect_information(self):
@@ -137,45 +121,63 @@ class DoudizhuEnv(Env):
         Returns:
             (numpy.array): The action features
         '''
-        return _cards2array(self._decode_action(action))
+        return self._action_features[action]
+
+    def _action2array(self, action, out):
+        ''' Encode an action string with the action feature table
+
+        Args:
+            action (string): The action, or '' for no action
+            out (numpy.array): The zeroed array of 54 to write the features into
+        '''
+        if action != '':
+            out[:] = self._action_features[self._ACTION_2_ID[action]]
+
+    def _action_seq2array(self, action_seq_list, out):
+        ''' Encode a sequence of action strings with the action feature table
+
+        Args:
+            action_seq_list (list): The actions, '' for no action
+            out (numpy.array): The zeroed array of 54 * len(action_seq_list)
+                to write the flattened features into
+        '''
+        for row, action in enumerate(action_seq_list):
+            if action != '':
+                out[row * 54:(row + 1) * 54] = self._action_features[self._ACTION_2_ID[action]]
 
 Card2Column = {'3': 0, '4': 1, '5': 2, '6': 3, '7': 4, '8': 5, '9': 6, 'T': 7,
                'J': 8, 'Q': 9, 'K': 10, 'A': 11, '2': 12}
 
-NumOnes2Array = {0: np.array([0, 0, 0, 0]),
-                 1: np.array([1, 0, 0, 0]),
-                 2: np.array([1, 1, 0, 0]),
-                 3: np.array([1, 1, 1, 0]),
-                 4: np.array([1, 1, 1, 1])}
+def _cards2array(cards, out=None):
+    ''' Encode cards as 54 features: the count of each rank as ones in a
+        column of 4, ranks from 3 to 2, then the black and red jokers
+
+    Args:
+        cards (string): The cards, or 'pass'
+        out (numpy.array): If given, the zeroed array of 54 to write the features into
 
-def _cards2array(cards):
+    Returns:
+        (numpy.array): The features
+    '''
+    if out is None:
+        out = np.zeros(54, dtype=np.int8)
     if cards == 'pass':
-        return np.zeros(54, dtype=np.int8)
+        return out
 
-    matrix = np.zeros([4, 13], dtype=np.int8)
-    jokers = np.zeros(2, dtype=np.int8)
     counter = Counter(cards)
     for card, num_times in counter.items():
         if card == 'B':
-            jokers[0] = 1
+            out[52] = 1
         elif card == 'R':
-            jokers[1] = 1
+            out[53] = 1
         else:
-            matrix[:, Card2Column[card]] = NumOnes2Array[num_times]
-    return np.concatenate((matrix.flatten('F'), jokers))
-
-def _get_one_hot_array(num_left_cards, max_num_cards):
-    one_hot = np.zeros(max_num_cards, dtype=np.int8)
-    one_hot[num_left_cards - 1] = 1
-
-    return one_hot
+            column = Card2Column[card] * 4
+            out[column:column + num_times] = 1
+    return out
 
-def _action_seq2array(action_seq_list):
-    action_seq_array = np.zeros((len(action_seq_list), 54), np.int8)
-    for row, cards in enumerate(action_seq_list):
-        action_seq_array[row, :] = _cards2array(cards)
-    action_seq_array = action_seq_array.flatten()
-    return action_seq_array
+def _get_one_hot_array(num_left_cards, max_num_cards, out):
+    # out is the zeroed array of max_num_cards, 0 cards left sets its last entry
+    out[(num_left_cards - 1) % max_num_cards] = 1
 
 def _process_action_seq(sequence, length=9):
     sequence = [action[1] for action in sequence[-length:]]
@@ -49,9 +49,13 @@ class Env(object):
         self.seed(config['seed'])
 
 
-    def reset(self):
+    def reset(self, obs_out=None):
         ''' Start a new game
 
+        Args:
+            obs_out (numpy.array): If given, the observation is written into
+                this array, see `_extract_state`
+
         Returns:
             (tuple): Tuple containing:
 
@@ -60,14 +64,16 @@ class Env(object):
         '''
         state, player_id = self.game.init_game()
         self.action_recorder = []
-        return self._extract_state(state), player_id
+        return self._encode_state(state, obs_out), player_id
 
-    def step(self, action, raw_action=False):
+    def step(self, action, raw_action=False, obs_out=None):
         ''' Step forward
 
         Args:
             action (int): The action taken by the current player
             raw_action (boolean): True if the action is a raw action
+            obs_out (numpy.array): If given, the observation of the next state
+                is written into this array, see `_extract_state`
 
         Returns:
             (tuple): Tuple containing:
@@ -83,7 +89,7 @@ class Env(object):
         self.action_recorder.append((self.get_player_id(), action))
         next_state, player_id = self.game.step(action)
 
-        return self._extract_state(next_state), player_id
+        return self._encode_state(next_state, obs_out), player_id
 
     def step_back(self):
         ''' Take one step backward.
@@ -185,16 +191,18 @@ class Env(object):
         return self.game.get_player_id()
 
 
-    def get_state(self, player_id):
+    def get_state(self, player_id, obs_out=None):
         ''' Get the state given player id
 
         Args:
             player_id (int): The player id
+            obs_out (numpy.array): If given, the observation is written into
+                this array, see `_extract_state`
 
         Returns:
             (numpy.array): The observed state of the player
         '''
-        return self._extract_state(self.game.get_state(player_id))
+        return self._encode_state(self.game.get_state(player_id), obs_out)
 
     def get_payoffs(self):
         ''' Get the payoffs of players. Must be implemented in the child class.
@@ -230,17 +238,49 @@ class Env(object):
         self.game.np_random = self.np_random
         return seed
 
-    def _extract_state(self, state):
+    def _extract_state(self, state, obs_out=None):
         ''' Extract useful information from state for RL. Must be implemented in the child class.
 
         Args:
             state (dict): The raw state
+            obs_out (numpy.array): If given, an array of the state shape of the
+                player, e.g. a row of a rollout buffer, into which the observation
+                is written instead of a new array. Its dtype is kept, so that
+                int8 or float32 buffers are filled without conversion. The
+                'obs' of the extracted state is then this array.
 
         Returns:
             (numpy.array): The extracted state
         '''
         raise NotImplementedError
 
+    def _encode_state(self, state, obs_out):
+        ''' Extract a state, passing `obs_out` only if given, so that
+            environments whose `_extract_state` does not take it still work
+            without buffers
+        '''
+        if obs_out is None:
+            return self._extract_state(state)
+        return self._extract_state(state, obs_out)
+
+    def _get_obs_array(self, shape, dtype, obs_out):
+        ''' Get the array to encode an observation into
+
+        Args:
+            shape (tuple): The shape of the observation
+            dtype (numpy.dtype): The dtype of a new array
+            obs_out (numpy.array): The array given by the caller, or None
+
+        Returns:
+            (numpy.array): `obs_out` cleared, or a new array of zeros
+        '''
+        if obs_out is None:
+            return np.zeros(shape, dtype=dtype)
+        if obs_out.shape != tuple(shape):
+            raise ValueError('The observation buffer has shape {}, expected {}'.format(obs_out.shape, tuple(shape)))
+        obs_out.fill(0)
+        return obs_out
+
     def _decode_action(self, action_id):
         ''' Decode Action id to the action in the game.
 
@@ -14,21 +14,30 @@ class GinRummyEnv(Env):
     def __init__(self, config):
         from rlcard.games.gin_rummy.utils.move import ScoreSouthMove
         from rlcard.games.gin_rummy.utils import utils
+        from rlcard.games.gin_rummy.utils import bitboard
         from rlcard.games.gin_rummy import Game
         self._ScoreSouthMove = ScoreSouthMove
         self._utils = utils
+        self._bitboard = bitboard
 
         self.name = 'gin-rummy'
         self.game = Game()
         super().__init__(config=config)
         self.state_shape = [[5, 52] for _ in range(self.num_players)]
         self.action_shape = [None for _ in range(self.num_players)]
+        # The planes of the last observation of each player, and the masks they encode,
+        # updated with the cards that changed to write the observations into buffers
+        self._obs_planes = [np.zeros((5, 52), dtype=np.int8) for _ in range(self.num_players)]
+        self._obs_masks = [[0] * 5 for _ in range(self.num_players)]
 
-    def _extract_state(self, state):  # 200213 don't use state ???
+    def _extract_state(self, state, obs_out=None):  # 200213 don't use state ???
         ''' Encode state
 
         Args:
             state (dict): dict of original state
+            obs_out (numpy.array): The array to write the observation into, see `Env._extract_state`.
+                The 'raw_obs' of the extracted state is then this array too, so it changes when the
+                buffer is reused.
 
         Returns:
             numpy array: 5 * 52 array
@@ -39,28 +48,30 @@ class GinRummyEnv(Env):
                              unknown cards (likewise)  # is this needed ??? 200213
         '''
         if self.game.is_over():
-            obs = np.array([self._utils.encode_cards([]) for _ in range(5)])
-            extracted_state = {'obs': obs, 'legal_actions': self._get_legal_actions()}
-            extracted_state['raw_legal_actions'] = list(self._get_legal_actions().keys())
-            extracted_state['raw_obs'] = obs
+            obs = self._get_obs_array((5, 52), int, obs_out)
+            legal_actions = self._get_legal_actions()
         else:
-            discard_pile = self.game.round.dealer.discard_pile
-            stock_pile = self.game.round.dealer.stock_pile
-            top_discard = [] if not discard_pile else [discard_pile[-1]]
-            dead_cards = discard_pile[:-1]
+            dealer = self.game.round.dealer
+            discard_pile = dealer.discard_pile
+            top_discard_mask = 0 if not discard_pile else self._bitboard.get_card_bit(discard_pile[-1])
+            dead_cards_mask = dealer.discard_mask ^ top_discard_mask
             current_player = self.game.get_current_player()
             opponent = self.game.round.players[(current_player.player_id + 1) % 2]
-            known_cards = opponent.known_cards
-            unknown_cards = stock_pile + [card for card in opponent.hand if card not in known_cards]
-            hand_rep = self._utils.encode_cards(current_player.hand)
-            top_discard_rep = self._utils.encode_cards(top_discard)
-            dead_cards_rep = self._utils.encode_cards(dead_cards)
-            known_cards_rep = self._utils.encode_cards(known_cards)
-            unknown_cards_rep = self._utils.encode_cards(unknown_cards)
-            rep = [hand_rep, top_discard_rep, dead_cards_rep, known_cards_rep, unknown_cards_rep]
-            obs = np.array(rep)
-            extracted_state = {'obs': obs, 'legal_actions': self._get_legal_actions(), 'raw_legal_actions': list(self._get_legal_actions().keys())}
-            extracted_state['raw_obs'] = obs
+            known_cards_mask = opponent.known_mask
+            unknown_cards_mask = dealer.stock_mask | (opponent.hand_mask & ~known_cards_mask)
+            masks = [current_player.hand_mask, top_discard_mask, dead_cards_mask,
+                     known_cards_mask, unknown_cards_mask]
+            if obs_out is None:
+                obs = self._bitboard.encode_masks(masks)
+            else:
+                player_id = current_player.player_id
+                planes = self._bitboard.update_encoded_masks(self._obs_planes[player_id],
+                                                             self._obs_masks[player_id], masks)
+                obs = self._get_obs_array((5, 52), int, obs_out)
+                obs[...] = planes
+            legal_actions = self._get_legal_actions()
+        extracted_state = {'obs': obs, 'legal_actions': legal_actions, 'raw_legal_actions': list(legal_actions.keys())}
+        extracted_state['raw_obs'] = obs
         return extracted_state
 
     def get_payoffs(self):
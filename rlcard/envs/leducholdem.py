@@ -38,13 +38,14 @@ class LeducholdemEnv(Env):
         '''
         return self.game.get_legal_actions()
 
-    def _extract_state(self, state):
+    def _extract_state(self, state, obs_out=None):
         ''' Extract the state representation from state dictionary for agent
 
         Note: Currently the use the hand cards and the public cards. TODO: encode the states
 
         Args:
             state (dict): Original state from the game
+            obs_out (numpy.array): The array to write the observation into, see `Env._extract_state`
 
         Returns:
             observation (list): combine the player's score and dealer's observable score for observation
@@ -56,7 +57,7 @@ class LeducholdemEnv(Env):
 
         public_card = state['public_card']
         hand = state['hand']
-        obs = np.zeros(36)
+        obs = self._get_obs_array((36,), float, obs_out)
         obs[self.card2index[hand]] = 1
         if public_card:
             obs[self.card2index[public_card]+3] = 1
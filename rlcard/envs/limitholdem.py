@@ -37,13 +37,14 @@ class LimitholdemEnv(Env):
         '''
         return self.game.get_legal_actions()
 
-    def _extract_state(self, state):
+    def _extract_state(self, state, obs_out=None):
         ''' Extract the state representation from state dictionary for agent
 
         Note: Currently the use the hand cards and the public cards. TODO: encode the states
 
         Args:
             state (dict): Original state from the game
+            obs_out (numpy.array): The array to write the observation into, see `Env._extract_state`
 
         Returns:
             observation (list): combine the player's score and dealer's observable score for observation
@@ -58,7 +59,7 @@ class LimitholdemEnv(Env):
         raise_nums = state['raise_nums']
         cards = public_cards + hand
         idx = [self.card2index[card] for card in cards]
-        obs = np.zeros(72)
+        obs = self._get_obs_array((72,), float, obs_out)
         obs[idx] = 1
         for i, num in enumerate(raise_nums):
             obs[52 + i * 5 + num] = 1
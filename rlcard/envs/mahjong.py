@@ -4,7 +4,7 @@ from collections import OrderedDict
 from rlcard.envs import Env
 from rlcard.games.mahjong import Game
 from rlcard.games.mahjong import Card
-from rlcard.games.mahjong.utils import card_encoding_dict, encode_cards, pile2list
+from rlcard.games.mahjong.utils import card_encoding_dict, encode_counts
 
 class MahjongEnv(Env):
     ''' Mahjong Environment
@@ -18,12 +18,18 @@ class MahjongEnv(Env):
         self.de_action_id = {self.action_id[key]: key for key in self.action_id.keys()}
         self.state_shape = [[6, 34, 4] for _ in range(self.num_players)]
         self.action_shape = [None for _ in range(self.num_players)]
+        # The legal actions of the current state of the game, computed
+        # once per step for the observation and the decoding of the action
+        self._legal_state = None
+        self._legal_actions = None
+        self._legal_cards = None
 
-    def _extract_state(self, state):
+    def _extract_state(self, state, obs_out=None):
         ''' Encode state
 
         Args:
             state (dict): dict of original state
+            obs_out (numpy.array): The array to write the observation into, see `Env._extract_state`
 
         Returns:
             numpy array: 6*5*15 array
@@ -32,16 +38,11 @@ class MahjongEnv(Env):
                              the recent three actions
                              the union of all played cards
         '''
-        players_pile = state['players_pile']
-        hand_rep = encode_cards(state['current_hand'])
-        piles_rep = []
-        for p in players_pile.keys():
-            piles_rep.append(encode_cards(pile2list(players_pile[p])))
-        piles_rep = np.array(piles_rep)
-        table_rep = encode_cards(state['table'])
-        rep = [hand_rep, table_rep]
-        rep.extend(piles_rep)
-        obs = np.array(rep)
+        counts = [state['hand_counts'], state['table_counts']] + state['piles_counts']
+        if obs_out is None:
+            obs = encode_counts(counts)
+        else:
+            obs = encode_counts(counts, self._get_obs_array((6, 34, 4), int, obs_out))
 
         extracted_state = {'obs': obs, 'legal_actions': self._get_legal_actions()}
         extracted_state['raw_obs'] = state
@@ -75,11 +76,8 @@ class MahjongEnv(Env):
         '''
         action = self.de_action_id[action_id]
         if action_id < 34:
-            candidates = self.game.get_legal_actions(self.game.get_state(self.game.round.current_player))
-            for card in candidates:
-                if card.get_str() == action:
-                    action = card
-                    break
+            self._get_legal_actions()
+            action = self._legal_cards.get(action_id, action)
         return action
 
     def _get_legal_actions(self):
@@ -92,13 +90,21 @@ class MahjongEnv(Env):
             print(legal_actions)
             legal_actions (list): a list of legal actions' id
         '''
+        state = self.game.cur_state
+        if self._legal_state is state:
+            return self._legal_actions
         legal_action_id = {}
-        legal_actions = self.game.get_legal_actions(self.game.get_state(self.game.round.current_player))
+        legal_cards = {}
+        # Pass a copy, get_legal_actions writes the legal actions in the state
+        legal_actions = self.game.get_legal_actions(dict(state))
         if legal_actions:
             for action in legal_actions:
                 if isinstance(action, Card):
-                    action = action.get_str()
-                action_id = self.action_id[action]
+                    # The id of a card action is the id of its tile
+                    action_id = action.tile_id
+                    legal_cards.setdefault(action_id, action)
+                else:
+                    action_id = self.action_id[action]
                 legal_action_id[action_id] = None
         else:
             print("##########################")
@@ -108,4 +114,5 @@ class MahjongEnv(Env):
             print([len(p.pile) for p in self.game.players])
             #print(self.game.get_state(self.game.round.current_player))
             #exit()
-        return OrderedDict(legal_action_id)
+        self._legal_state, self._legal_actions, self._legal_cards = state, OrderedDict(legal_action_id), legal_cards
+        return self._legal_actions
@@ -42,13 +42,14 @@ class NolimitholdemEnv(Env):
         '''
         return self.game.get_legal_actions()
 
-    def _extract_state(self, state):
+    def _extract_state(self, state, obs_out=None):
         ''' Extract the state representation from state dictionary for agent
 
         Note: Currently the use the hand cards and the public cards. TODO: encode the states
 
         Args:
             state (dict): Original state from the game
+            obs_out (numpy.array): The array to write the observation into, see `Env._extract_state`
 
         Returns:
             observation (list): combine the player's score and dealer's observable score for observation
@@ -64,7 +65,7 @@ class NolimitholdemEnv(Env):
         all_chips = state['all_chips']
         cards = public_cards + hand
         idx = [self.card2index[card] for card in cards]
-        obs = np.zeros(54)
+        obs = self._get_obs_array((54,), float, obs_out)
         obs[idx] = 1
         obs[52] = float(my_chips)
         obs[53] = float(max(all_chips))
@@ -3,8 +3,8 @@ from collections import OrderedDict
 
 from rlcard.envs import Env
 from rlcard.games.uno import Game
-from rlcard.games.uno.utils import encode_hand, encode_target
-from rlcard.games.uno.utils import ACTION_SPACE, ACTION_LIST
+from rlcard.games.uno.utils import encode_hand_counts
+from rlcard.games.uno.utils import ACTION_LIST
 from rlcard.games.uno.utils import cards2list
 
 DEFAULT_GAME_CONFIG = {
@@ -21,10 +21,10 @@ class UnoEnv(Env):
         self.state_shape = [[4, 4, 15] for _ in range(self.num_players)]
         self.action_shape = [None for _ in range(self.num_players)]
 
-    def _extract_state(self, state):
-        obs = np.zeros((4, 4, 15), dtype=int)
-        encode_hand(obs[:3], state['hand'])
-        encode_target(obs[3], state['target'])
+    def _extract_state(self, state, obs_out=None):
+        obs = self._get_obs_array((4, 4, 15), int, obs_out)
+        encode_hand_counts(obs[:3], state['hand_counts'])
+        obs[3].flat[state['target_code']] = 1
         legal_action_id = self._get_legal_actions()
         extracted_state = {'obs': obs, 'legal_actions': legal_action_id}
         extracted_state['raw_obs'] = state
@@ -45,8 +45,7 @@ class UnoEnv(Env):
         return ACTION_LIST[np.random.choice(legal_ids)]
 
     def _get_legal_actions(self):
-        legal_actions = self.game.get_legal_actions()
-        legal_ids = {ACTION_SPACE[action]: None for action in legal_actions}
+        legal_ids = {action_id: None for action_id in self.game.get_legal_action_ids()}
         return OrderedDict(legal_ids)
 
     def get_perfect_information(self):
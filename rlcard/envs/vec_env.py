@@ -0,0 +1,194 @@
+import numpy as np
+
+from rlcard.envs.registration import make
+
+class VectorEnv(object):
+    '''
+    Hold several independent copies of a registered environment and
+    step them in lockstep. Finished games are reset automatically, and
+    the agents are handed stacked observations so that a single forward
+    pass can serve all the tables that are waiting for the same player.
+    '''
+    def __init__(self, env_id, num_envs, config={}):
+        ''' Initialize the vectorized environment
+
+        Args:
+            env_id (string): The name of the registered environment
+            num_envs (int): The number of copies of the environment
+            config (dict): A config dictionary passed to `rlcard.make`.
+                If 'seed' is given, the i-th copy is seeded with 'seed' + i
+        '''
+        self.env_id = env_id
+        self.num_envs = num_envs
+        self.envs = []
+        for i in range(num_envs):
+            _config = config.copy()
+            if _config.get('seed') is not None:
+                _config['seed'] = _config['seed'] + i
+            self.envs.append(make(env_id, _config))
+
+        self.num_players = self.envs[0].num_players
+        self.num_actions = self.envs[0].num_actions
+        self.state_shape = self.envs[0].state_shape
+        self.action_shape = self.envs[0].action_shape
+
+        self.states = [None for _ in range(num_envs)]
+        self.player_ids = np.zeros(num_envs, dtype=np.int64)
+
+    def set_agents(self, agents):
+        '''
+        Set the agents that will interact with the environments.
+        This function must be called before `run`.
+
+        Args:
+            agents (list): List of Agent classes
+        '''
+        self.agents = agents
+
+    def reset(self):
+        ''' Start a new game in every copy
+
+        Returns:
+            (tuple): Tuple containing:
+
+                (list): The begining states of the games
+                (numpy.array): The begining players of the games
+        '''
+        for i, env in enumerate(self.envs):
+            self.states[i], self.player_ids[i] = env.reset()
+        return self.states, self.player_ids
+
+    def step(self, actions, raw_action=False):
+        ''' Step forward all the copies. The games that are over
+            are reset automatically.
+
+        Args:
+            actions (list): The actions taken by the current player of each copy
+            raw_action (boolean): True if the actions are raw actions
+
+        Returns:
+            (tuple): Tuple containing:
+
+                (list): The next states. For a finished game it is the
+                    begining state of the new game
+                (numpy.array): The IDs of the next players
+                (numpy.array): A boolean array, True if the game of the copy is over
+                (list): The payoffs of the finished games, None for the others
+        '''
+        dones = np.zeros(self.num_envs, dtype=bool)
+        payoffs = [None for _ in range(self.num_envs)]
+        for i, env in enumerate(self.envs):
+            self.states[i], self.player_ids[i] = env.step(actions[i], raw_action)
+            if env.is_over():
+                dones[i] = True
+                payoffs[i] = env.get_payoffs()
+                self.states[i], self.player_ids[i] = env.reset()
+        return self.states, self.player_ids, dones, payoffs
+
+    def stack_states(self, states):
+        ''' Stack a list of states into a batch
+
+        Args:
+            states (list): A list of states that share the same state shape
+
+        Returns:
+            (dict): A dictionary containing:
+
+                'obs' (numpy.array): The observations, (N, *state_shape)
+                'legal_actions' (numpy.array): A boolean mask of the legal actions, (N, num_actions)
+                'states' (list): The original states
+        '''
+        batch = {}
+        batch['obs'] = np.stack([state['obs'] for state in states])
+        batch['legal_actions'] = np.zeros((len(states), self.num_actions), dtype=bool)
+        for i, state in enumerate(states):
+            batch['legal_actions'][i, list(state['legal_actions'])] = True
+        batch['states'] = states
+        return batch
+
+    def run(self, num_games, is_training=False):
+        '''
+        Run the copies in lockstep until `num_games` complete games
+        have been played. At every lockstep, the tables waiting for the
+        same player are stacked and passed to the agent in one batch if
+        the agent implements `eval_step_batch` (or `step_batch` for
+        training). Otherwise, the agent is called state by state.
+
+        Exactly `num_games` games are started: a table is not reset once
+        that many games have been started, and the games in flight are
+        played to the end, so that short games are not over-represented.
+
+        Args:
+            num_games (int): The number of games to play.
+            is_training (boolean): True if for training purpose.
+
+        Returns:
+            (tuple) Tuple containing:
+
+                (list): A list of trajectories, one for each game, in the
+                    same format as `Env.run`, in the order the games finish.
+                (list): A list of payoffs, one for each game.
+        '''
+        all_trajectories, all_payoffs = [], []
+        trajectories = [[[] for _ in range(self.num_players)] for _ in range(self.num_envs)]
+        num_tables = min(self.num_envs, num_games)
+        states, player_ids = self.states, self.player_ids
+        for i in range(num_tables):
+            states[i], player_ids[i] = self.envs[i].reset()
+            trajectories[i][player_ids[i]].append(states[i])
+        # The tables with a game in flight
+        active = np.zeros(self.num_envs, dtype=bool)
+        active[:num_tables] = True
+        num_started = num_tables
+
+        while active.any():
+            actions = [None for _ in range(self.num_envs)]
+            for player_id in range(self.num_players):
+                indices = np.flatnonzero(active & (player_ids == player_id))
+                if len(indices) == 0:
+                    continue
+                _actions = self._act(player_id, [states[i] for i in indices], is_training)
+                for i, action in zip(indices, _actions):
+                    actions[i] = action
+
+            for i in np.flatnonzero(active):
+                env = self.envs[i]
+                player_id = player_ids[i]
+                state, next_player_id = env.step(actions[i], self.agents[player_id].use_raw)
+                trajectories[i][player_id].append(actions[i])
+                if env.is_over():
+                    for p in range(self.num_players):
+                        trajectories[i][p].append(env.get_state(p))
+                    all_trajectories.append(trajectories[i])
+                    all_payoffs.append(env.get_payoffs())
+                    trajectories[i] = [[] for _ in range(self.num_players)]
+                    if num_started == num_games:
+                        active[i] = False
+                        continue
+                    state, next_player_id = env.reset()
+                    num_started += 1
+                states[i], player_ids[i] = state, next_player_id
+                trajectories[i][next_player_id].append(state)
+
+        return all_trajectories, all_payoffs
+
+    def _act(self, player_id, states, is_training):
+        ''' Query the agent of a player on a list of states
+
+        Args:
+            player_id (int): The player id
+            states (list): The states of the tables waiting for this player
+            is_training (boolean): True if for training purpose.
+
+        Returns:
+            (list): The actions for each state
+        '''
+        agent = self.agents[player_id]
+        if not is_training and hasattr(agent, 'eval_step_batch'):
+            actions, _ = agent.eval_step_batch(self.stack_states(states))
+            return actions
+        if is_training and hasattr(agent, 'step_batch'):
+            return agent.step_batch(self.stack_states(states))
+        if not is_training:
+            return [agent.eval_step(state)[0] for state in states]
+        return [agent.step(state) for state in states]
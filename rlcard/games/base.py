@@ -50,3 +50,81 @@ class Card:
             string: the combination of suit and rank of a card. Eg: 1S, 2H, AD, BJ, RJ...
         '''
         return self.suit+self.rank
+
+class UndoLog:
+    '''
+    UndoLog is a journal of inverse deltas used to step back a game.
+    Before a step, the game opens an entry with `begin` and records the
+    fields that the step may change. `undo` replays the records of the
+    last entry in reverse order, so that stepping back costs as much as
+    the fields that were recorded instead of a copy of the whole game.
+    '''
+    _ATTRS, _LIST, _TAIL = 0, 1, 2
+
+    def __init__(self):
+        ''' Initialize an empty journal
+        '''
+        self.records = []
+        self.marks = []
+
+    def __len__(self):
+        ''' The number of steps that can be undone
+        '''
+        return len(self.marks)
+
+    def begin(self):
+        ''' Open the entry of a new step
+        '''
+        self.marks.append(len(self.records))
+
+    def record_attrs(self, obj, *names):
+        ''' Record the current values of some attributes of an object
+
+        Args:
+            obj (object): The object
+            names (str): The names of the attributes
+        '''
+        self.records.append((UndoLog._ATTRS, obj, [(name, getattr(obj, name)) for name in names]))
+
+    def record_list(self, seq):
+        ''' Record the whole content of a list. Use it for small lists
+            that may be changed anywhere, e.g., a hand
+
+        Args:
+            seq (list): The list
+        '''
+        self.records.append((UndoLog._LIST, seq, seq[:]))
+
+    def record_tail(self, seq, size=0):
+        ''' Record the length and the last `size` items of a list. Use it
+            for lists that are only changed at the end, e.g., a deck that
+            deals at most `size` cards, or a list that is only appended (size=0)
+
+        Args:
+            seq (list): The list
+            size (int): The maximum number of items that may be popped in the step
+        '''
+        index = max(len(seq) - size, 0)
+        self.records.append((UndoLog._TAIL, seq, (index, seq[index:])))
+
+    def undo(self):
+        ''' Revert the last step
+
+        Returns:
+            (bool): True if there was a step to revert
+        '''
+        if not self.marks:
+            return False
+        start = self.marks.pop()
+        records = self.records
+        while len(records) > start:
+            kind, obj, data = records.pop()
+            if kind == UndoLog._ATTRS:
+                for name, value in data:
+                    setattr(obj, name, value)
+            elif kind == UndoLog._LIST:
+                obj[:] = data
+            else:
+                index, tail = data
+                obj[index:] = tail
+        return True
@@ -1,6 +1,6 @@
-from copy import deepcopy
 import numpy as np
 
+from rlcard.games.base import UndoLog
 from rlcard.games.blackjack import Dealer
 from rlcard.games.blackjack import Player
 from rlcard.games.blackjack import Judger
@@ -48,7 +48,7 @@ class BlackjackGame:
         for i in range(self.num_players):
             self.winner['player' + str(i)] = 0
 
-        self.history = []
+        self.history = UndoLog()
         self.game_pointer = 0
 
         return self.get_state(self.game_pointer), self.game_pointer
@@ -64,10 +64,17 @@ class BlackjackGame:
             int: next plater's id
         '''
         if self.allow_step_back:
-            p = deepcopy(self.players[self.game_pointer])
-            d = deepcopy(self.dealer)
-            w = deepcopy(self.winner)
-            self.history.append((d, p, w))
+            # First record what this step may change. The winner dict is
+            # copied on write so that the judger does not change the recorded one
+            player = self.players[self.game_pointer]
+            self.history.begin()
+            self.history.record_attrs(self, 'game_pointer', 'winner')
+            self.history.record_attrs(player, 'status', 'score')
+            self.history.record_tail(player.hand)
+            self.history.record_attrs(self.dealer, 'status', 'score')
+            self.history.record_tail(self.dealer.hand)
+            self.history.record_list(self.dealer.deck)
+            self.winner = dict(self.winner)
 
         next_state = {}
         # Play hit
@@ -128,11 +135,7 @@ class BlackjackGame:
         Returns:
             Status (bool): check if the step back is success or not
         '''
-        #while len(self.history) > 0:
-        if len(self.history) > 0:
-            self.dealer, self.players[self.game_pointer], self.winner = self.history.pop()
-            return True
-        return False
+        return self.history.undo()
 
     def get_num_players(self):
         ''' Return the number of players in blackjack
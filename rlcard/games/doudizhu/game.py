@@ -67,8 +67,6 @@ class DoudizhuGame:
         # perfrom action
         player = self.players[self.round.current_player]
         self.round.proceed_round(player, action)
-        if (action != 'pass'):
-            self.judger.calc_playable_cards(player)
         if self.judger.judge_game(self.players, self.round.current_player):
             self.winner_id = self.round.current_player
         next_id = (player.player_id+1) % len(self.players)
@@ -100,10 +98,6 @@ class DoudizhuGame:
             self.players[player_id].played_cards = self.round.find_last_played_cards_in_trace(player_id)
         self.players[player_id].play_back()
 
-        #reverse judger.played_cards if needed
-        if (cards != 'pass'):
-            self.judger.restore_playable_cards(player_id)
-
         self.state = self.get_state(self.round.current_player)
         return True
 
@@ -1,13 +1,14 @@
 # -*- coding: utf-8 -*-
 ''' Implement Doudizhu Judger class
 '''
+import warnings
 import numpy as np
 import collections
 from itertools import combinations
 from bisect import bisect_left
 
 from rlcard.games.doudizhu.utils import CARD_RANK_STR, CARD_RANK_STR_INDEX
-from rlcard.games.doudizhu.utils import cards2str, contains_cards
+from rlcard.games.doudizhu.utils import cards2str
 
 
 
@@ -258,78 +259,21 @@ class DoudizhuJudger:
         return playable_cards
 
     def __init__(self, players, np_random):
-        ''' Initilize the Judger class for Dou Dizhu
+        ''' Initilize the Judger class for Dou Dizhu. The legal moves are
+            generated by the players from the compiled move tables, so the
+            judger only keeps the players for `playable_cards`
         '''
-        self.playable_cards = [set() for _ in range(3)]
-        self._recorded_removed_playable_cards = [[] for _ in range(3)]
-        for player in players:
-            player_id = player.player_id
-            current_hand = cards2str(player.current_hand)
-            self.playable_cards[player_id] = self.playable_cards_from_hand(current_hand)
+        self.players = players
 
-    def calc_playable_cards(self, player):
-        ''' Recalculate all legal cards the player can play according to his
-        current hand.
-
-        Args:
-            player (DoudizhuPlayer object): object of DoudizhuPlayer
-            init_flag (boolean): For the first time, set it True to accelerate
-              the preocess.
-
-        Returns:
-            list: list of string of playable cards
-        '''
-        removed_playable_cards = []
-
-        player_id = player.player_id
-        current_hand = cards2str(player.current_hand)
-        missed = None
-        for single in player.singles:
-            if single not in current_hand:
-                missed = single
-                break
-
-        playable_cards = self.playable_cards[player_id].copy()
-
-        if missed is not None:
-            position = player.singles.find(missed)
-            player.singles = player.singles[position+1:]
-            for cards in playable_cards:
-                if missed in cards or (not contains_cards(current_hand, cards)):
-                    removed_playable_cards.append(cards)
-                    self.playable_cards[player_id].remove(cards)
-        else:
-            for cards in playable_cards:
-                if not contains_cards(current_hand, cards):
-                    #del self.playable_cards[player_id][cards]
-                    removed_playable_cards.append(cards)
-                    self.playable_cards[player_id].remove(cards)
-        self._recorded_removed_playable_cards[player_id].append(removed_playable_cards)
-        return self.playable_cards[player_id]
-
-    def restore_playable_cards(self, player_id):
-        ''' restore playable_cards for judger for game.step_back().
-
-        Args:
-            player_id: The id of the player whose playable_cards need to be restored
-        '''
-        removed_playable_cards = self._recorded_removed_playable_cards[player_id].pop()
-        self.playable_cards[player_id].update(removed_playable_cards)
-
-    def get_playable_cards(self, player):
-        ''' Provide all legal cards the player can play according to his
-        current hand.
-
-        Args:
-            player (DoudizhuPlayer object): object of DoudizhuPlayer
-            init_flag (boolean): For the first time, set it True to accelerate
-              the preocess.
-
-        Returns:
-            list: list of string of playable cards
+    @property
+    def playable_cards(self):
+        ''' (list): The set of the playable cards of each player, computed
+            from the current hands. Deprecated, the legal moves are given
+            by `DoudizhuPlayer.available_actions`
         '''
-        return self.playable_cards[player.player_id]
-
+        warnings.warn('DoudizhuJudger.playable_cards is deprecated, use DoudizhuPlayer.available_actions',
+                      DeprecationWarning, stacklevel=2)
+        return [self.playable_cards_from_hand(cards2str(player.current_hand)) for player in self.players]
 
     @staticmethod
     def judge_game(players, player_id):
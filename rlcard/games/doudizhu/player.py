@@ -3,8 +3,8 @@
 '''
 import functools
 
-from rlcard.games.doudizhu.utils import get_gt_cards
-from rlcard.games.doudizhu.utils import cards2str, doudizhu_sort_card
+from rlcard.games.doudizhu.utils import get_playable_action_ids, get_gt_action_ids
+from rlcard.games.doudizhu.utils import cards2str, doudizhu_sort_card, get_action_space
 
 
 class DoudizhuPlayer:
@@ -63,17 +63,29 @@ class DoudizhuPlayer:
         Args:
             greater_player (DoudizhuPlayer object): player who played
         current biggest cards.
-            judger (DoudizhuJudger object): object of DoudizhuJudger
+            judger (DoudizhuJudger object): Not used, the actions are
+        generated from the bitmask tables of the action space
 
         Returns:
             list: list of string of actions. Eg: ['pass', '8', '9', 'T', 'J']
         '''
-        actions = []
+        id_2_action = get_action_space()[0]
+        return [id_2_action[action_id] for action_id in self.available_action_ids(greater_player)]
+
+    def available_action_ids(self, greater_player=None):
+        ''' Get the ids of the actions can be made based on the rules
+
+        Args:
+            greater_player (DoudizhuPlayer object): player who played
+        current biggest cards.
+
+        Returns:
+            list: list of action ids
+        '''
+        current_hand = cards2str(self._current_hand)
         if greater_player is None or greater_player.player_id == self.player_id:
-            actions = judger.get_playable_cards(self)
-        else:
-            actions = get_gt_cards(self, greater_player)
-        return actions
+            return get_playable_action_ids(current_hand).tolist()
+        return get_gt_action_ids(current_hand, greater_player.played_cards)
 
     def play(self, action, greater_player=None):
         ''' Perfrom action
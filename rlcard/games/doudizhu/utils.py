@@ -2,40 +2,259 @@
 '''
 import os
 import json
+import hashlib
+import tempfile
+import bisect
 from collections import OrderedDict
 import threading
 import collections
+import shutil
+
+import numpy as np
 
 import rlcard
 
 # Read required docs
 ROOT_PATH = rlcard.__path__[0]
+JSONDATA_PATH = os.path.join(ROOT_PATH, 'games/doudizhu/jsondata')
+
+# The action space, the card types and the action features are compiled once
+# from the json docs into integer arrays, which are memory-mapped read-only
+# from a cache in the jsondata directory, so that the processes share their
+# pages. They are loaded on first use, and the names below are computed from
+# them on first access.
+_LAZY_NAMES = ('ID_2_ACTION', 'ACTION_2_ID', 'CARD_TYPE', 'TYPE_CARD')
+
+_TABLE_NAMES = ('actions', 'type_names', 'types', 'weights', 'card_type_order', 'type_card_order', 'masks',
+                'action_features')
+
+# The version of the layout of the compiled tables, the caches of other
+# versions are not used
+_TABLES_VERSION = 2
+
+_TABLES = None
+_CARD_TYPE_DICTS = None
+
+def _extract_jsondata():
+    ''' Extract the json docs from the zip archive if they are missing
+    '''
+    for name in ['action_space.txt', 'card_type.json', 'type_card.json']:
+        if not os.path.isfile(os.path.join(JSONDATA_PATH, name)):
+            import zipfile
+            with zipfile.ZipFile(os.path.join(ROOT_PATH, 'games/doudizhu/jsondata.zip'),"r") as zip_ref:
+                zip_ref.extractall(os.path.join(ROOT_PATH, 'games/doudizhu/'))
+            return
+
+def _compile_tables():
+    ''' Compile the json docs into integer arrays
+
+    Returns:
+        dict: The arrays, with keys:
+            'actions' (numpy.array): The bytes of each action, ordered by id, 'pass' is the last one
+            'type_names' (numpy.array): The bytes of the card types, in the order of type_card.json
+            'types' (numpy.array): The card type of each action id, -1 for pass
+            'weights' (numpy.array): The weight of each action id in its type, -1 for pass
+            'card_type_order' (numpy.array): The action ids in the order of card_type.json
+            'type_card_order' (numpy.array): The action ids in the order of type_card.json
+            'masks' (numpy.array): The bitmask of `cards2mask` of each action id, 0 for pass
+            'action_features' (numpy.array): The 54 features of each action id, the count of
+                each rank from 3 to 2 as ones in a column of 4, then the black and red jokers
+    '''
+    _extract_jsondata()
+    with open(os.path.join(JSONDATA_PATH, 'action_space.txt'), 'r') as f:
+        id_2_action = f.readline().strip().split()
+    action_2_id = {action: i for i, action in enumerate(id_2_action)}
+    with open(os.path.join(JSONDATA_PATH, 'card_type.json'), 'r') as f:
+        card_type = json.load(f, object_pairs_hook=OrderedDict)
+    with open(os.path.join(JSONDATA_PATH, 'type_card.json'), 'r') as f:
+        type_card = json.load(f, object_pairs_hook=OrderedDict)
+
+    type_names = list(type_card)
+    type_ids = {card_type: i for i, card_type in enumerate(type_names)}
+    types = np.full(len(id_2_action), -1, dtype=np.int8)
+    weights = np.full(len(id_2_action), -1, dtype=np.int8)
+    type_card_order = []
+    for name, candidate in type_card.items():
+        for weight, cards_list in candidate.items():
+            for cards in cards_list:
+                action_id = action_2_id[cards]
+                types[action_id] = type_ids[name]
+                weights[action_id] = int(weight)
+                type_card_order.append(action_id)
+    masks = np.array([cards2mask(action) for action in id_2_action[:-1]] + [0], dtype=np.uint64)
+    # The features are the bits of the masks, the jokers have one bit out of 4
+    bits = np.unpackbits(masks.astype('<u8').view(np.uint8).reshape(-1, 8), axis=1, bitorder='little')
+    action_features = np.concatenate((bits[:, :53], bits[:, 56:57]), axis=1).astype(np.int8)
+    return {'actions': np.array(id_2_action, dtype=np.bytes_),
+            'type_names': np.array(type_names, dtype=np.bytes_),
+            'types': types,
+            'weights': weights,
+            'card_type_order': np.array([action_2_id[cards] for cards in card_type], dtype=np.int32),
+            'type_card_order': np.array(type_card_order, dtype=np.int32),
+            'masks': masks,
+            'action_features': action_features}
+
+def _get_tables_stamp():
+    ''' Get the stamp of the compiled tables, which changes with their
+    layout and with the json docs
+
+    Returns:
+        (str): The format version and the hash of jsondata.zip
+    '''
+    with open(os.path.join(ROOT_PATH, 'games/doudizhu/jsondata.zip'), 'rb') as f:
+        digest = hashlib.sha1(f.read()).hexdigest()
+    return 'v{}-{}'.format(_TABLES_VERSION, digest[:16])
+
+def _load_cached_tables(path, stamp):
+    ''' Memory-map the cached tables read-only
+
+    Args:
+        path (str): The directory of the cache
+        stamp (str): The stamp of `_get_tables_stamp`
+
+    Returns:
+        (dict): The arrays of `_compile_tables`, or None if the cache is
+        missing, incomplete or of another stamp
+    '''
+    try:
+        # The stamp is written last, it marks a complete cache
+        with open(os.path.join(path, 'stamp.txt'), 'r') as f:
+            if f.read() != stamp:
+                return None
+        # Plain ndarray views avoid the overhead of indexing np.memmap
+        return {name: np.asarray(np.load(os.path.join(path, name + '.npy'), mmap_mode='r'))
+                for name in _TABLE_NAMES}
+    except (OSError, ValueError):
+        return None
+
+def _cache_tables(tables, path, stamp):
+    ''' Publish the tables in the cache directory atomically. They are
+    written to a private directory, which is renamed over a missing or
+    incomplete cache. A complete cache is never deleted, the tables of
+    another process that cached them first are used instead
+
+    Args:
+        tables (dict): The arrays of `_compile_tables`
+        path (str): The directory of the cache
+        stamp (str): The stamp of `_get_tables_stamp`
+
+    Returns:
+        (dict): The tables to use
+    '''
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = tempfile.mkdtemp(prefix='.tmp-', dir=os.path.dirname(path))
+    except OSError:
+        # Read-only installation, keep the tables in memory
+        return tables
+    try:
+        os.chmod(tmp_path, 0o755)
+        for name, array in tables.items():
+            np.save(os.path.join(tmp_path, name + '.npy'), array)
+        with open(os.path.join(tmp_path, 'stamp.txt'), 'w') as f:
+            f.write(stamp)
+        try:
+            os.replace(tmp_path, path)
+            return tables
+        except OSError:
+            # The directory exists, it is not replaced unless it is incomplete
+            cached_tables = _load_cached_tables(path, stamp)
+            if cached_tables is not None:
+                return cached_tables
+        stale_path = tmp_path + '.stale'
+        os.replace(path, stale_path)
+        if _load_cached_tables(stale_path, stamp) is not None:
+            # Another process completed the cache in the meantime, put it back
+            os.replace(stale_path, path)
+        else:
+            shutil.rmtree(stale_path, ignore_errors=True)
+            os.replace(tmp_path, path)
+        return tables
+    except OSError:
+        cached_tables = _load_cached_tables(path, stamp)
+        return tables if cached_tables is None else cached_tables
+    finally:
+        shutil.rmtree(tmp_path, ignore_errors=True)
+
+def _get_tables():
+    ''' Load the compiled tables once, compiling and caching them in the
+    jsondata directory if needed
+
+    Returns:
+        dict: The arrays of `_compile_tables`, and
+            'id_2_action' (list): The actions, ordered by id
+            'action_2_id' (dict): action -> id
+    '''
+    global _TABLES
+    if _TABLES is None:
+        stamp = _get_tables_stamp()
+        path = os.path.join(JSONDATA_PATH, 'tables', stamp)
+        tables = _load_cached_tables(path, stamp)
+        if tables is None:
+            tables = _compile_tables()
+            for array in tables.values():
+                array.setflags(write=False)
+            tables = _cache_tables(tables, path, stamp)
+        id_2_action = [action.decode() for action in tables['actions'].tolist()]
+        tables['id_2_action'] = id_2_action
+        tables['action_2_id'] = {action: i for i, action in enumerate(id_2_action)}
+        _TABLES = tables
+    return _TABLES
+
+def get_action_features():
+    ''' Get the features of all the actions, shared read-only by the processes
+
+    Returns:
+        numpy.array: The (number of actions, 54) int8 features, indexed by action id
+    '''
+    return _get_tables()['action_features']
+
+def _get_card_type_dicts():
+    ''' Build the dicts of the card types once from the compiled tables
+
+    Returns:
+        tuple: (CARD_TYPE, TYPE_CARD), where CARD_TYPE is a map of cards to
+        their types, as a dict, a list and a set to accelerate, and
+        TYPE_CARD is a map of a type to its cards by weight
+    '''
+    global _CARD_TYPE_DICTS
+    if _CARD_TYPE_DICTS is None:
+        tables = _get_tables()
+        id_2_action = tables['id_2_action']
+        type_names = [name.decode() for name in tables['type_names'].tolist()]
+        types = tables['types'].tolist()
+        weights = [str(weight) for weight in tables['weights'].tolist()]
+
+        card_type = OrderedDict((id_2_action[i], [[type_names[types[i]], weights[i]]])
+                                for i in tables['card_type_order'].tolist())
+        type_card = OrderedDict((name, OrderedDict()) for name in type_names)
+        for i in tables['type_card_order'].tolist():
+            type_card[type_names[types[i]]].setdefault(weights[i], []).append(id_2_action[i])
+        _CARD_TYPE_DICTS = ((card_type, list(card_type), set(card_type)), type_card)
+    return _CARD_TYPE_DICTS
+
+def get_action_space():
+    ''' Get the action space of Doudizhu
 
-if not os.path.isfile(os.path.join(ROOT_PATH, 'games/doudizhu/jsondata/action_space.txt')) \
-        or not os.path.isfile(os.path.join(ROOT_PATH, 'games/doudizhu/jsondata/card_type.json')) \
-        or not os.path.isfile(os.path.join(ROOT_PATH, 'games/doudizhu/jsondata/type_card.json')):
-    import zipfile
-    with zipfile.ZipFile(os.path.join(ROOT_PATH, 'games/doudizhu/jsondata.zip'),"r") as zip_ref:
-        zip_ref.extractall(os.path.join(ROOT_PATH, 'games/doudizhu/'))
-
-# Action space
-action_space_path = os.path.join(ROOT_PATH, 'games/doudizhu/jsondata/action_space.txt')
-with open(action_space_path, 'r') as f:
-    ID_2_ACTION = f.readline().strip().split()
-    ACTION_2_ID = {}
-    for i, action in enumerate(ID_2_ACTION):
-        ACTION_2_ID[action] = i
-
-# a map of card to its type. Also return both dict and list to accelerate
-card_type_path = os.path.join(ROOT_PATH, 'games/doudizhu/jsondata/card_type.json')
-with open(card_type_path, 'r') as f:
-    data = json.load(f, object_pairs_hook=OrderedDict)
-    CARD_TYPE = (data, list(data), set(data))
-
-# a map of type to its cards
-type_card_path = os.path.join(ROOT_PATH, 'games/doudizhu/jsondata/type_card.json')
-with open(type_card_path, 'r') as f:
-    TYPE_CARD = json.load(f, object_pairs_hook=OrderedDict)
+    Returns:
+        tuple: (ID_2_ACTION, ACTION_2_ID), the list of the actions ordered
+        by id and the dict of the ids of the actions
+    '''
+    tables = _get_tables()
+    return tables['id_2_action'], tables['action_2_id']
+
+def __getattr__(name):
+    if name in ('ID_2_ACTION', 'ACTION_2_ID'):
+        value = get_action_space()[_LAZY_NAMES.index(name)]
+    elif name in ('CARD_TYPE', 'TYPE_CARD'):
+        value = _get_card_type_dicts()[_LAZY_NAMES.index(name) - 2]
+    else:
+        raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+    globals()[name] = value
+    return value
+
+def __dir__():
+    return sorted(list(globals()) + list(_LAZY_NAMES))
 
 # rank list of solo character of cards
 CARD_RANK_STR = ['3', '4', '5', '6', '7', '8', '9', 'T', 'J', 'Q', 'K',
@@ -238,9 +457,10 @@ def get_gt_cards(player, greater_player):
     '''
     # add 'pass' to legal actions
     gt_cards = ['pass']
+    card_type, type_card = _get_card_type_dicts()
     current_hand = cards2str(player.current_hand)
     target_cards = greater_player.played_cards
-    target_types = CARD_TYPE[0][target_cards]
+    target_types = card_type[0][target_cards]
     type_dict = {}
     for card_type, weight in target_types:
         if card_type not in type_dict:
@@ -251,7 +471,7 @@ def get_gt_cards(player, greater_player):
     if 'bomb' not in type_dict:
         type_dict['bomb'] = -1
     for card_type, weight in type_dict.items():
-        candidate = TYPE_CARD[card_type]
+        candidate = type_card[card_type]
         for can_weight, cards_list in candidate.items():
             if int(can_weight) > int(weight):
                 for cards in cards_list:
@@ -260,3 +480,105 @@ def get_gt_cards(player, greater_player):
                         # if self.contains_cards(current_hand, cards):
                         gt_cards.append(cards)
     return gt_cards
+
+def cards2mask(cards):
+    ''' Pack the counts of the ranks of cards into a bitmask. Each rank
+    has 4 bits, and a count of n sets its n lowest bits, so that a set of
+    cards is contained in another one if its bitmask is a subset.
+
+    Args:
+        cards (string): A string representing the cards, eg: '33366'
+
+    Returns:
+        int: The bitmask
+    '''
+    counts = [0] * len(CARD_RANK_STR)
+    for card in cards:
+        counts[CARD_RANK_STR_INDEX[card]] += 1
+    mask = 0
+    for rank, count in enumerate(counts):
+        mask |= ((1 << count) - 1) << (4 * rank)
+    return mask
+
+_MOVE_TABLES = None
+
+# Below this number of candidates, the bitmasks are tested in pure Python
+_NUMPY_MIN_CANDIDATES = 64
+
+def _get_move_tables():
+    ''' Build the tables of the legal-move generator once
+
+    Returns:
+        dict: The tables, with keys:
+            'masks' (numpy.array): The bitmask of each action id, 0 for pass (the last id)
+            'type_ids' (dict): card type -> numpy array of action ids sorted by weight
+            'type_weights' (dict): card type -> list of the sorted weights of `type_ids`
+            'type_masks' (dict): card type -> list of the bitmasks of `type_ids`
+    '''
+    global _MOVE_TABLES
+    if _MOVE_TABLES is None:
+        tables = _get_tables()
+        masks = tables['masks']
+        type_ids, type_weights, type_masks = {}, {}, {}
+        ordered_types = tables['types'][tables['type_card_order']]
+        for type_id, card_type in enumerate(tables['type_names'].tolist()):
+            ids = tables['type_card_order'][ordered_types == type_id].astype(np.int64)
+            order = np.argsort(tables['weights'][ids], kind='stable')
+            card_type = card_type.decode()
+            type_ids[card_type] = ids[order]
+            type_weights[card_type] = tables['weights'][type_ids[card_type]].tolist()
+            type_masks[card_type] = masks[type_ids[card_type]].tolist()
+        _MOVE_TABLES = {'masks': masks, 'type_ids': type_ids,
+                        'type_weights': type_weights, 'type_masks': type_masks}
+    return _MOVE_TABLES
+
+def get_playable_action_ids(current_hand):
+    ''' Provide the ids of all the actions that can be played with a hand,
+    when leading a round. It is the same set as
+    `DoudizhuJudger.playable_cards_from_hand`, in increasing id order.
+
+    Args:
+        current_hand (string): A string representing the cards of the hand
+
+    Returns:
+        numpy.array: The action ids, without pass
+    '''
+    masks = _get_move_tables()['masks'][:-1]
+    complement = np.uint64(~cards2mask(current_hand) & 0xFFFFFFFFFFFFFFFF)
+    return np.flatnonzero((masks & complement) == 0)
+
+def get_gt_action_ids(current_hand, target_cards):
+    ''' Provide the ids of the actions of a hand which are greater than
+    the cards played by the previous player in one round. It is the same
+    set as `get_gt_cards`.
+
+    Args:
+        current_hand (string): A string representing the cards of the hand
+        target_cards (string): The cards played by the greater player
+
+    Returns:
+        list: The action ids, starting with pass
+    '''
+    tables = _get_move_tables()
+    action_tables = _get_tables()
+    gt_ids = [action_tables['action_2_id']['pass']]
+    # Each action has a single card type
+    target_id = action_tables['action_2_id'][target_cards]
+    card_type = action_tables['type_names'][action_tables['types'][target_id]].decode()
+    type_dict = {card_type: int(action_tables['weights'][target_id])}
+    if 'rocket' in type_dict:
+        return gt_ids
+    type_dict['rocket'] = -1
+    if 'bomb' not in type_dict:
+        type_dict['bomb'] = -1
+    complement = ~cards2mask(current_hand) & 0xFFFFFFFFFFFFFFFF
+    for card_type, weight in type_dict.items():
+        start = bisect.bisect_right(tables['type_weights'][card_type], weight)
+        action_ids = tables['type_ids'][card_type][start:]
+        if len(action_ids) < _NUMPY_MIN_CANDIDATES:
+            masks = tables['type_masks'][card_type][start:]
+            gt_ids.extend(action_id for action_id, mask in zip(action_ids.tolist(), masks) if not mask & complement)
+        else:
+            masks = tables['masks'][action_ids]
+            gt_ids.extend(action_ids[(masks & np.uint64(complement)) == 0].tolist())
+    return list(dict.fromkeys(gt_ids))
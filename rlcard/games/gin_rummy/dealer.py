@@ -4,7 +4,10 @@
     Date created: 2/12/2020
 '''
 
+from rlcard.games.base import Card
+
 from .player import GinRummyPlayer
+from .utils import bitboard
 from .utils import utils as utils
 
 
@@ -19,6 +22,9 @@ class GinRummyDealer:
         self.shuffled_deck = utils.get_deck()  # keep a copy of the shuffled cards at start of new hand
         self.np_random.shuffle(self.shuffled_deck)
         self.stock_pile = self.shuffled_deck.copy()  # type: List[Card]
+        # bitboard masks of stock_pile and discard_pile
+        self.stock_mask = bitboard.get_mask(self.stock_pile)
+        self.discard_mask = 0
 
     def deal_cards(self, player: GinRummyPlayer, num: int):
         ''' Deal some cards from stock_pile to one player
@@ -28,5 +34,25 @@ class GinRummyDealer:
             num (int): The number of cards to be dealt
         '''
         for _ in range(num):
-            player.hand.append(self.stock_pile.pop())
+            player.hand.append(self.draw_card())
         player.did_populate_hand()
+
+    def draw_card(self) -> Card:
+        ''' Pop the top card of stock_pile
+        '''
+        card = self.stock_pile.pop()
+        self.stock_mask ^= bitboard.get_card_bit(card)
+        return card
+
+    def pick_up_discard(self) -> Card:
+        ''' Pop the top card of discard_pile
+        '''
+        card = self.discard_pile.pop()
+        self.discard_mask ^= bitboard.get_card_bit(card)
+        return card
+
+    def discard(self, card: Card):
+        ''' Push card on discard_pile
+        '''
+        self.discard_pile.append(card)
+        self.discard_mask |= bitboard.get_card_bit(card)
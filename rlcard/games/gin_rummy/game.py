@@ -6,10 +6,13 @@
 
 import numpy as np
 
+from rlcard.games.base import UndoLog
+
 from .player import GinRummyPlayer
 from .round import GinRummyRound
 from .judge import GinRummyJudge
 from .utils.settings import Settings, DealerForRound
+from .utils import bitboard
 
 from .utils.action_event import *
 
@@ -27,6 +30,7 @@ class GinRummyGame:
         self.settings = Settings()
         self.actions = None  # type: List[ActionEvent] or None # must reset in init_game
         self.round = None  # round: GinRummyRound or None, must reset in init_game
+        self.history = UndoLog()  # must reset in init_game
         self.num_players = 2
 
     def init_game(self):
@@ -43,6 +47,7 @@ class GinRummyGame:
             num = 11 if i == 0 else 10
             player = self.round.players[(dealer_id + 1 + i) % 2]
             self.round.dealer.deal_cards(player=player, num=num)
+        self.history = UndoLog()
         current_player_id = self.round.current_player_id
         state = self.get_state(player_id=current_player_id)
         return state, current_player_id
@@ -50,6 +55,8 @@ class GinRummyGame:
     def step(self, action: ActionEvent):
         ''' Perform game action and return next player number, and the state for next player
         '''
+        if self.allow_step_back:
+            self._record_step()
         if isinstance(action, ScoreNorthPlayerAction):
             self.round.score_player_0(action)
         elif isinstance(action, ScoreSouthPlayerAction):
@@ -75,8 +82,11 @@ class GinRummyGame:
 
     def step_back(self):
         ''' Takes one step backward and restore to the last state
+
+        Returns:
+            (bool): True if the game steps back successfully
         '''
-        raise NotImplementedError
+        return self.history.undo()
 
     def get_num_players(self):
         ''' Return the number of players in the game
@@ -119,9 +129,12 @@ class GinRummyGame:
             opponent_id = (player_id + 1) % 2
             opponent = self.round.players[opponent_id]
             known_cards = opponent.known_cards
+            known_mask = opponent.known_mask
             if isinstance(last_action, ScoreNorthPlayerAction) or isinstance(last_action, ScoreSouthPlayerAction):
                 known_cards = opponent.hand
-            unknown_cards = self.round.dealer.stock_pile + [card for card in opponent.hand if card not in known_cards]
+                known_mask = opponent.hand_mask
+            unknown_cards = self.round.dealer.stock_pile + \
+                [card for card in opponent.hand if not known_mask & bitboard.get_card_bit(card)]
             state['player_id'] = self.round.current_player_id
             state['hand'] = [x.get_index() for x in self.round.players[self.round.current_player_id].hand]
             state['top_discard'] = [x.get_index() for x in top_discard]
@@ -141,3 +154,22 @@ class GinRummyGame:
             action (ActionEvent): the action that will be passed to the game engine.
         '''
         return ActionEvent.decode_action(action_id=action_id)
+
+    def _record_step(self):
+        # Record what the next step may change: an action only changes the round, the dealer piles
+        # and the current player, and the lists of actions and moves are only appended
+        history = self.history
+        history.begin()
+        history.record_tail(self.actions)
+        history.record_attrs(self.round, 'current_player_id', 'is_over', 'going_out_action', 'going_out_player_id')
+        history.record_tail(self.round.move_sheet)
+        dealer = self.round.dealer
+        history.record_attrs(dealer, 'stock_mask', 'discard_mask')
+        history.record_tail(dealer.stock_pile, 1)
+        history.record_tail(dealer.discard_pile, 1)
+        current_player = self.round.get_current_player()
+        history.record_attrs(current_player, 'hand_mask', 'known_mask')
+        history.record_list(current_player.hand)
+        history.record_list(current_player.known_cards)
+        history.record_list(current_player.meld_kinds_by_rank_id)
+        history.record_list(current_player.meld_run_by_suit_id)
@@ -12,11 +12,9 @@ from typing import List, Tuple
 
 from .utils.action_event import *
 from .utils.scorers import GinRummyScorer
-from .utils import melding
+from .utils import bitboard
 from .utils.gin_rummy_error import GinRummyProgramError
 
-from rlcard.games.gin_rummy.utils import utils
-
 
 class GinRummyJudge:
 
@@ -43,10 +41,12 @@ class GinRummyJudge:
             current_player = self.game.get_current_player()
             going_out_deadwood_count = self.game.settings.going_out_deadwood_count
             hand = current_player.hand
-            meld_clusters = current_player.get_meld_clusters()  # improve speed 2020-Apr
-            knock_cards, gin_cards = _get_going_out_cards(meld_clusters=meld_clusters,
-                                                          hand=hand,
-                                                          going_out_deadwood_count=going_out_deadwood_count)
+            meld_clusters = bitboard.get_clusters(current_player.get_melds())  # improve speed 2020-Apr
+            knock_mask, gin_mask = bitboard.get_going_out_masks_for_clusters(current_player.hand_mask,
+                                                                             meld_clusters,
+                                                                             going_out_deadwood_count)
+            knock_cards = bitboard.get_cards(knock_mask)
+            gin_cards = bitboard.get_cards(gin_mask)
             if self.game.settings.is_allowed_gin and gin_cards:
                 legal_actions = [GinAction()]
             else:
@@ -105,11 +105,8 @@ def get_going_out_cards(hand: List[Card], going_out_deadwood_count: int) -> Tupl
     '''
     if not len(hand) == 11:
         raise GinRummyProgramError("len(hand) is {}: should be 11.".format(len(hand)))
-    meld_clusters = melding.get_meld_clusters(hand=hand)
-    knock_cards, gin_cards = _get_going_out_cards(meld_clusters=meld_clusters,
-                                                  hand=hand,
-                                                  going_out_deadwood_count=going_out_deadwood_count)
-    return list(knock_cards), list(gin_cards)
+    knock_mask, gin_mask = bitboard.get_going_out_masks(bitboard.get_mask(hand), going_out_deadwood_count)
+    return bitboard.get_cards(knock_mask), bitboard.get_cards(gin_mask)
 
 
 #
@@ -127,29 +124,9 @@ def _get_going_out_cards(meld_clusters: List[List[List[Card]]],
     '''
     if not len(hand) == 11:
         raise GinRummyProgramError("len(hand) is {}: should be 11.".format(len(hand)))
-    knock_cards = set()
-    gin_cards = set()
-    for meld_cluster in meld_clusters:
-        meld_cards = [card for meld_pile in meld_cluster for card in meld_pile]
-        hand_deadwood = [card for card in hand if card not in meld_cards]  # hand has 11 cards
-        if len(hand_deadwood) == 0:
-            # all 11 cards are melded;
-            # take gin_card as first card of first 4+ meld;
-            # could also take gin_card as last card of 4+ meld, but won't do this.
-            for meld_pile in meld_cluster:
-                if len(meld_pile) >= 4:
-                    gin_cards.add(meld_pile[0])
-                    break
-        elif len(hand_deadwood) == 1:
-            card = hand_deadwood[0]
-            gin_cards.add(card)
-        else:
-            hand_deadwood_values = [utils.get_deadwood_value(card) for card in hand_deadwood]
-            hand_deadwood_count = sum(hand_deadwood_values)
-            max_hand_deadwood_value = max(hand_deadwood_values, default=0)
-            if hand_deadwood_count <= 10 + max_hand_deadwood_value:
-                for card in hand_deadwood:
-                    next_deadwood_count = hand_deadwood_count - utils.get_deadwood_value(card)
-                    if next_deadwood_count <= going_out_deadwood_count:
-                        knock_cards.add(card)
-    return list(knock_cards), list(gin_cards)
+    meld_clusters = [tuple(bitboard.get_mask(meld_pile) for meld_pile in meld_cluster)
+                     for meld_cluster in meld_clusters]
+    knock_mask, gin_mask = bitboard.get_going_out_masks_for_clusters(bitboard.get_mask(hand),
+                                                                     meld_clusters,
+                                                                     going_out_deadwood_count)
+    return bitboard.get_cards(knock_mask), bitboard.get_cards(gin_mask)
@@ -75,7 +75,7 @@ class GinRummyRound:
         current_player = self.players[self.current_player_id]
         if not len(current_player.hand) == 10:
             raise GinRummyProgramError("len(current_player.hand) is {}: should be 10.".format(len(current_player.hand)))
-        card = self.dealer.stock_pile.pop()
+        card = self.dealer.draw_card()
         self.move_sheet.append(DrawCardMove(current_player, action=action, card=card))
         current_player.add_card_to_hand(card=card)
 
@@ -86,10 +86,10 @@ class GinRummyRound:
         current_player = self.players[self.current_player_id]
         if not len(current_player.hand) == 10:
             raise GinRummyProgramError("len(current_player.hand) is {}: should be 10.".format(len(current_player.hand)))
-        card = self.dealer.discard_pile.pop()
+        card = self.dealer.pick_up_discard()
         self.move_sheet.append(PickupDiscardMove(current_player, action, card=card))
         current_player.add_card_to_hand(card=card)
-        current_player.known_cards.append(card)
+        current_player.add_known_card(card=card)
 
     def declare_dead_hand(self, action: DeclareDeadHandAction):
         # when current_player takes DeclareDeadHandAction step, the move is recorded and executed
@@ -112,9 +112,8 @@ class GinRummyRound:
         self.move_sheet.append(DiscardMove(current_player, action))
         card = action.card
         current_player.remove_card_from_hand(card=card)
-        if card in current_player.known_cards:
-            current_player.known_cards.remove(card)
-        self.dealer.discard_pile.append(card)
+        current_player.remove_known_card(card=card)
+        self.dealer.discard(card=card)
         self.current_player_id = (self.current_player_id + 1) % 2
 
     def knock(self, action: KnockAction):
@@ -129,8 +128,7 @@ class GinRummyRound:
             raise GinRummyProgramError("len(current_player.hand) is {}: should be 11.".format(len(current_player.hand)))
         card = action.card
         current_player.remove_card_from_hand(card=card)
-        if card in current_player.known_cards:
-            current_player.known_cards.remove(card)
+        current_player.remove_known_card(card=card)
         self.current_player_id = 0
 
     def gin(self, action: GinAction, going_out_deadwood_count: int):
@@ -146,8 +144,7 @@ class GinRummyRound:
         _, gin_cards = judge.get_going_out_cards(current_player.hand, going_out_deadwood_count)
         card = gin_cards[0]
         current_player.remove_card_from_hand(card=card)
-        if card in current_player.known_cards:
-            current_player.known_cards.remove(card)
+        current_player.remove_known_card(card=card)
         self.current_player_id = 0
 
     def score_player_0(self, action: ScoreNorthPlayerAction):
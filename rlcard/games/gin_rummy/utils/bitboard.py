@@ -0,0 +1,293 @@
+'''
+    File name: gin_rummy/bitboard.py
+    Date created: 10/18/2026
+'''
+
+import functools
+import numpy as np
+from typing import Dict, Iterable, List, Tuple
+
+from rlcard.games.base import Card
+
+from . import utils
+
+# ===============================================================
+#    A set of cards is a 52-bit mask, the bit of a card being its card_id:
+#    rank_id + 13 * suit_id. The 13 bits of a suit are consecutive,
+#    and the bits of a rank are 13 bits apart.
+#
+#    All the melds of the deck are precomputed as masks, so that the melds
+#    of a hand, its meld clusters and its deadwood are found with bit operations.
+# ===============================================================
+
+SUIT_MASK = (1 << 13) - 1
+
+_DECK = [utils.get_card(card_id) for card_id in range(52)]  # type: List[Card]
+
+CARD_BITS = {card: 1 << card_id for card_id, card in enumerate(_DECK)}  # type: Dict[Card, int]
+
+# Card.__hash__ looks up the rank and the suit in lists, so the masks are built from (rank, suit)
+_RANK_SUIT_BITS = {(card.rank, card.suit): bit for card, bit in CARD_BITS.items()}
+
+# The deadwood value of each card_id
+CARD_VALUES = [utils.get_deadwood_value(card) for card in _DECK]
+
+# The masks of the cards of deadwood value at least 0, 1, ..., 11
+_VALUE_AT_LEAST_MASKS = [sum(1 << card_id for card_id in range(52) if CARD_VALUES[card_id] >= value)
+                         for value in range(12)]
+
+# The masks of the cards of each rank, over the 4 suits
+RANK_MASKS = [sum(1 << (rank_id + 13 * suit_id) for suit_id in range(4)) for rank_id in range(13)]
+
+
+def _get_suit_values() -> List[int]:
+    # deadwood value of each mask of the 13 cards of a suit
+    values = [0] * (1 << 13)
+    for bits in range(1, 1 << 13):
+        low_bit = bits & -bits
+        values[bits] = values[bits ^ low_bit] + CARD_VALUES[low_bit.bit_length() - 1]
+    return values
+
+
+_SUIT_VALUES = _get_suit_values()
+
+
+def _get_run_melds() -> List[int]:
+    result = []
+    for suit_id in range(4):
+        for start in range(11):
+            for end in range(start + 3, 14):
+                result.append(((1 << (end - start)) - 1) << (start + 13 * suit_id))
+    return result
+
+
+def _get_set_melds() -> List[int]:
+    result = []
+    for rank_mask in RANK_MASKS:
+        result.append(rank_mask)
+        result.extend(rank_mask ^ (1 << card_id) for card_id in range(52) if rank_mask >> card_id & 1)
+    return result
+
+
+RUN_MELDS = _get_run_melds()  # type: List[int]
+SET_MELDS = _get_set_melds()  # type: List[int]
+ALL_MELDS = RUN_MELDS + SET_MELDS  # type: List[int]
+
+
+def get_card_bit(card: Card) -> int:
+    return _RANK_SUIT_BITS[card.rank, card.suit]
+
+
+def get_mask(cards: Iterable[Card]) -> int:
+    mask = 0
+    for card in cards:
+        mask |= _RANK_SUIT_BITS[card.rank, card.suit]
+    return mask
+
+
+def get_cards(mask: int) -> List[Card]:
+    ''' Get the cards of a mask, ordered by card_id
+    '''
+    result = []
+    while mask:
+        low_bit = mask & -mask
+        result.append(_DECK[low_bit.bit_length() - 1])
+        mask ^= low_bit
+    return result
+
+
+def get_deadwood_count(mask: int) -> int:
+    ''' Get the sum of the deadwood values of the cards of a mask
+    '''
+    return _SUIT_VALUES[mask & SUIT_MASK] + _SUIT_VALUES[mask >> 13 & SUIT_MASK] + \
+        _SUIT_VALUES[mask >> 26 & SUIT_MASK] + _SUIT_VALUES[mask >> 39 & SUIT_MASK]
+
+
+@functools.lru_cache(maxsize=None)
+def _get_run_melds_for_suit(bits: int, shift: int) -> Tuple[int, ...]:
+    # run melds of the 13-bit mask of the suit at shift, in the order of RUN_MELDS
+    return tuple(meld << shift for meld in RUN_MELDS[:66] if meld & bits == meld)
+
+
+def get_melds(mask: int) -> List[int]:
+    ''' Get the masks of all the melds of a hand, runs first, in the order of ALL_MELDS
+    '''
+    spades = mask & SUIT_MASK
+    hearts = mask >> 13 & SUIT_MASK
+    diamonds = mask >> 26 & SUIT_MASK
+    clubs = mask >> 39 & SUIT_MASK
+    result = list(_get_run_melds_for_suit(spades, 0) + _get_run_melds_for_suit(hearts, 13) +
+                  _get_run_melds_for_suit(diamonds, 26) + _get_run_melds_for_suit(clubs, 39))
+    # the ranks held in at least 3 suits
+    rank_bits = (spades & hearts & (diamonds | clubs)) | (diamonds & clubs & (spades | hearts))
+    while rank_bits:
+        low_bit = rank_bits & -rank_bits
+        rank_bits ^= low_bit
+        result.extend(get_set_melds(mask, low_bit.bit_length() - 1))
+    return result
+
+
+def get_run_melds(mask: int, suit_id: int) -> Tuple[int, ...]:
+    ''' Get the masks of the run melds of a hand in a suit
+    '''
+    shift = 13 * suit_id
+    return _get_run_melds_for_suit(mask >> shift & SUIT_MASK, shift)
+
+
+def get_set_melds(mask: int, rank_id: int) -> List[int]:
+    ''' Get the masks of the set melds of a hand in a rank
+    '''
+    rank_mask = RANK_MASKS[rank_id]
+    kinds = mask & rank_mask
+    if kinds == rank_mask:
+        result = [kinds]
+        bits = kinds
+        while bits:
+            low_bit = bits & -bits
+            result.append(kinds ^ low_bit)
+            bits ^= low_bit
+        return result
+    if kinds and bin(kinds).count('1') == 3:
+        return [kinds]
+    return []
+
+
+def get_meld_clusters(mask: int) -> List[Tuple[int, ...]]:
+    ''' Get all the clusters of 1, 2 or 3 mutually disjoint melds of a hand
+
+    Returns:
+        (list): The clusters as tuples of meld masks, built from the melds in the order of
+            `get_melds`, the runs by suit and then the sets by rank_id. The sets are not
+            ordered by the rank string and the hand, so ties between the best clusters may
+            break differently than with the card lists
+    '''
+    return get_clusters(get_melds(mask))
+
+
+def get_clusters(melds: List[int]) -> List[Tuple[int, ...]]:
+    ''' Get all the clusters of 1, 2 or 3 mutually disjoint melds among melds
+    '''
+    result = []
+    melds_count = len(melds)
+    for i in range(melds_count):
+        first_meld = melds[i]
+        result.append((first_meld,))
+        for j in range(i + 1, melds_count):
+            second_meld = melds[j]
+            if second_meld & first_meld:
+                continue
+            result.append((first_meld, second_meld))
+            first_two_melds = first_meld | second_meld
+            for k in range(j + 1, melds_count):
+                third_meld = melds[k]
+                if not third_meld & first_two_melds:
+                    result.append((first_meld, second_meld, third_meld))
+    return result
+
+
+def get_min_deadwood_count(mask: int) -> int:
+    ''' Get the smallest deadwood count of a hand over all its meld clusters, including no meld.
+        A hand of at most 11 cards has at most 3 disjoint melds, so this is the deadwood count
+        of the best meld clusters, or of the hand if it has no meld.
+    '''
+    return _get_min_deadwood_count(mask, get_melds(mask), {})
+
+
+def _get_min_deadwood_count(mask: int, melds: List[int], memo: Dict[int, int]) -> int:
+    # either the lowest card of the hand is deadwood, or it is in a meld of the hand
+    low_bit = mask & -mask
+    if not low_bit:
+        return 0
+    if mask in memo:
+        return memo[mask]
+    result = CARD_VALUES[low_bit.bit_length() - 1] + _get_min_deadwood_count(mask ^ low_bit, melds, memo)
+    for meld in melds:
+        if result == 0:
+            break
+        if meld & low_bit and meld & mask == meld:
+            result = min(result, _get_min_deadwood_count(mask ^ meld, melds, memo))
+    memo[mask] = result
+    return result
+
+
+def get_going_out_masks(mask: int, going_out_deadwood_count: int) -> Tuple[int, int]:
+    ''' Get the cards of a hand of 11 cards that can be knocked and ginned, see judge.get_going_out_cards
+
+    Returns:
+        (tuple): The masks of the knock cards and of the gin cards
+    '''
+    return get_going_out_masks_for_clusters(mask, get_meld_clusters(mask), going_out_deadwood_count)
+
+
+def get_going_out_masks_for_clusters(mask: int,
+                                     meld_clusters: List[Tuple[int, ...]],
+                                     going_out_deadwood_count: int) -> Tuple[int, int]:
+    knock_mask = 0
+    gin_mask = 0
+    for meld_cluster in meld_clusters:
+        meld_mask = 0
+        for meld in meld_cluster:
+            meld_mask |= meld
+        deadwood = mask & ~meld_mask
+        if not deadwood:
+            # all 11 cards are melded;
+            # take gin_card as the lowest card of the first 4+ meld, which leaves a meld
+            for meld in meld_cluster:
+                if bin(meld).count('1') >= 4:
+                    gin_mask |= meld & -meld
+                    break
+        elif not deadwood & (deadwood - 1):
+            gin_mask |= deadwood
+        else:
+            deadwood_count = get_deadwood_count(deadwood)
+            if deadwood_count <= 10 + _get_max_deadwood_value(deadwood):
+                # knock cards are the deadwood cards of value at least deadwood_count - going_out_deadwood_count
+                knock_mask |= deadwood & _get_cards_of_value_at_least(deadwood_count - going_out_deadwood_count)
+    return knock_mask, gin_mask
+
+
+def encode_masks(masks: List[int]) -> np.ndarray:
+    ''' Encode masks as planes of 52 cards, like utils.encode_cards
+
+    Returns:
+        (np.ndarray): The len(masks) * 52 planes, 1 if card is in the mask else 0
+    '''
+    data = b''.join(mask.to_bytes(7, 'little') for mask in masks)
+    bits = np.unpackbits(np.frombuffer(data, dtype=np.uint8), bitorder='little')
+    return bits.reshape(len(masks), 56)[:, :52].astype(int)
+
+
+def update_encoded_masks(planes: np.ndarray, encoded_masks: List[int], masks: List[int]) -> np.ndarray:
+    ''' Update planes that encode masks, like encode_masks, in place, by flipping the bits of the
+        cards that changed. A move changes a few cards, so that this is cheaper than encoding the masks.
+
+    Args:
+        planes: The len(masks) * 52 planes, encoding encoded_masks
+        encoded_masks: The masks encoded by planes, set to masks
+        masks: The masks to encode
+
+    Returns:
+        (np.ndarray): planes
+    '''
+    for row, mask in enumerate(masks):
+        changed = mask ^ encoded_masks[row]
+        while changed:
+            low_bit = changed & -changed
+            changed ^= low_bit
+            card_id = low_bit.bit_length() - 1
+            planes[row, card_id] = mask >> card_id & 1
+        encoded_masks[row] = mask
+    return planes
+
+
+def _get_cards_of_value_at_least(value: int) -> int:
+    if value >= len(_VALUE_AT_LEAST_MASKS):
+        return 0
+    return _VALUE_AT_LEAST_MASKS[max(value, 0)]
+
+
+def _get_max_deadwood_value(mask: int) -> int:
+    for value in range(10, 0, -1):
+        if mask & _VALUE_AT_LEAST_MASKS[value]:
+            return value
+    return 0
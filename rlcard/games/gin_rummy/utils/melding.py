@@ -8,6 +8,7 @@ from typing import List
 
 from rlcard.games.base import Card
 
+from rlcard.games.gin_rummy.utils import bitboard
 from rlcard.games.gin_rummy.utils import utils
 from rlcard.games.gin_rummy.utils.gin_rummy_error import GinRummyProgramError
 
@@ -23,49 +24,32 @@ from rlcard.games.gin_rummy.utils.gin_rummy_error import GinRummyProgramError
 
 
 def get_meld_clusters(hand: List[Card]) -> List[List[List[Card]]]:
-    result = []  # type: List[List[List[Card]]]
-    all_run_melds = [frozenset(x) for x in get_all_run_melds(hand)]
-    all_set_melds = [frozenset(x) for x in get_all_set_melds(hand)]
-    all_melds = all_run_melds + all_set_melds
-    all_melds_count = len(all_melds)
-    for i in range(0, all_melds_count):
-        first_meld = all_melds[i]
-        first_meld_list = list(first_meld)
-        meld_cluster_1 = [first_meld_list]
-        result.append(meld_cluster_1)
-        for j in range(i + 1, all_melds_count):
-            second_meld = all_melds[j]
-            second_meld_list = list(second_meld)
-            if not second_meld.isdisjoint(first_meld):
-                continue
-            meld_cluster_2 = [first_meld_list, second_meld_list]
-            result.append(meld_cluster_2)
-            for k in range(j + 1, all_melds_count):
-                third_meld = all_melds[k]
-                third_meld_list = list(third_meld)
-                if not third_meld.isdisjoint(first_meld) or not third_meld.isdisjoint(second_meld):
-                    continue
-                meld_cluster_3 = [first_meld_list, second_meld_list, third_meld_list]
-                result.append(meld_cluster_3)
-    return result
+    meld_clusters = bitboard.get_meld_clusters(bitboard.get_mask(hand))
+    return [[bitboard.get_cards(meld) for meld in meld_cluster] for meld_cluster in meld_clusters]
 
 
 def get_best_meld_clusters(hand: List[Card]) -> List[List[List[Card]]]:
     if len(hand) != 10:
         raise GinRummyProgramError("Hand contain {} cards: should be 10 cards.".format(len(hand)))
     result = []  # type: List[List[List[Card]]]
-    meld_clusters = get_meld_clusters(hand=hand)  # type: List[List[List[Card]]]
-    meld_clusters_count = len(meld_clusters)
-    if meld_clusters_count > 0:
-        deadwood_counts = [utils.get_deadwood_count(hand=hand, meld_cluster=meld_cluster)
+    hand_mask = bitboard.get_mask(hand)
+    meld_clusters = bitboard.get_meld_clusters(hand_mask)
+    if meld_clusters:
+        deadwood_counts = [bitboard.get_deadwood_count(hand_mask & ~sum(meld_cluster))
                            for meld_cluster in meld_clusters]
         best_deadwood_count = min(deadwood_counts)
-        for i in range(meld_clusters_count):
-            if deadwood_counts[i] == best_deadwood_count:
-                result.append(meld_clusters[i])
+        for meld_cluster, deadwood_count in zip(meld_clusters, deadwood_counts):
+            if deadwood_count == best_deadwood_count:
+                result.append([bitboard.get_cards(meld) for meld in meld_cluster])
     return result
 
 
+def get_min_deadwood_count(hand: List[Card]) -> int:
+    ''' Get the deadwood count of the hand with its best meld cluster, or with no meld if it has none
+    '''
+    return bitboard.get_min_deadwood_count(bitboard.get_mask(hand))
+
+
 def get_all_run_melds(hand: List[Card]) -> List[List[Card]]:
     card_count = len(hand)
     hand_by_suit = sorted(hand, key=utils.get_card_id)
@@ -1,6 +1,6 @@
 import numpy as np
-from copy import copy
 
+from rlcard.games.base import UndoLog
 from rlcard.games.leducholdem import Dealer
 from rlcard.games.leducholdem import Player
 from rlcard.games.leducholdem import Judger
@@ -88,7 +88,7 @@ class LeducholdemGame(Game):
         self.round_counter = 0
 
         # Save the hisory for stepping back to the last state.
-        self.history = []
+        self.history = UndoLog()
 
         state = self.get_state(self.game_pointer)
 
@@ -107,16 +107,14 @@ class LeducholdemGame(Game):
                 (int): next plater's id
         '''
         if self.allow_step_back:
-            # First snapshot the current state
-            r = copy(self.round)
-            r_raised = copy(self.round.raised)
-            gp = self.game_pointer
-            r_c = self.round_counter
-            d_deck = copy(self.dealer.deck)
-            p = copy(self.public_card)
-            ps = [copy(self.players[i]) for i in range(self.num_players)]
-            ps_hand = [copy(self.players[i].hand) for i in range(self.num_players)]
-            self.history.append((r, r_raised, gp, r_c, d_deck, p, ps, ps_hand))
+            # First record what this step may change
+            self.history.begin()
+            self.history.record_attrs(self, 'game_pointer', 'round_counter', 'public_card')
+            self.history.record_attrs(self.round, 'game_pointer', 'raised', 'have_raised',
+                                      'not_raise_num', 'player_folded', 'raise_amount')
+            self.history.record_list(self.round.raised)
+            self.history.record_attrs(self.players[self.game_pointer], 'in_chips', 'status')
+            self.history.record_tail(self.dealer.deck, 1)
 
         # Then we proceed to the next round
         self.game_pointer = self.round.proceed_round(self.players, action)
@@ -183,11 +181,4 @@ class LeducholdemGame(Game):
         Returns:
             (bool): True if the game steps back successfully
         '''
-        if len(self.history) > 0:
-            self.round, r_raised, self.game_pointer, self.round_counter, d_deck, self.public_card, self.players, ps_hand = self.history.pop()
-            self.round.raised = r_raised
-            self.dealer.deck = d_deck
-            for i, hand in enumerate(ps_hand):
-                self.players[i].hand = hand
-            return True
-        return False
+        return self.history.undo()
@@ -0,0 +1,167 @@
+''' Equity of Texas Hold'em hands
+
+The equity of the hole cards of a player is the probability to win, tie
+and lose the showdown against a number of opponents with random hole cards,
+once the public cards are completed. The completions of the deck are
+either sampled or, on the turn and on the river against one opponent,
+enumerated, and all the showdowns are evaluated in a batch with
+`evaluator.evaluate_hands`.
+
+The results are cached by canonical boards: relabeling the suits does not
+change the equity, so the hole and public cards are mapped to the same
+key as all their suit-isomorphic variants.
+'''
+import itertools
+
+import numpy as np
+
+from rlcard.games.limitholdem.evaluator import cards2ids, evaluate_hands
+
+def canonical_cards(hole_ids, public_ids):
+    ''' Relabel the suits of the cards in a canonical order
+
+    The suits are ordered by the ranks of the hole cards and then of the
+    public cards that they hold. Suits with the same ranks are interchangeable.
+
+    Args:
+        hole_ids (list): The ids of the hole cards
+        public_ids (list): The ids of the public cards
+
+    Returns:
+        (tuple): Tuple containing:
+
+            (tuple): The sorted ids of the relabeled hole cards
+            (tuple): The sorted ids of the relabeled public cards
+    '''
+    signatures = []
+    for suit in range(4):
+        signatures.append((sorted(c % 13 for c in hole_ids if c // 13 == suit),
+                           sorted(c % 13 for c in public_ids if c // 13 == suit), suit))
+    new_suits = [0] * 4
+    for new_suit, (_, _, suit) in enumerate(sorted(signatures, reverse=True)):
+        new_suits[suit] = new_suit
+    hole = tuple(sorted(new_suits[c // 13] * 13 + c % 13 for c in hole_ids))
+    public = tuple(sorted(new_suits[c // 13] * 13 + c % 13 for c in public_ids))
+    return hole, public
+
+class EquityCalculator:
+    ''' Compute the win/tie/lose probabilities of hole cards
+    '''
+
+    def __init__(self, num_samples=1000, cache_size=100000, seed=None):
+        ''' Initialize the calculator
+
+        Args:
+            num_samples (int): The number of sampled showdowns of an estimation
+            cache_size (int): The maximum number of cached results, 0 disables the cache
+            seed (int): The seed of the sampling
+        '''
+        self.num_samples = num_samples
+        self.cache_size = cache_size
+        self.cache = {}
+        self.np_random = np.random.RandomState(seed)
+
+    def equity(self, hole_cards, public_cards=(), num_opponents=1, exact=None):
+        ''' Compute the equity of hole cards
+
+        Args:
+            hole_cards (list): The two hole cards, as Card objects, indices like 'SA' or ids
+            public_cards (list): The 0 to 5 public cards
+            num_opponents (int): The number of opponents
+            exact (bool): Enumerate all the showdowns instead of sampling them.
+                Only possible on the turn and on the river against one opponent.
+                Default is to enumerate whenever it is possible.
+
+        Returns:
+            (tuple): The probabilities to win, to tie and to lose
+        '''
+        hole_ids, public_ids = _to_ids(hole_cards), _to_ids(public_cards)
+        if len(hole_ids) != 2 or len(public_ids) > 5 or len(set(hole_ids + public_ids)) != len(hole_ids + public_ids):
+            raise ValueError('Expect 2 hole cards and up to 5 public cards, all different')
+        can_enumerate = len(public_ids) >= 4 and num_opponents == 1
+        if exact is None:
+            exact = can_enumerate
+        elif exact and not can_enumerate:
+            raise ValueError('Exact equity is only available on the turn and the river against one opponent')
+
+        hole_ids, public_ids = canonical_cards(hole_ids, public_ids)
+        key = (hole_ids, public_ids, num_opponents, 'exact' if exact else self.num_samples)
+        if key in self.cache:
+            return self.cache[key]
+
+        if exact:
+            hands = self._enumerate_hands(hole_ids, public_ids)
+        else:
+            hands = self._sample_hands(hole_ids, public_ids, num_opponents)
+        result = _showdown_probabilities(hands)
+
+        if self.cache_size > 0:
+            if len(self.cache) >= self.cache_size:
+                # Forget the oldest result
+                del self.cache[next(iter(self.cache))]
+            self.cache[key] = result
+        return result
+
+    def _sample_hands(self, hole_ids, public_ids, num_opponents):
+        ''' Sample the completions of the deck
+
+        Returns:
+            (numpy.array): The 7 cards of the player and of the opponents in each sample,
+                of shape (num_samples, num_opponents + 1, 7)
+        '''
+        deck = np.setdiff1d(np.arange(52), hole_ids + public_ids)
+        num_missing = 5 - len(public_ids)
+        num_draws = num_missing + 2 * num_opponents
+        draws = deck[self.np_random.rand(self.num_samples, len(deck)).argsort(axis=1)[:, :num_draws]]
+
+        hands = np.empty((self.num_samples, num_opponents + 1, 7), dtype=np.int64)
+        hands[:, :, :len(public_ids)] = public_ids
+        hands[:, :, len(public_ids):5] = draws[:, None, :num_missing]
+        hands[:, 0, 5:] = hole_ids
+        hands[:, 1:, 5:] = draws[:, num_missing:].reshape(self.num_samples, num_opponents, 2)
+        return hands
+
+    def _enumerate_hands(self, hole_ids, public_ids):
+        ''' Enumerate all the completions of the deck against one opponent
+
+        Returns:
+            (numpy.array): The 7 cards of the player and of the opponent in each showdown,
+                of shape (num_showdowns, 2, 7)
+        '''
+        deck = np.setdiff1d(np.arange(52), hole_ids + public_ids)
+        pairs = np.array(list(itertools.combinations(range(len(deck)), 2)))
+        if len(public_ids) == 5:
+            rows = deck[pairs]
+        else:
+            # The river card, then the opponent cards that are not the river card
+            rivers = np.arange(len(deck))[:, None]
+            valid = (pairs[None, :, 0] != rivers) & (pairs[None, :, 1] != rivers)
+            rows = np.concatenate([np.broadcast_to(rivers, valid.shape)[valid][:, None],
+                                   np.broadcast_to(pairs, valid.shape + (2,))[valid]], axis=1)
+            rows = deck[rows]
+
+        hands = np.empty((len(rows), 2, 7), dtype=np.int64)
+        hands[:, :, :len(public_ids)] = public_ids
+        hands[:, :, len(public_ids):5] = rows[:, None, :-2]
+        hands[:, 0, 5:] = hole_ids
+        hands[:, 1, 5:] = rows[:, -2:]
+        return hands
+
+def _to_ids(cards):
+    ''' Get the card ids of Card objects, card indices or card ids
+    '''
+    return [card if isinstance(card, (int, np.integer)) else cards2ids([card])[0] for card in cards]
+
+def _showdown_probabilities(hands):
+    ''' Get the frequencies of the player winning, tying and losing the showdowns
+
+    Args:
+        hands (numpy.array): The 7 cards of the player, then of the opponents,
+            of shape (num_showdowns, num_opponents + 1, 7)
+
+    Returns:
+        (tuple): The probabilities to win, to tie and to lose
+    '''
+    strengths = evaluate_hands(hands)
+    player, best_opponent = strengths[:, 0], strengths[:, 1:].max(axis=1)
+    return float(np.mean(player > best_opponent)), float(np.mean(player == best_opponent)), float(np.mean(player < best_opponent))
@@ -0,0 +1,194 @@
+''' Lookup-table evaluator of Texas Hold'em hands
+
+A hand of 5 to 7 cards is mapped to a single integer strength, so that a
+stronger hand always has a greater strength and equal hands have the same
+strength. The card ids are the indices of `card2index.json`, i.e. the order
+of `init_standard_deck`: suit in 'SHDC' times 13 plus rank in 'A23456789TJQK'.
+
+The strength is `category << 20` followed by up to five ranks of 4 bits that
+break the ties, where the category is the one of `utils.Hand` (1 is high
+card and 9 is straight flush). It is found with two tables:
+
+    1. Without a flush, the strength only depends on the ranks of the
+       cards. Each rank is given a prime number, so that the product of
+       the primes of a hand identifies its ranks (Cactus Kev's evaluator).
+       The strengths of all the products are precomputed.
+    2. A flush is found from the 13-bit rank mask of each suit. Since a
+       hand of 7 cards with a flush cannot have a full house or four of a
+       kind, the flush strength of the mask, if any, is the strength of
+       the hand.
+'''
+import itertools
+
+import numpy as np
+
+SUITS = 'SHDC'
+RANKS = 'A23456789TJQK'
+
+# Rank of each card id, 0 is a deuce and 12 is an ace
+CARD_RANKS = np.array([(RANKS.index(rank) - 1) % 13 for rank in RANKS] * 4, dtype=np.int64)
+CARD_SUITS = np.repeat(np.arange(4, dtype=np.int64), 13)
+CARD_IDS = {suit+rank: i for i, (suit, rank) in enumerate(itertools.product(SUITS, RANKS))}
+
+PRIMES = np.array([2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41], dtype=np.int64)
+
+HIGH_CARD, ONE_PAIR, TWO_PAIR, THREE_OF_A_KIND, STRAIGHT, FLUSH, FULL_HOUSE, FOUR_OF_A_KIND, STRAIGHT_FLUSH = range(1, 10)
+
+_CARD_PRIMES = PRIMES[CARD_RANKS].tolist()
+_CARD_BITS = (1 << CARD_RANKS).tolist()
+_CARD_SUITS = CARD_SUITS.tolist()
+
+_TABLES = None
+
+def _make_strength(category, ranks):
+    ''' Pack a category and the ranks that break the ties into a strength
+    '''
+    strength = category
+    for i in range(5):
+        strength = (strength << 4) | (ranks[i] if i < len(ranks) else 0)
+    return strength
+
+def _straight_high(mask):
+    ''' Get the highest rank of the best straight of a rank mask, or -1
+    '''
+    for high in range(12, 3, -1):
+        if (mask >> (high - 4)) & 0b11111 == 0b11111:
+            return high
+    # The wheel, A-2-3-4-5
+    if mask & 0b1000000001111 == 0b1000000001111:
+        return 3
+    return -1
+
+def _flush_strength(mask):
+    ''' Get the strength of the cards of a suit given by their rank mask
+    '''
+    high = _straight_high(mask)
+    if high >= 0:
+        return _make_strength(STRAIGHT_FLUSH, [high])
+    ranks = [r for r in range(12, -1, -1) if mask >> r & 1]
+    return _make_strength(FLUSH, ranks[:5])
+
+def _rank_strength(counts):
+    ''' Get the strength of a hand without flush given by its rank counts
+    '''
+    # The ranks ordered by count, then by rank
+    groups = sorted(((c, r) for r, c in enumerate(counts) if c > 0), reverse=True)
+    ranks = [r for _, r in groups]
+    mask = sum(1 << r for r in ranks)
+    top = groups[0][0]
+    second = groups[1][0] if len(groups) > 1 else 0
+
+    if top == 4:
+        return _make_strength(FOUR_OF_A_KIND, [ranks[0], max(ranks[1:])])
+    if top == 3 and second >= 2:
+        return _make_strength(FULL_HOUSE, [ranks[0], max(r for c, r in groups[1:] if c >= 2)])
+    high = _straight_high(mask)
+    if high >= 0:
+        return _make_strength(STRAIGHT, [high])
+    if top == 3:
+        return _make_strength(THREE_OF_A_KIND, [ranks[0]] + sorted(ranks[1:], reverse=True)[:2])
+    if top == 2 and second == 2:
+        return _make_strength(TWO_PAIR, ranks[:2] + [max(ranks[2:])])
+    if top == 2:
+        return _make_strength(ONE_PAIR, [ranks[0]] + sorted(ranks[1:], reverse=True)[:3])
+    return _make_strength(HIGH_CARD, sorted(ranks, reverse=True)[:5])
+
+def _get_tables():
+    ''' Build the lookup tables once
+
+    Returns:
+        (dict): A dict with
+
+            'products' (numpy.array): The sorted prime products of all the ranks of 5 to 7 cards
+            'strengths' (numpy.array): The strength without flush of each product
+            'flushes' (numpy.array): The flush strength of each rank mask of a suit, 0 if no flush
+            'product2strength' (dict): Same as `products` and `strengths`, for single hands
+            'flush_list' (list): Same as `flushes`, for single hands
+    '''
+    global _TABLES
+    if _TABLES is None:
+        product2strength = {}
+        primes = PRIMES.tolist()
+        for num_cards in range(5, 8):
+            for ranks in itertools.combinations_with_replacement(range(13), num_cards):
+                counts = [0] * 13
+                for r in ranks:
+                    counts[r] += 1
+                if max(counts) > 4:
+                    continue
+                product = 1
+                for r in ranks:
+                    product *= primes[r]
+                product2strength[product] = _rank_strength(counts)
+        products = np.array(sorted(product2strength), dtype=np.int64)
+        strengths = np.array([product2strength[p] for p in products.tolist()], dtype=np.int64)
+
+        flush_list = [0] * (1 << 13)
+        for mask in range(1 << 13):
+            if bin(mask).count('1') >= 5:
+                flush_list[mask] = _flush_strength(mask)
+
+        _TABLES = {'products': products, 'strengths': strengths,
+                   'flushes': np.array(flush_list, dtype=np.int64),
+                   'product2strength': product2strength, 'flush_list': flush_list}
+    return _TABLES
+
+def cards2ids(cards):
+    ''' Get the ids of a list of cards
+
+    Args:
+        cards (list): Card objects, or card indices like 'SA'
+
+    Returns:
+        (list): The card ids
+    '''
+    return [CARD_IDS[card if isinstance(card, str) else card.suit+card.rank] for card in cards]
+
+def evaluate_hand(card_ids):
+    ''' Evaluate a single hand
+
+    Args:
+        card_ids (list): The ids of 5 to 7 cards
+
+    Returns:
+        (int): The strength of the hand
+    '''
+    tables = _get_tables()
+    product = 1
+    suit_masks = [0, 0, 0, 0]
+    for card in card_ids:
+        product *= _CARD_PRIMES[card]
+        suit_masks[_CARD_SUITS[card]] |= _CARD_BITS[card]
+    flush_list = tables['flush_list']
+    return max(tables['product2strength'][product], *[flush_list[mask] for mask in suit_masks])
+
+def evaluate_hands(card_ids):
+    ''' Evaluate a batch of hands
+
+    Args:
+        card_ids (numpy.array): The card ids of the hands, of shape (..., num_cards)
+            with 5 to 7 cards in each hand
+
+    Returns:
+        (numpy.array): The int64 strengths of the hands, of shape (...)
+    '''
+    tables = _get_tables()
+    card_ids = np.asarray(card_ids)
+    if not 5 <= card_ids.shape[-1] <= 7:
+        raise ValueError('A hand should have 5 to 7 cards, got {}'.format(card_ids.shape[-1]))
+
+    ranks = CARD_RANKS[card_ids]
+    products = PRIMES[ranks].prod(axis=-1)
+    strengths = tables['strengths'][np.searchsorted(tables['products'], products)]
+
+    bits = 1 << ranks
+    suits = CARD_SUITS[card_ids]
+    for suit in range(4):
+        suit_masks = np.where(suits == suit, bits, 0).sum(axis=-1)
+        np.maximum(strengths, tables['flushes'][suit_masks], out=strengths)
+    return strengths
+
+def get_category(strength):
+    ''' Get the category of a strength, 1 for high card to 9 for straight flush
+    '''
+    return strength >> 20
@@ -1,6 +1,6 @@
-from copy import deepcopy, copy
 import numpy as np
 
+from rlcard.games.base import UndoLog
 from rlcard.games.limitholdem import Dealer
 from rlcard.games.limitholdem import Player, PlayerStatus
 from rlcard.games.limitholdem import Judger
@@ -93,7 +93,7 @@ class LimitHoldemGame:
         self.round_counter = 0
 
         # Save the history for stepping back to the last state.
-        self.history = []
+        self.history = UndoLog()
 
         state = self.get_state(self.game_pointer)
 
@@ -116,15 +116,16 @@ class LimitHoldemGame:
                 (int): next player id
         """
         if self.allow_step_back:
-            # First snapshot the current state
-            r = deepcopy(self.round)
-            b = self.game_pointer
-            r_c = self.round_counter
-            d = deepcopy(self.dealer)
-            p = deepcopy(self.public_cards)
-            ps = deepcopy(self.players)
-            rn = copy(self.history_raise_nums)
-            self.history.append((r, b, r_c, d, p, ps, rn))
+            # First record what this step may change
+            self.history.begin()
+            self.history.record_attrs(self, 'game_pointer', 'round_counter')
+            self.history.record_attrs(self.round, 'game_pointer', 'raised', 'have_raised',
+                                      'not_raise_num', 'player_folded', 'raise_amount')
+            self.history.record_list(self.round.raised)
+            self.history.record_list(self.history_raise_nums)
+            self.history.record_attrs(self.players[self.game_pointer], 'in_chips', 'status')
+            self.history.record_tail(self.public_cards)
+            self.history.record_tail(self.dealer.deck, 3)
 
         # Then we proceed to the next round
         self.game_pointer = self.round.proceed_round(self.players, action)
@@ -162,11 +163,7 @@ class LimitHoldemGame:
         Returns:
             (bool): True if the game steps back successfully
         """
-        if len(self.history) > 0:
-            self.round, self.game_pointer, self.round_counter, self.dealer, self.public_cards, \
-                self.players, self.history_raises_nums = self.history.pop()
-            return True
-        return False
+        return self.history.undo()
 
     def get_num_players(self):
         """
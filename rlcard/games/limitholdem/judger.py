@@ -1,6 +1,7 @@
-from rlcard.games.limitholdem.utils import compare_hands
 import numpy as np
 
+from rlcard.games.limitholdem.evaluator import cards2ids, evaluate_hand
+
 
 class LimitHoldemJudger:
     """The Judger class for limit texas holdem"""
@@ -19,10 +20,7 @@ class LimitHoldemJudger:
         Returns:
             (list): Each entry of the list corresponds to one entry of the
         """
-        # Convert the hands into card indexes
-        hands = [[card.get_index() for card in hand] if hand is not None else None for hand in hands]
-
-        winners = compare_hands(hands)
+        winners = self.get_winners(hands)
 
         in_chips = [p.in_chips for p in players]
         each_win = self.split_pots_among_players(in_chips, winners)
@@ -33,6 +31,24 @@ class LimitHoldemJudger:
         assert sum(payoffs) == 0
         return payoffs
 
+    @staticmethod
+    def get_winners(hands):
+        """
+        Find the winners of the showdown with the lookup-table evaluator.
+
+        Args:
+            hands (list): The cards of each player, None if the player folded
+
+        Returns:
+            (list): 1 if the player is among the winners else 0
+        """
+        if sum(hand is not None for hand in hands) == 1:
+            # The others folded, the hand of the winner is not evaluated
+            return [int(hand is not None) for hand in hands]
+        strengths = [evaluate_hand(cards2ids(hand)) if hand is not None else -1 for hand in hands]
+        best = max(strengths)
+        return [int(strength == best) for strength in strengths]
+
     def split_pot_among_players(self, in_chips, winners):
         """
         Splits the next (side) pot among players.
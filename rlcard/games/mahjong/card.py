@@ -15,6 +15,7 @@ class MahjongCard:
         self.type = card_type
         self.trait = trait
         self.index_num = 0
+        self.tile_id = None
 
     def get_str(self):
         ''' Get the string representation of card
@@ -27,5 +28,13 @@ class MahjongCard:
     def set_index_num(self, index_num):
 
         self.index_num = index_num
+
+    def set_tile_id(self, tile_id):
+        ''' Set the id of the tile, its index in the vectors of tile counts
+
+        Args:
+            tile_id (int): The index of the card in `card_encoding_dict`
+        '''
+        self.tile_id = tile_id
         
 
@@ -1,4 +1,5 @@
 from rlcard.games.mahjong.utils import init_deck
+from rlcard.games.mahjong.decomposer import NUM_TILES
 
 
 class MahjongDealer:
@@ -9,6 +10,8 @@ class MahjongDealer:
         self.deck = init_deck()
         self.shuffle()
         self.table = []
+        # The number of each tile on the table
+        self.table_counts = [0] * NUM_TILES
 
     def shuffle(self):
         ''' Shuffle the deck
@@ -23,7 +26,9 @@ class MahjongDealer:
             num (int): The number of cards to be dealed
         '''
         for _ in range(num):
-            player.hand.append(self.deck.pop())
+            card = self.deck.pop()
+            player.hand.append(card)
+            player.hand_counts[card.tile_id] += 1
 
 
 ## For test
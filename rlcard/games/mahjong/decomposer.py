@@ -0,0 +1,141 @@
+''' Decomposition of Mahjong hands into sets
+
+A hand is a vector of 34 tile counts, indexed like `card_encoding_dict`:
+bamboo, characters and dots 1 to 9, then the dragons and the winds. A set
+is a pong (three identical tiles) or, in a suit, a chow (three consecutive
+tiles). Chows do not cross the suits, so the hand splits into independent
+groups: the 9 tiles of each suit, and the 7 honor tiles.
+
+The best decompositions of a group only depend on its counts. They are
+memoized by group and counts, so that after a few games a hand is
+decomposed with one lookup per group. The decompositions of the recent
+hands are memoized too, since the game judges all the hands after each
+step while only one of them has changed.
+'''
+import functools
+
+from rlcard.games.mahjong.utils import card_encoding_dict
+
+NUM_TILES = 34
+
+# The (start, stop, chows) of the groups of tiles
+GROUPS = [(0, 9, True), (9, 18, True), (18, 27, True), (27, NUM_TILES, False)]
+
+def cards2counts(cards):
+    ''' Count the tiles of a list of cards
+
+    Args:
+        cards (list): MahjongCard objects, or their strings like 'bamboo-1'
+
+    Returns:
+        (list): The 34 tile counts
+    '''
+    counts = [0] * NUM_TILES
+    for card in cards:
+        counts[card_encoding_dict[card if isinstance(card, str) else card.get_str()]] += 1
+    return counts
+
+@functools.lru_cache(maxsize=None)
+def _best_sets(counts, chows):
+    ''' Find a maximum set of disjoint sets in the tiles of a group
+
+    Args:
+        counts (tuple): The tile counts of the group
+        chows (bool): Whether chows are allowed
+
+    Returns:
+        (tuple): The sets, as tuples of the indices of their tiles in the group
+    '''
+    first = next((i for i, count in enumerate(counts) if count > 0), None)
+    if first is None:
+        return ()
+    # The first tile is either left over, or in a pong or a chow starting with it
+    left = list(counts)
+    left[first] -= 1
+    best = _best_sets(tuple(left), chows)
+    if counts[first] >= 3:
+        left = list(counts)
+        left[first] -= 3
+        sets = ((first,) * 3,) + _best_sets(tuple(left), chows)
+        if len(sets) > len(best):
+            best = sets
+    if chows and first + 2 < len(counts) and counts[first + 1] > 0 and counts[first + 2] > 0:
+        left = list(counts)
+        for i in range(first, first + 3):
+            left[i] -= 1
+        sets = ((first, first + 1, first + 2),) + _best_sets(tuple(left), chows)
+        if len(sets) > len(best):
+            best = sets
+    return best
+
+@functools.lru_cache(maxsize=None)
+def _decompose_group(counts, start, chows):
+    ''' Find the best decompositions of a group without and with a pair
+
+    Args:
+        counts (tuple): The tile counts of the group
+        start (int): The first tile of the group
+        chows (bool): Whether chows are allowed
+
+    Returns:
+        (tuple): Tuple containing:
+
+            (tuple): The sets of the best decomposition without pair, as tuples of tiles
+            (int): The tile of the pair of the best decomposition with a pair, or -1 if there is no pair
+            (tuple): The sets of the best decomposition with a pair
+    '''
+    pair, pair_sets = -1, ()
+    for i, count in enumerate(counts):
+        if count >= 2:
+            left = list(counts)
+            left[i] -= 2
+            sets = _best_sets(tuple(left), chows)
+            if pair < 0 or len(sets) > len(pair_sets):
+                pair, pair_sets = i, sets
+    def to_tiles(sets):
+        return tuple(tuple(start + tile for tile in tile_set) for tile_set in sets)
+    return to_tiles(_best_sets(counts, chows)), start + pair if pair >= 0 else -1, to_tiles(pair_sets)
+
+def decompose(counts):
+    ''' Decompose a hand into a pair and the maximum number of sets
+
+    Args:
+        counts (list): The 34 tile counts of the hand
+
+    Returns:
+        (tuple): Tuple containing:
+
+            (int): The tile of the pair, or -1 if the hand has no pair
+            (tuple): The sets, as tuples of tiles. If the hand has a pair,
+                they are the most sets of the hand without the pair.
+    '''
+    return _decompose_hand(tuple(counts))
+
+@functools.lru_cache(maxsize=1 << 16)
+def _decompose_hand(counts):
+    ''' Decompose a hand given by a tuple of counts, see `decompose`
+    '''
+    groups = [_decompose_group(counts[start:stop], start, chows) for start, stop, chows in GROUPS]
+    # Put the pair in the group that loses the fewest sets
+    best, pair = -1, -1
+    for i, (sets, group_pair, pair_sets) in enumerate(groups):
+        if group_pair >= 0 and (pair < 0 or len(sets) - len(pair_sets) < loss):
+            best, pair, loss = i, group_pair, len(sets) - len(pair_sets)
+    all_sets = ()
+    for i, (sets, _, pair_sets) in enumerate(groups):
+        all_sets += pair_sets if i == best else sets
+    return pair, all_sets
+
+def find_sets(counts):
+    ''' Find the most sets of a hand, without setting a pair aside
+
+    Args:
+        counts (list): The 34 tile counts of the hand
+
+    Returns:
+        (list): The sets, as tuples of tiles
+    '''
+    all_sets = []
+    for start, stop, chows in GROUPS:
+        all_sets.extend(_decompose_group(tuple(counts[start:stop]), start, chows)[0])
+    return all_sets
@@ -1,6 +1,6 @@
 import numpy as np
-from copy import deepcopy
 
+from rlcard.games.base import UndoLog
 from rlcard.games.mahjong import Dealer
 from rlcard.games.mahjong import Player
 from rlcard.games.mahjong import Round
@@ -40,7 +40,7 @@ class MahjongGame:
             self.dealer.deal_cards(player, 13)
 
         # Save the hisory for stepping back to the last state.
-        self.history = []
+        self.history = UndoLog()
 
         self.dealer.deal_cards(self.players[self.round.current_player], 1)
         state = self.get_state(self.round.current_player)
@@ -59,12 +59,23 @@ class MahjongGame:
                 (dict): next player's state
                 (int): next plater's id
         '''
-        # First snapshot the current state
+        # First record what this step may change
         if self.allow_step_back:
-            hist_dealer = deepcopy(self.dealer)
-            hist_round = deepcopy(self.round)
-            hist_players = deepcopy(self.players)
-            self.history.append((hist_dealer, hist_players, hist_round))
+            self.history.begin()
+            self.history.record_attrs(self, 'cur_state')
+            self.history.record_attrs(self.round, 'current_player', 'last_player', 'player_before_act',
+                                      'valid_act', 'last_cards')
+            self.history.record_tail(self.dealer.deck, 1)
+            self.history.record_tail(self.dealer.table, 1)
+            self.history.record_list(self.dealer.table_counts)
+            for player in self.players:
+                if player.player_id == self.round.current_player:
+                    self.history.record_list(player.hand)
+                    self.history.record_tail(player.pile)
+                    self.history.record_list(player.pile_counts)
+                else:
+                    self.history.record_tail(player.hand)
+                self.history.record_list(player.hand_counts)
         self.round.proceed_round(self.players, action)
         state = self.get_state(self.round.current_player)
         self.cur_state = state
@@ -76,10 +87,7 @@ class MahjongGame:
         Returns:
             (bool): True if the game steps back successfully
         '''
-        if not self.history:
-            return False
-        self.dealer, self.players, self.round = self.history.pop()
-        return True
+        return self.history.undo()
 
     def get_state(self, player_id):
         ''' Return player's state
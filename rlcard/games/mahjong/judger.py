@@ -1,8 +1,8 @@
 # -*- coding: utf-8 -*-
 ''' Implement Mahjong Judger class
 '''
-from collections import defaultdict
-import numpy as np
+from rlcard.games.mahjong.decomposer import cards2counts, decompose, find_sets
+from rlcard.games.mahjong.utils import card_decoding_dict
 
 class MahjongJudger:
     ''' Determine what cards a player can play
@@ -23,20 +23,13 @@ class MahjongJudger:
 
         '''
         last_card = dealer.table[-1]
-        last_card_str = last_card.get_str()
-        #last_card_value = last_card_str.split("-")[-1]
-        #last_card_type = last_card_str.split("-")[0]
         for player in players:
-            hand = [card.get_str() for card in player.hand]
-            hand_dict = defaultdict(list)
-            for card in hand:
-                hand_dict[card.split("-")[0]].append(card.split("-")[1])
-            #pile = player.pile
+            count = player.hand_counts[last_card.tile_id]
             # check gong
-            if hand.count(last_card_str) == 3 and last_player != player.player_id:
+            if count == 3 and last_player != player.player_id:
                 return 'gong', player, [last_card]*4
             # check pong
-            if hand.count(last_card_str) == 2 and last_player != player.player_id:
+            if count == 2 and last_player != player.player_id:
                 return 'pong', player, [last_card]*3
         return False, None, None
 
@@ -58,11 +51,8 @@ class MahjongJudger:
                 # Numbers in each dimension represent how many of that card the player has it in hand
                 # If the last_card_type is 'characters' for example, and the player has cards: characters_3, characters_6, characters_3,
                 # The hand_list vector looks like: [0,0,2,0,0,1,0,0,0]
-                hand_list = np.zeros(9)
-
-                for card in player.hand:
-                    if card.get_str().split("-")[0] == last_card_type:
-                        hand_list[card.index_num] = hand_list[card.index_num]+1
+                start = last_card.tile_id - last_card_index
+                hand_list = player.hand_counts[start:start+9]
 
                 #pile = player.pile
                 #check chow
@@ -120,33 +110,14 @@ class MahjongJudger:
             Result (bool): Win or not
             Maximum_score (int): Set count score of the player
         '''
-        set_count = 0
-        hand = [card.get_str() for card in player.hand]
-        count_dict = {card: hand.count(card) for card in hand}
         set_count = len(player.pile)
         if set_count >= 4:
             return True, set_count
-        used = []
-        maximum = 0
-        for each in count_dict:
-            if each in used:
-                continue
-            tmp_set_count = 0
-            tmp_hand = hand.copy()
-            if count_dict[each] == 2:
-                for _ in range(count_dict[each]):
-                    tmp_hand.pop(tmp_hand.index(each))
-                tmp_set_count, _set = self.cal_set(tmp_hand)
-                used.extend(_set)
-                if tmp_set_count + set_count > maximum:
-                    maximum = tmp_set_count + set_count
-                if tmp_set_count + set_count >= 4:
-                    #print(player.get_player_id(), sorted([card.get_str() for card in player.hand]))
-                    #print([[c.get_str() for c in s] for s in player.pile])
-                    #print(len(player.hand), sum([len(s) for s in player.pile]))
-                    #exit()
-                    return True, maximum
-        return False, maximum
+        pair, sets = decompose(player.hand_counts)
+        if pair < 0:
+            return False, 0
+        maximum = set_count + len(sets)
+        return maximum >= 4, maximum
 
     @staticmethod
     def check_consecutive(_list):
@@ -171,45 +142,8 @@ class MahjongJudger:
             Set_count (int):
             Sets (list): List of cards that has been pop from user's hand
         '''
-        tmp_cards = cards.copy()
-        sets = []
-        set_count = 0
-        _dict = {card: tmp_cards.count(card) for card in tmp_cards}
-        # check pong/gang
-        for each in _dict:
-            if _dict[each] == 3 or _dict[each] == 4:
-                set_count += 1
-                for _ in range(_dict[each]):
-                    tmp_cards.pop(tmp_cards.index(each))
-
-        # get all of the traits of each type in hand (except dragons and winds)
-        _dict_by_type = defaultdict(list)
-        for card in tmp_cards:
-            _type = card.split("-")[0]
-            _trait = card.split("-")[1]
-            if _type == 'dragons' or _type == 'winds':
-                continue
-            else:
-                _dict_by_type[_type].append(_trait)
-        for _type in _dict_by_type.keys():
-            values = sorted(_dict_by_type[_type])
-            if len(values) > 2:
-                for index, _ in enumerate(values):
-                    if index == 0:
-                        test_case = [values[index], values[index+1], values[index+2]]
-                    elif index == len(values)-1:
-                        test_case = [values[index-2], values[index-1], values[index]]
-                    else:
-                        test_case = [values[index-1], values[index], values[index+1]]
-                    if self.check_consecutive(test_case):
-                        set_count += 1
-                        for each in test_case:
-                            values.pop(values.index(each))
-                            c = _type+"-"+str(each)
-                            sets.append(c)
-                            if c in tmp_cards:
-                                tmp_cards.pop(tmp_cards.index(c))
-        return set_count, sets
+        sets = find_sets(cards2counts(cards))
+        return len(sets), [card_decoding_dict[tile] for tile_set in sets for tile in tile_set]
 
 #if __name__ == "__main__":
 #    judger = MahjongJudger()
@@ -1,3 +1,4 @@
+from rlcard.games.mahjong.decomposer import NUM_TILES
 
 class MahjongPlayer:
 
@@ -11,6 +12,10 @@ class MahjongPlayer:
         self.player_id = player_id
         self.hand = []
         self.pile = []
+        # The number of each tile in the hand and in the pile, kept
+        # up to date with `hand` and `pile`
+        self.hand_counts = [0] * NUM_TILES
+        self.pile_counts = [0] * NUM_TILES
 
     def get_player_id(self):
         ''' Return the id of the player
@@ -35,7 +40,9 @@ class MahjongPlayer:
             Card (object): The card to be play.
         '''
         card = self.hand.pop(self.hand.index(card))
+        self.hand_counts[card.tile_id] -= 1
         dealer.table.append(card)
+        dealer.table_counts[card.tile_id] += 1
 
     def chow(self, dealer, cards):
         ''' Perform Chow
@@ -44,10 +51,12 @@ class MahjongPlayer:
             Cards (object): The cards to be Chow.
         '''
         last_card = dealer.table.pop(-1)
+        dealer.table_counts[last_card.tile_id] -= 1
         for card in cards:
             if card in self.hand and card != last_card:
                 self.hand.pop(self.hand.index(card))
-        self.pile.append(cards)
+                self.hand_counts[card.tile_id] -= 1
+        self._add_to_pile(cards)
 
     def gong(self, dealer, cards):
         ''' Perform Gong
@@ -58,7 +67,8 @@ class MahjongPlayer:
         for card in cards:
             if card in self.hand:
                 self.hand.pop(self.hand.index(card))
-        self.pile.append(cards)
+                self.hand_counts[card.tile_id] -= 1
+        self._add_to_pile(cards)
 
     def pong(self, dealer, cards):
         ''' Perform Pong
@@ -69,4 +79,14 @@ class MahjongPlayer:
         for card in cards:
             if card in self.hand:
                 self.hand.pop(self.hand.index(card))
+                self.hand_counts[card.tile_id] -= 1
+        self._add_to_pile(cards)
+
+    def _add_to_pile(self, cards):
+        ''' Add a set of cards to the pile
+        Args:
+            Cards (object): The cards of the set.
+        '''
         self.pile.append(cards)
+        for card in cards:
+            self.pile_counts[card.tile_id] += 1
@@ -99,6 +99,7 @@ class MahjongRound:
             state['current_hand'] = players[self.current_player].hand
             state['players_pile'] = {p.player_id: p.pile for p in players}
             state['action_cards'] = self.last_cards # For doing action (pong, chow, gong)
+            hand_counts = players[self.current_player].hand_counts
         else: # Regular Play
             state['valid_act'] = ['play']
             state['table'] = self.dealer.table
@@ -106,5 +107,10 @@ class MahjongRound:
             state['current_hand'] = players[player_id].hand
             state['players_pile'] = {p.player_id: p.pile for p in players}
             state['action_cards'] = players[player_id].hand # For doing action (pong, chow, gong)
+            hand_counts = players[player_id].hand_counts
+        # The tile counts of the current hand, of the table and of the piles
+        state['hand_counts'] = hand_counts
+        state['table_counts'] = self.dealer.table_counts
+        state['piles_counts'] = [p.pile_counts for p in players]
         return state
 
@@ -48,6 +48,8 @@ def init_deck():
                 card.set_index_num(index_num)
                 index_num = index_num + 1
                 deck.append(card)
+    for card in deck:
+        card.set_tile_id(card_encoding_dict[card.get_str()])
     deck = deck * 4
     return deck
 
@@ -65,6 +67,24 @@ def cards2list(cards):
     return cards_list
 
 
+# The encoding of a count, the n first entries of a row are ones
+COUNT_ENCODING = np.tril(np.ones((5, 4), dtype=int), -1)
+
+def encode_counts(counts, out=None):
+    ''' Encode vectors of tile counts, like `encode_cards`
+
+    Args:
+        counts (list): The 34 counts of the tiles, or a list of such vectors
+        out (numpy.array): If given, the array of shape (..., 34, 4) to write the planes into
+
+    Returns:
+        (numpy.array): The planes of shape (..., 34, 4)
+    '''
+    if out is None:
+        return COUNT_ENCODING[np.asarray(counts)]
+    out[...] = COUNT_ENCODING[np.asarray(counts)]
+    return out
+
 def encode_cards(cards):
     plane = np.zeros((34,4), dtype=int)
     cards = cards2list(cards)
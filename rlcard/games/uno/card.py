@@ -20,6 +20,8 @@ class UnoCard:
         self.color = color
         self.trait = trait
         self.str = self.get_str()
+        # The integer code of the card, the same as the id of the action of its string
+        self.code = UnoCard.info['color'].index(color) * 15 + UnoCard.info['trait'].index(trait)
 
     def get_str(self):
         ''' Get the string representation of card
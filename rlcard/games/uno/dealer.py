@@ -23,7 +23,7 @@ class UnoDealer:
             num (int): The number of cards to be dealed
         '''
         for _ in range(num):
-            player.hand.append(self.deck.pop())
+            player.add_card(self.deck.pop())
 
     def flip_top_card(self):
         ''' Flip top card when a new game starts
@@ -1,6 +1,6 @@
-from copy import deepcopy
 import numpy as np
 
+from rlcard.games.base import UndoLog
 from rlcard.games.uno import Dealer
 from rlcard.games.uno import Player
 from rlcard.games.uno import Round
@@ -49,7 +49,7 @@ class UnoGame:
         self.round.perform_top_card(self.players, top_card)
 
         # Save the hisory for stepping back to the last state.
-        self.history = []
+        self.history = UndoLog()
 
         player_id = self.round.current_player
         state = self.get_state(player_id)
@@ -69,27 +69,53 @@ class UnoGame:
         '''
 
         if self.allow_step_back:
-            # First snapshot the current state
-            his_dealer = deepcopy(self.dealer)
-            his_round = deepcopy(self.round)
-            his_players = deepcopy(self.players)
-            self.history.append((his_dealer, his_players, his_round))
+            # First record what this step may change
+            self._record_step(action)
 
         self.round.proceed_round(self.players, action)
         player_id = self.round.current_player
         state = self.get_state(player_id)
         return state, player_id
 
+    def _record_step(self, action):
+        ''' Record the fields that the action may change in the history
+
+        Args:
+            action (str): A specific action
+        '''
+        history = self.history
+        deck = self.dealer.deck
+        history.begin()
+        history.record_attrs(self.round, 'target', 'current_player', 'direction',
+                             'is_over', 'winner', 'played_cards', 'played_card_strs')
+        history.record_tail(self.round.played_cards)
+        history.record_tail(self.round.played_card_strs)
+        for player in self.players:
+            if player.player_id == self.round.current_player:
+                history.record_list(player.hand)
+            else:
+                history.record_tail(player.hand)
+            history.record_list(player.hand_counts)
+            history.record_attrs(player, 'hand_mask')
+        if len(deck) > 4:
+            # At most 4 cards are dealt, a drawn wild card gets a color
+            history.record_tail(deck, 4)
+            if action == 'draw':
+                history.record_attrs(deck[-1], 'color')
+        else:
+            # The played cards may be shuffled back into the deck
+            history.record_list(deck)
+            for card in deck + self.round.played_cards:
+                if card.type == 'wild':
+                    history.record_attrs(card, 'color')
+
     def step_back(self):
         ''' Return to the previous state of the game
 
         Returns:
             (bool): True if the game steps back successfully
         '''
-        if not self.history:
-            return False
-        self.dealer, self.players, self.round = self.history.pop()
-        return True
+        return self.history.undo()
 
     def get_state(self, player_id):
         ''' Return player's state
@@ -126,6 +152,14 @@ class UnoGame:
 
         return self.round.get_legal_actions(self.players, self.round.current_player)
 
+    def get_legal_action_ids(self):
+        ''' Return the ids of the legal actions for current player
+
+        Returns:
+            (list): A list of the ids of the legal actions
+        '''
+        return self.round.get_legal_action_ids(self.players, self.round.current_player)
+
     def get_num_players(self):
         ''' Return the number of players in Limit Texas Hold'em
 
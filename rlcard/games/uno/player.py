@@ -10,6 +10,9 @@ class UnoPlayer:
         self.np_random = np_random
         self.player_id = player_id
         self.hand = []
+        # The counts of the card codes in hand, and the mask of the codes with a nonzero count
+        self.hand_counts = [0] * 60
+        self.hand_mask = 0
         self.stack = []
 
     def get_player_id(self):
@@ -17,3 +20,28 @@ class UnoPlayer:
         '''
 
         return self.player_id
+
+    def add_card(self, card):
+        ''' Add a card to the hand
+
+        Args:
+            card (object): object of UnoCard
+        '''
+        self.hand.append(card)
+        self.hand_counts[card.code] += 1
+        self.hand_mask |= 1 << card.code
+
+    def remove_card(self, index):
+        ''' Remove a card from the hand
+
+        Args:
+            index (int): The index of the card in the hand
+
+        Returns:
+            (object): object of UnoCard
+        '''
+        card = self.hand.pop(index)
+        self.hand_counts[card.code] -= 1
+        if not self.hand_counts[card.code]:
+            self.hand_mask &= ~(1 << card.code)
+        return card
@@ -1,5 +1,6 @@
 from rlcard.games.uno.card import UnoCard
-from rlcard.games.uno.utils import cards2list, WILD, WILD_DRAW_4
+from rlcard.games.uno.utils import cards2list, ACTION_LIST, ACTION_SPACE, COLOR_MAP
+from rlcard.games.uno.utils import DRAW_ACTION_ID, PLAYABLE_MASKS, WILD_MASK, WILD_DRAW_4_MASK
 
 
 class UnoRound:
@@ -18,6 +19,8 @@ class UnoRound:
         self.num_players = num_players
         self.direction = 1
         self.played_cards = []
+        # The strings of played_cards, kept as the cards are played
+        self.played_card_strs = []
         self.is_over = False
         self.winner = None
 
@@ -32,7 +35,7 @@ class UnoRound:
         if top.trait == 'wild':
             top.color = self.np_random.choice(UnoCard.info['color'])
         self.target = top
-        self.played_cards.append(top)
+        self._append_played_card(top)
         return top
 
     def perform_top_card(self, players, top_card):
@@ -62,9 +65,7 @@ class UnoRound:
             self._perform_draw_action(players)
             return None
         player = players[self.current_player]
-        card_info = action.split('-')
-        color = card_info[0]
-        trait = card_info[1]
+        trait = action.split('-')[1]
         # remove correspongding card
         remove_index = None
         if trait == 'wild' or trait == 'wild_draw_4':
@@ -73,15 +74,16 @@ class UnoRound:
                     remove_index = index
                     break
         else:
+            code = ACTION_SPACE[action]
             for index, card in enumerate(player.hand):
-                if color == card.color and trait == card.trait:
+                if code == card.code:
                     remove_index = index
                     break
-        card = player.hand.pop(remove_index)
+        card = player.remove_card(remove_index)
         if not player.hand:
             self.is_over = True
             self.winner = [self.current_player]
-        self.played_cards.append(card)
+        self._append_played_card(card)
 
         # perform the number action
         if card.type == 'number':
@@ -93,45 +95,44 @@ class UnoRound:
             self._preform_non_number_action(players, card)
 
     def get_legal_actions(self, players, player_id):
-        wild_flag = 0
-        wild_draw_4_flag = 0
-        legal_actions = []
-        wild_4_actions = []
-        hand = players[player_id].hand
+        ''' Get the legal actions of a player
+
+        Args:
+            players (list): The list of UnoPlayer
+            player_id (int): The id of the player
+
+        Returns:
+            (list): The strings of the legal actions, ordered by action id
+        '''
+        return [ACTION_LIST[action_id] for action_id in self.get_legal_action_ids(players, player_id)]
+
+    def get_legal_action_ids(self, players, player_id):
+        ''' Get the ids of the legal actions of a player from the mask of
+            their hand and the table of the cards playable on the target
+
+        Args:
+            players (list): The list of UnoPlayer
+            player_id (int): The id of the player
+
+        Returns:
+            (list): The ids of the legal actions, in increasing order
+        '''
+        hand_mask = players[player_id].hand_mask
         target = self.target
-        if target.type == 'wild':
-            for card in hand:
-                if card.type == 'wild':
-                    if card.trait == 'wild_draw_4':
-                        if wild_draw_4_flag == 0:
-                            wild_draw_4_flag = 1
-                            wild_4_actions.extend(WILD_DRAW_4)
-                    else:
-                        if wild_flag == 0:
-                            wild_flag = 1
-                            legal_actions.extend(WILD)
-                elif card.color == target.color:
-                    legal_actions.append(card.str)
-
-        # target is aciton card or number card
-        else:
-            for card in hand:
-                if card.type == 'wild':
-                    if card.trait == 'wild_draw_4':
-                        if wild_draw_4_flag == 0:
-                            wild_draw_4_flag = 1
-                            wild_4_actions.extend(WILD_DRAW_4)
-                    else:
-                        if wild_flag == 0:
-                            wild_flag = 1
-                            legal_actions.extend(WILD)
-                elif card.color == target.color or card.trait == target.trait:
-                    legal_actions.append(card.str)
-        if not legal_actions:
-            legal_actions = wild_4_actions
-        if not legal_actions:
-            legal_actions = ['draw']
-        return legal_actions
+        # the color of a wild target is the color chosen for it
+        legal_mask = hand_mask & PLAYABLE_MASKS[COLOR_MAP[target.color] * 15 + target.code % 15]
+        if hand_mask & WILD_MASK:
+            legal_mask |= WILD_MASK
+        if not legal_mask and hand_mask & WILD_DRAW_4_MASK:
+            legal_mask = WILD_DRAW_4_MASK
+        if not legal_mask:
+            return [DRAW_ACTION_ID]
+        legal_action_ids = []
+        while legal_mask:
+            low_bit = legal_mask & -legal_mask
+            legal_action_ids.append(low_bit.bit_length() - 1)
+            legal_mask ^= low_bit
+        return legal_action_ids
 
     def get_state(self, players, player_id):
         ''' Get player's state
@@ -143,8 +144,10 @@ class UnoRound:
         state = {}
         player = players[player_id]
         state['hand'] = cards2list(player.hand)
+        state['hand_counts'] = player.hand_counts[:]
         state['target'] = self.target.str
-        state['played_cards'] = cards2list(self.played_cards)
+        state['target_code'] = self.target.code
+        state['played_cards'] = self.played_card_strs[:]
         state['legal_actions'] = self.get_legal_actions(players, player_id)
         state['num_cards'] = []
         for player in players:
@@ -157,6 +160,7 @@ class UnoRound:
         self.dealer.deck.extend(self.played_cards)
         self.dealer.shuffle()
         self.played_cards = []
+        self.played_card_strs = []
 
     def _perform_draw_action(self, players):
         # replace deck if there is no card in draw pile
@@ -172,24 +176,28 @@ class UnoRound:
         if card.type == 'wild':
             card.color = self.np_random.choice(UnoCard.info['color'])
             self.target = card
-            self.played_cards.append(card)
+            self._append_played_card(card)
             self.current_player = (self.current_player + self.direction) % self.num_players
 
         # draw a card with the same color of target
         elif card.color == self.target.color:
             if card.type == 'number':
                 self.target = card
-                self.played_cards.append(card)
+                self._append_played_card(card)
                 self.current_player = (self.current_player + self.direction) % self.num_players
             else:
-                self.played_cards.append(card)
+                self._append_played_card(card)
                 self._preform_non_number_action(players, card)
 
         # draw a card with the diffrent color of target
         else:
-            players[self.current_player].hand.append(card)
+            players[self.current_player].add_card(card)
             self.current_player = (self.current_player + self.direction) % self.num_players
 
+    def _append_played_card(self, card):
+        self.played_cards.append(card)
+        self.played_card_strs.append(card.get_str())
+
     def _preform_non_number_action(self, players, card):
         current = self.current_player
         direction = self.direction
@@ -27,6 +27,30 @@ WILD = ['r-wild', 'g-wild', 'b-wild', 'y-wild']
 
 WILD_DRAW_4 = ['r-wild_draw_4', 'g-wild_draw_4', 'b-wild_draw_4', 'y-wild_draw_4']
 
+# A card is coded as color index * 15 + trait index, which is the id of the
+# action of playing it. A set of cards is a mask with a bit for each code
+DRAW_ACTION_ID = ACTION_SPACE['draw']
+
+WILD_MASK = sum(1 << ACTION_SPACE[action] for action in WILD)
+
+WILD_DRAW_4_MASK = sum(1 << ACTION_SPACE[action] for action in WILD_DRAW_4)
+
+def _get_playable_masks():
+    ''' The masks of the number and action cards that can be played on
+        each target, indexed by the color index * 15 + the trait index of
+        the target. They share its color, or its trait if it is not wild
+    '''
+    masks = []
+    for target in range(60):
+        mask = 0
+        for code in range(60):
+            if code % 15 < 13 and (code // 15 == target // 15 or code % 15 == target % 15):
+                mask |= 1 << code
+        masks.append(mask)
+    return masks
+
+PLAYABLE_MASKS = _get_playable_masks()
+
 
 def init_deck():
     ''' Generate uno deck of 108 cards
@@ -125,3 +149,28 @@ def encode_target(plane, target):
     trait = TRAIT_MAP[target_info[1]]
     plane[color][trait] = 1
     return plane
+
+def encode_hand_counts(plane, hand_counts):
+    ''' Encode hand given by its card counts and represerve it into plane,
+        like `encode_hand`
+
+    Args:
+        plane (array): 3*4*15 numpy array
+        hand_counts (list): the counts of the 60 card codes of the hand
+
+    Returns:
+        (array): 3*4*15 numpy array
+    '''
+    plane[0] = 1
+    plane[1:] = 0
+    for code, count in enumerate(hand_counts):
+        if count:
+            color, trait = divmod(code, 15)
+            if trait >= 13:
+                # The wild cards are encoded in all the colors, once
+                plane[0, :, trait] = 0
+                plane[1, :, trait] = 1
+            else:
+                plane[0, color, trait] = 0
+                plane[count, color, trait] = 1
+    return plane
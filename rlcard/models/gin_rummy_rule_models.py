@@ -98,13 +98,7 @@ class GinRummyNoviceRuleAgent(object):
         for discard_action_event in discard_action_events:
             discard_card = discard_action_event.card
             next_hand = [card for card in hand if card != discard_card]
-            meld_clusters = melding.get_meld_clusters(hand=next_hand)
-            deadwood_counts = []
-            for meld_cluster in meld_clusters:
-                deadwood_count = utils.get_deadwood_count(hand=next_hand, meld_cluster=meld_cluster)
-                deadwood_counts.append(deadwood_count)
-            best_deadwood_count = min(deadwood_counts,
-                                      default=utils.get_deadwood_count(hand=next_hand, meld_cluster=[]))
+            best_deadwood_count = melding.get_min_deadwood_count(hand=next_hand)
             if best_deadwood_count < final_deadwood_count:
                 final_deadwood_count = best_deadwood_count
                 best_discards = [discard_card]
@@ -17,7 +17,7 @@ class LeducHoldemCFRModel(Model):
         '''
         env = rlcard.make('leduc-holdem')
         self.agent = CFRAgent(env, model_path=os.path.join(ROOT_PATH, 'leduc_holdem_cfr'))
-        self.agent.load()
+        self.agent.load(policy_only=True)
     @property
     def agents(self):
         ''' Get a list of agents for each position in a the game
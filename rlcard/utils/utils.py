@@ -1,15 +1,28 @@
 import numpy as np
 
 from rlcard.games.base import Card
+from rlcard.utils import seeding
+
+# The optional dependencies found by `is_installed`
+_INSTALLED = {}
+
+def is_installed(package):
+    ''' Check whether an optional dependency is installed, without importing it
+
+    Args:
+        package (str): The name of the top-level module, e.g., 'torch'
+
+    Returns:
+        (bool): True if the package can be imported
+    '''
+    if package not in _INSTALLED:
+        import importlib.util
+        _INSTALLED[package] = importlib.util.find_spec(package) is not None
+    return _INSTALLED[package]
 
 def set_seed(seed):
     if seed is not None:
-        import subprocess
-        import sys
-
-        reqs = subprocess.check_output([sys.executable, '-m', 'pip', 'freeze'])
-        installed_packages = [r.decode().split('==')[0] for r in reqs.split()]
-        if 'torch' in installed_packages:
+        if is_installed('torch'):
             import torch
             torch.backends.cudnn.deterministic = True
             torch.manual_seed(seed)
@@ -194,6 +207,24 @@ def remove_illegal(action_probs, legal_actions):
         probs /= sum(probs)
     return probs
 
+def get_legal_actions_mask(state, num_actions):
+    ''' Get the legal actions of a state as a boolean mask. The states of
+        the environments carry no mask, it is built from 'legal_actions'
+        when an agent needs it, unless the state has a 'legal_actions_mask'.
+
+    Args:
+        state (dict): The extracted state
+        num_actions (int): The width of the mask
+
+    Returns:
+        (numpy.array): The boolean mask of the legal actions
+    '''
+    mask = state.get('legal_actions_mask')
+    if mask is None:
+        mask = np.zeros(num_actions, dtype=bool)
+        mask[list(state['legal_actions'])] = True
+    return mask
+
 def tournament(env, num):
     ''' Evaluate he performance of the agents in the environment
 
@@ -221,6 +252,128 @@ def tournament(env, num):
         payoffs[i] /= counter
     return payoffs
 
+def _tournament_worker(args):
+    ''' Play a chunk of games in a fresh environment. Used by `parallel_tournament`.
+
+    Args:
+        args (tuple): The env id, the env config, the agents, the chunk seed and the number of games
+
+    Returns:
+        (numpy.array): The payoffs of each game, (num_games, num_players)
+    '''
+    import rlcard
+    env_id, config, agents, seed, num = args
+    _config = config.copy()
+    _config['seed'] = seed
+    env = rlcard.make(env_id, config=_config)
+    env.set_agents(agents)
+    set_seed(seed)
+    payoffs = np.zeros((num, env.num_players))
+    for i in range(num):
+        _, payoffs[i] = env.run(is_training=False)
+    return payoffs
+
+def _get_rng_states():
+    ''' Get the states of the global random generators reseeded by `set_seed`
+
+    Returns:
+        (dict): The states of random, numpy and torch, if installed
+    '''
+    import random
+    states = {'random': random.getstate(), 'numpy': np.random.get_state()}
+    if is_installed('torch'):
+        import torch
+        states['torch'] = torch.get_rng_state()
+        states['cudnn_deterministic'] = torch.backends.cudnn.deterministic
+        if torch.cuda.is_available():
+            states['cuda'] = torch.cuda.get_rng_state_all()
+    return states
+
+def _set_rng_states(states):
+    ''' Restore the states of the global random generators
+
+    Args:
+        states (dict): The states returned by `_get_rng_states`
+    '''
+    import random
+    random.setstate(states['random'])
+    np.random.set_state(states['numpy'])
+    if 'torch' in states:
+        import torch
+        torch.set_rng_state(states['torch'])
+        torch.backends.cudnn.deterministic = states['cudnn_deterministic']
+        if 'cuda' in states:
+            torch.cuda.set_rng_state_all(states['cuda'])
+
+def _get_chunk_seed(seed, chunk_id):
+    ''' Derive the seed of a chunk of `parallel_tournament`. The base seed is
+    hashed before the chunk index is added, so that the chunks of
+    consecutive base seeds do not share their seeds.
+
+    Args:
+        seed (int): The base seed of the evaluation
+        chunk_id (int): The index of the chunk
+
+    Returns:
+        (int): The seed of the chunk
+    '''
+    return seeding.hash_seed(seeding.hash_seed(seed) + chunk_id, max_bytes=4)
+
+def parallel_tournament(env_id, agents, num, num_workers=None, seed=0, chunk_size=100, config=None):
+    ''' Evaluate the performance of the agents with a pool of processes.
+
+    The games are split into chunks of `chunk_size` games. Each chunk is played
+    in its own environment built with `rlcard.make`, with a seed derived from
+    the hashes of `seed` and the chunk index. Since the chunks
+    do not depend on the worker that plays them, the results are identical
+    whatever the number of workers.
+
+    Args:
+        env_id (string): The name of the environment to be evaluated.
+        agents (list): The agents of each position. They must be picklable.
+        num (int): The number of games to play, at least 1.
+        num_workers (int): The number of processes. Default is the number of CPUs.
+        seed (int): The base seed of the evaluation.
+        chunk_size (int): The number of games played with one seed.
+        config (dict): Other environment settings.
+
+    Returns:
+        (tuple): Tuple containing:
+
+            (list): A list of avrage payoffs for each player
+            (list): A list of standard errors of the payoffs for each player
+    '''
+    import multiprocessing
+
+    if num < 1:
+        raise ValueError("parallel_tournament needs at least one game, got num={}".format(num))
+    if config is None:
+        config = {}
+
+    chunks = []
+    for chunk_id, start in enumerate(range(0, num, chunk_size)):
+        chunk_seed = _get_chunk_seed(seed, chunk_id)
+        chunks.append((env_id, config, agents, chunk_seed, min(chunk_size, num - start)))
+
+    if num_workers == 1:
+        # The chunks reseed the global random generators, which belong to the caller here
+        rng_states = _get_rng_states()
+        try:
+            results = [_tournament_worker(chunk) for chunk in chunks]
+        finally:
+            _set_rng_states(rng_states)
+    else:
+        with multiprocessing.Pool(num_workers) as pool:
+            results = pool.map(_tournament_worker, chunks)
+
+    payoffs = np.concatenate(results)
+    means = payoffs.mean(axis=0)
+    if num > 1:
+        stderrs = payoffs.std(axis=0, ddof=1) / np.sqrt(num)
+    else:
+        stderrs = np.zeros(payoffs.shape[1])
+    return means.tolist(), stderrs.tolist()
+
 def plot_curve(csv_path, save_path, algorithm):
     ''' Read data from csv file and plot the results
     '''
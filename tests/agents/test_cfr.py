@@ -2,7 +2,7 @@ import unittest
 import numpy as np
 
 import rlcard
-from rlcard.agents.cfr_agent import CFRAgent
+from rlcard.agents.cfr_agent import CFRAgent, InfosetTable, regret_matching
 
 class TestNFSP(unittest.TestCase):
 
@@ -34,4 +34,39 @@ class TestNFSP(unittest.TestCase):
         self.assertEqual(len(agent.average_policy), len(new_agent.average_policy))
         self.assertEqual(len(agent.regrets), len(new_agent.regrets))
         self.assertEqual(agent.iteration, new_agent.iteration)
+        for key in agent.table.keys:
+            infoset, new_infoset = agent.table.lookup(key), new_agent.table.lookup(key)
+            self.assertTrue(np.array_equal(agent.regrets[infoset], new_agent.regrets[new_infoset]))
 
+    def test_load_policy_only(self):
+        env = rlcard.make('leduc-holdem', config={'allow_step_back':True})
+        agent = CFRAgent(env, model_path='experiments/cfr_model')
+
+        for _ in range(10):
+            agent.train()
+
+        agent.save()
+
+        new_agent = CFRAgent(env, model_path='experiments/cfr_model')
+        new_agent.load(policy_only=True)
+        self.assertEqual(len(new_agent.table), len(agent.table))
+        legal_actions = list(range(env.num_actions))
+        for key in agent.table.keys:
+            probs = agent.action_probs(key, legal_actions, agent.table.average_policy)
+            new_probs = new_agent.action_probs(key, legal_actions, new_agent.table.average_policy)
+            self.assertTrue(np.allclose(probs, new_probs, atol=1e-6))
+        self.assertIsNone(new_agent.table.lookup(b'missing'))
+
+    def test_regret_matching(self):
+        probs = regret_matching(np.array([[1., -1., 3., 0.], [-1., -2., 0., 0.]]))
+        self.assertTrue(np.allclose(probs[0], [0.25, 0., 0.75, 0.]))
+        self.assertTrue(np.allclose(probs[1], [0.25, 0.25, 0.25, 0.25]))
+
+    def test_infoset_table(self):
+        table = InfosetTable(3, chunk_size=2)
+        ids = [table.intern(bytes([i])) for i in range(5)]
+        self.assertEqual(ids, [0, 1, 2, 3, 4])
+        self.assertEqual(table.intern(bytes([2])), 2)
+        self.assertEqual(len(table), 5)
+        self.assertIsNone(table.lookup(b'missing'))
+        self.assertTrue(np.allclose(table.policy[:5], 1.0 / 3))
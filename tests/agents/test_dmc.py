@@ -0,0 +1,49 @@
+import unittest
+import numpy as np
+import torch
+
+import rlcard
+from rlcard.agents.dmc_agent.model import DMCAgent, DMCNet
+from rlcard.agents.dmc_agent.utils import create_buffers
+
+class TestDMC(unittest.TestCase):
+
+    def test_create_cpu_buffers(self):
+        buffers = create_buffers(10, 3, [[36], [36]], [[4], [4]], ['cpu'])
+        self.assertEqual(list(buffers.keys()), ['cpu'])
+        self.assertEqual(len(buffers['cpu']), 2)
+        self.assertEqual(len(buffers['cpu'][0]['state']), 3)
+        self.assertEqual(buffers['cpu'][0]['state'][0].shape, (10, 36))
+        self.assertEqual(buffers['cpu'][0]['state'][0].device, torch.device('cpu'))
+        self.assertTrue(buffers['cpu'][0]['state'][0].is_shared())
+
+    def test_cpu_agent(self):
+        env = rlcard.make('leduc-holdem')
+        agent = DMCAgent(env.state_shape[0], [env.num_actions], mlp_layers=[16, 16], device='cpu')
+        state, _ = env.reset()
+        action, info = agent.eval_step(state)
+        self.assertIn(action, state['legal_actions'])
+        self.assertEqual(len(info['values']), len(state['legal_actions']))
+
+    def test_forward_actions(self):
+        net = DMCNet([20], [6], mlp_layers=[16, 16])
+        obs = torch.rand(1, 20)
+        actions = torch.rand(5, 6)
+        with torch.no_grad():
+            values = net.forward_actions(obs, actions)
+            expected = net.forward(obs.repeat(5, 1), actions)
+        self.assertEqual(values.shape, (5,))
+        self.assertTrue(torch.allclose(values, expected, atol=1e-6))
+
+    def test_predict_action_features(self):
+        env = rlcard.make('doudizhu')
+        agent = DMCAgent(env.state_shape[0], env.action_shape[0], mlp_layers=[16, 16], device='cpu')
+        state, _ = env.reset()
+        action_keys, values = agent.predict(state)
+        self.assertEqual(len(values), len(state['legal_actions']))
+        self.assertGreaterEqual(agent.action_buffer.shape[0], len(action_keys))
+        for action_id, feature in zip(action_keys, agent.action_buffer):
+            self.assertTrue(np.array_equal(feature, state['legal_actions'][action_id]))
+
+if __name__ == '__main__':
+    unittest.main()
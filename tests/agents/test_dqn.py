@@ -2,7 +2,7 @@ import unittest
 import torch
 import numpy as np
 
-from rlcard.agents.dqn_agent import DQNAgent
+from rlcard.agents.dqn_agent import DQNAgent, Memory, PrioritizedMemory, SumTree
 
 class TestDQN(unittest.TestCase):
 
@@ -51,3 +51,86 @@ class TestDQN(unittest.TestCase):
         predicted_action = agent.step({'obs': np.random.random_sample((2,)), 'legal_actions': {0: None, 1: None}})
         self.assertGreaterEqual(predicted_action, 0)
         self.assertLessEqual(predicted_action, 1)
+
+    def test_eval_step_batch(self):
+        agent = DQNAgent(state_shape=[2],
+                         mlp_layers=[10,10],
+                         device=torch.device('cpu'))
+        batch = {'obs': np.random.random_sample((3, 2)), 'legal_actions': np.array([[True, False], [False, True], [True, True]])}
+        actions, _ = agent.eval_step_batch(batch)
+        self.assertEqual(actions[0], 0)
+        self.assertEqual(actions[1], 1)
+        actions = agent.step_batch(batch)
+        self.assertEqual(len(actions), 3)
+
+    def test_memory(self):
+        memory = Memory(memory_size=3, batch_size=2, num_actions=4)
+        for i in range(5):
+            memory.save(np.full(2, i), i, float(i), np.full(2, i+1), np.arange(4) == i % 4, i == 4)
+        self.assertEqual(len(memory), 3)
+        self.assertEqual(sorted(memory.actions.tolist()), [2, 3, 4])
+        states, actions, rewards, next_states, legal_actions, dones = memory.sample()
+        self.assertEqual(states.shape, (2, 2))
+        self.assertEqual(legal_actions.shape, (2, 4))
+        for state, action, reward, next_state, mask, done in zip(states, actions, rewards, next_states, legal_actions, dones):
+            self.assertEqual(state[0], action)
+            self.assertEqual(reward, action)
+            self.assertEqual(next_state[0], action + 1)
+            self.assertEqual(np.flatnonzero(mask).tolist(), [action % 4])
+            self.assertEqual(done, action == 4)
+        # The legal action ids of the former contract are not taken as a mask
+        with self.assertRaises(ValueError):
+            memory.save(np.zeros(2), 0, 0.0, np.zeros(2), [0, 3], False)
+        with self.assertRaises(ValueError):
+            memory.save(np.zeros(2), 0, 0.0, np.zeros(2), np.ones(2, dtype=bool), False)
+        with self.assertRaises(TypeError):
+            Memory(memory_size=3, batch_size=2)
+
+    def test_sum_tree(self):
+        tree = SumTree(5)
+        tree.update(np.arange(5), np.array([1.0, 0.0, 2.0, 3.0, 4.0]))
+        self.assertEqual(tree.total(), 10)
+        self.assertEqual(tree.find(np.array([0, 0.5, 1, 2.9, 3, 5.9, 6, 9.99, 10])).tolist(), [0, 0, 2, 2, 3, 3, 4, 4, 4])
+        tree.update([4, 4], [1.0, 1.0])
+        self.assertEqual(tree.total(), 7)
+
+    def test_prioritized_memory(self):
+        memory = PrioritizedMemory(memory_size=4, batch_size=1000, num_actions=2, alpha=1.0, epsilon=0)
+        for i in range(4):
+            memory.save(np.full(2, i), i, 0.0, np.full(2, i), np.array([True, False]), False)
+        memory.update_priorities(np.arange(4), np.array([1.0, 0.0, -1.0, 2.0]))
+        _, actions, _, _, _, _, indices, weights = memory.sample(beta=1.0)
+        self.assertEqual(actions.tolist(), indices.tolist())
+        counts = np.bincount(indices, minlength=4)
+        self.assertEqual(counts.tolist(), [250, 0, 250, 500])
+        self.assertEqual(weights[indices == 3][0], 0.5)
+        self.assertEqual(weights[indices == 0][0], 1.0)
+        memory.save(np.zeros(2), 0, 0.0, np.zeros(2), np.array([True, False]), False)
+        self.assertEqual(memory.tree.get([0])[0], 2.0)
+
+    def test_train_prioritized(self):
+        agent = DQNAgent(replay_memory_size=200,
+                         replay_memory_init_size=50,
+                         state_shape=[2],
+                         mlp_layers=[10,10],
+                         device=torch.device('cpu'),
+                         prioritized_replay=True)
+        for _ in range(100):
+            ts = [{'obs': np.random.random_sample((2,)), 'legal_actions': {0: None, 1: None}}, np.random.randint(2), np.random.randint(2), {'obs': np.random.random_sample((2,)), 'legal_actions': {0: None}}, True]
+            agent.feed(ts)
+        self.assertEqual(agent.q_estimator.td_errors.shape, (agent.batch_size,))
+        self.assertGreater(agent.memory.tree.total(), 0)
+        self.assertNotEqual(len(set(agent.memory.tree.get(np.arange(100)).tolist())), 1)
+
+    def test_predict_mask(self):
+        agent = DQNAgent(num_actions=4,
+                         state_shape=[2],
+                         mlp_layers=[10,10],
+                         device=torch.device('cpu'))
+        state = {'obs': np.random.random_sample((2,)), 'legal_actions': {1: None, 3: None}}
+        q_values = agent.predict(state)
+        self.assertEqual(np.flatnonzero(q_values > -np.inf).tolist(), [1, 3])
+        state['legal_actions_mask'] = np.array([True, False, False, False])
+        self.assertEqual(np.flatnonzero(agent.predict(state) > -np.inf).tolist(), [0])
+        for _ in range(10):
+            self.assertEqual(agent.step(state), 0)
@@ -0,0 +1,51 @@
+import os
+import tempfile
+import unittest
+import numpy as np
+
+import rlcard
+from rlcard.agents.mccfr_agent import MCCFRAgent, ExternalSamplingCFRAgent, OutcomeSamplingCFRAgent
+
+class TestMCCFR(unittest.TestCase):
+
+    def test_train(self):
+        for agent_class in [ExternalSamplingCFRAgent, OutcomeSamplingCFRAgent]:
+            env = rlcard.make('leduc-holdem', config={'allow_step_back':True})
+            agent = agent_class(env, report_every=50)
+
+            for _ in range(100):
+                agent.train()
+
+            self.assertGreater(len(agent.table), 0)
+            self.assertGreater(agent.iterations_per_second, 0)
+            self.assertTrue(np.allclose(agent.policy.sum(axis=1), 1))
+            state = {'obs': np.array([1., 1., 0., 0., 0., 0.]), 'legal_actions': {0: None,2: None}, 'raw_legal_actions': ['call', 'fold']}
+            action, _ = agent.eval_step(state)
+            self.assertIn(action, [0, 2])
+
+    def test_save_and_load(self):
+        env = rlcard.make('limit-holdem', config={'allow_step_back':True})
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            model_path = os.path.join(tmp_dir, 'mccfr_model')
+            agent = OutcomeSamplingCFRAgent(env, model_path=model_path)
+
+            for _ in range(20):
+                agent.train()
+
+            agent.save()
+
+            new_agent = OutcomeSamplingCFRAgent(env, model_path=model_path)
+            new_agent.load()
+        self.assertEqual(len(agent.regrets), len(new_agent.regrets))
+        self.assertEqual(agent.iteration, new_agent.iteration)
+        for key in agent.table.keys:
+            infoset, new_infoset = agent.table.lookup(key), new_agent.table.lookup(key)
+            self.assertTrue(np.array_equal(agent.average_policy[infoset], new_agent.average_policy[new_infoset]))
+
+    def test_abstract(self):
+        env = rlcard.make('leduc-holdem', config={'allow_step_back':True})
+        with self.assertRaises(TypeError):
+            MCCFRAgent(env)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,8 +1,9 @@
 import unittest
+from unittest import mock
 import torch
 import numpy as np
 
-from rlcard.agents.nfsp_agent import NFSPAgent
+from rlcard.agents.nfsp_agent import NFSPAgent, ReservoirBuffer
 
 class TestNFSP(unittest.TestCase):
 
@@ -45,3 +46,63 @@ class TestNFSP(unittest.TestCase):
 
             ts = [{'obs': np.random.random_sample((2,)), 'legal_actions': {0: None, 1: None}}, np.random.randint(2), 0, {'obs': np.random.random_sample((2,)), 'legal_actions': {0: None, 1: None}, 'raw_legal_actions': ['call', 'raise']}, True]
             agent.feed(ts)
+
+    def test_act_mask(self):
+        agent = NFSPAgent(num_actions=4,
+                          state_shape=[2],
+                          hidden_layers_sizes=[10,10],
+                          q_mlp_layers=[10,10],
+                          device=torch.device('cpu'))
+        probs = agent._act(np.random.random_sample((2,)), np.array([False, True, False, True]))
+        self.assertEqual(probs[0], 0)
+        self.assertEqual(probs[2], 0)
+        self.assertAlmostEqual(probs.sum(), 1)
+
+    def test_reservoir_buffer(self):
+        buffer = ReservoirBuffer(10)
+        self.assertEqual(list(buffer), [])
+        buffer.add_batch(np.zeros((0, 3), dtype=np.float32), np.zeros(0, dtype=np.int64))
+        self.assertEqual(len(buffer), 0)
+        for i in range(5):
+            buffer.add(np.full(3, i, dtype=np.float32), i)
+        buffer.add_batch(np.arange(20, dtype=np.float32).repeat(3).reshape(20, 3), np.arange(20))
+        self.assertEqual(len(buffer), 10)
+        self.assertEqual(buffer._add_calls, 25)
+        info_states, actions = buffer.sample(4)
+        self.assertEqual(info_states.shape, (4, 3))
+        self.assertEqual(info_states.dtype, np.float32)
+        self.assertEqual(info_states[:, 0].tolist(), actions.tolist())
+        # Sampled without replacement
+        self.assertEqual(sorted(buffer.sample(10)[1].tolist()), sorted(buffer._actions.tolist()))
+        with self.assertRaises(ValueError):
+            buffer.sample(11)
+
+    def test_reservoir_buffer_repeated_slots(self):
+        buffer = ReservoirBuffer(4)
+        buffer.add_batch(np.zeros((4, 1)), np.arange(4))
+        with mock.patch('numpy.random.randint', return_value=np.array([1, 9, 1, 3, 1, 3])):
+            buffer.add_batch(np.zeros((6, 1)), np.arange(4, 10))
+        self.assertEqual(buffer._actions.tolist(), [0, 8, 2, 9])
+
+        # Each transition is kept with probability 4 / 40, although the
+        # slots are replaced several times in each batch
+        np.random.seed(1)
+        counts = np.zeros(40)
+        for _ in range(3000):
+            buffer = ReservoirBuffer(4)
+            buffer.add_batch(np.zeros((40, 1)), np.arange(40))
+            counts[[action for _, action in buffer]] += 1
+        self.assertLess(np.abs(counts / 3000 - 0.1).max(), 0.03)
+
+    def test_reservoir_buffer_uniform(self):
+        np.random.seed(0)
+        counts = np.zeros(100)
+        for _ in range(2000):
+            buffer = ReservoirBuffer(10)
+            buffer.add_batch(np.zeros((60, 1)), np.arange(60))
+            for i in range(60, 100):
+                buffer.add(np.zeros(1), i)
+            counts[[action for _, action in buffer]] += 1
+        # Each transition is kept with probability 10 / 100
+        self.assertLess(np.abs(counts / 2000 - 0.1).max(), 0.03)
+
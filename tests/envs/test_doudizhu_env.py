@@ -1,6 +1,8 @@
 import unittest
+import numpy as np
 
 import rlcard
+from rlcard.envs.doudizhu import _cards2array
 from rlcard.agents.random_agent import RandomAgent
 from .determism_util import is_deterministic
 
@@ -23,6 +25,21 @@ class TestDoudizhuEnv(unittest.TestCase):
         for legal_action in legal_actions:
             self.assertLessEqual(legal_action, env.num_actions-1)
 
+    def test_action_features(self):
+        env = rlcard.make('doudizhu')
+        self.assertEqual(env._action_features.shape, (env.num_actions, 54))
+        for action_id in [0, 100, 5000, env.num_actions-2, env.num_actions-1]:
+            action = env._decode_action(action_id)
+            self.assertTrue(np.array_equal(env.get_action_feature(action_id), _cards2array(action)))
+        state, _ = env.reset()
+        for action_id, feature in state['legal_actions'].items():
+            self.assertTrue(np.array_equal(feature, _cards2array(env._decode_action(action_id))))
+            # The features are views of the shared table, which cannot be written
+            with self.assertRaises(ValueError):
+                feature[:] = 1
+        with self.assertRaises(ValueError):
+            env.get_action_feature(0)[:] = 1
+
     def test_step(self):
         env = rlcard.make('doudizhu')
         _, player_id = env.reset()
@@ -61,7 +78,6 @@ class TestDoudizhuEnv(unittest.TestCase):
         env = rlcard.make('doudizhu')
         env.reset()
         env.game.state['actions'] = ['33366', '33355']
-        env.game.judger.playable_cards[0] = ['5', '6', '55', '555', '33366', '33355']
         decoded = env._decode_action(3)
         self.assertEqual(decoded, '6')
         env.game.state['actions'] = ['444', '44466', '44455']
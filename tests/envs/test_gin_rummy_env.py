@@ -19,6 +19,20 @@ class TestGinRummyEnv(unittest.TestCase):
         state, _ = env.reset()
         self.assertEqual(state['obs'].size, 5 * 52)
 
+    def test_extract_state(self):
+        from rlcard.games.gin_rummy.utils.utils import encode_cards
+        env = rlcard.make('gin-rummy', config={'seed': 0})
+        state, _ = env.reset()
+        while not env.is_over():
+            discard_pile = env.game.round.dealer.discard_pile
+            current_player = env.game.get_current_player()
+            opponent = env.game.round.players[(current_player.player_id + 1) % 2]
+            unknown_cards = env.game.round.dealer.stock_pile + \
+                [card for card in opponent.hand if card not in opponent.known_cards]
+            planes = [current_player.hand, discard_pile[-1:], discard_pile[:-1], opponent.known_cards, unknown_cards]
+            self.assertTrue(np.array_equal(state['obs'], np.array([encode_cards(cards) for cards in planes])))
+            state, _ = env.step(np.random.choice(list(state['legal_actions'].keys())))
+
     def test_is_deterministic(self):
         self.assertTrue(is_deterministic('gin-rummy'))
 
@@ -14,6 +14,8 @@ class TestLeducholdemEnv(unittest.TestCase):
         self.assertEqual(state['obs'].size, 36)
         for action in state['legal_actions']:
             self.assertLess(action, env.num_actions)
+        # The agents that need a mask build it, the states carry none
+        self.assertNotIn('legal_actions_mask', state)
 
     def test_is_deterministic(self):
         self.assertTrue(is_deterministic('leduc-holdem'))
@@ -3,6 +3,7 @@ import numpy as np
 
 import rlcard
 from rlcard.agents.random_agent import RandomAgent
+from rlcard.games.mahjong.utils import encode_cards, pile2list
 from .determism_util import is_deterministic
 
 class TestMahjongEnv(unittest.TestCase):
@@ -12,6 +13,22 @@ class TestMahjongEnv(unittest.TestCase):
         state, _ = env.reset()
         self.assertEqual(state['obs'].size, 816)
 
+    def test_extract_state(self):
+        env = rlcard.make('mahjong', config={'seed': 0})
+        state, _ = env.reset()
+        while not env.is_over():
+            raw_obs = state['raw_obs']
+            planes = [encode_cards(raw_obs['current_hand']), encode_cards(raw_obs['table'])]
+            planes.extend(encode_cards(pile2list(pile)) for pile in raw_obs['players_pile'].values())
+            self.assertTrue(np.array_equal(state['obs'], np.array(planes)))
+            legal_actions = env.game.get_legal_actions(env.game.get_state(env.game.round.current_player))
+            action_ids = [env.action_id[a if isinstance(a, str) else a.get_str()] for a in legal_actions]
+            self.assertEqual(list(state['legal_actions']), list(dict.fromkeys(action_ids)))
+            action = np.random.choice(list(state['legal_actions']))
+            if action < 34:
+                self.assertEqual(env._decode_action(action).get_str(), env.de_action_id[action])
+            state, _ = env.step(action)
+
     def test_is_deterministic(self):
         self.assertTrue(is_deterministic('mahjong'))
 
@@ -0,0 +1,47 @@
+import unittest
+import numpy as np
+
+import rlcard
+
+ENV_IDS = ['blackjack', 'leduc-holdem', 'limit-holdem', 'no-limit-holdem', 'uno', 'mahjong', 'gin-rummy', 'doudizhu']
+
+
+class TestObsOut(unittest.TestCase):
+
+    def test_obs_out(self):
+        for env_id in ENV_IDS:
+            env = rlcard.make(env_id, config={'seed': 0})
+            np_random = np.random.RandomState(0)
+            # A rollout buffer of int8 observations, written row by row
+            max_state_size = max(int(np.prod(shape)) for shape in env.state_shape)
+            rollout = np.full((200, max_state_size), -1, dtype=np.int8)
+            for _ in range(3):
+                state, player_id = env.reset()
+                t = 0
+                while not env.is_over() and t < len(rollout):
+                    shape = tuple(env.state_shape[player_id])
+                    row = rollout[t, :int(np.prod(shape))].reshape(shape)
+                    self.assertIs(env.get_state(player_id, obs_out=row)['obs'], row)
+                    self.assertTrue(np.array_equal(rollout[t, :row.size], state['obs'].flatten()))
+                    buffer = np.ones(shape, dtype=np.float32)
+                    self.assertIs(env.get_state(player_id, obs_out=buffer)['obs'], buffer)
+                    self.assertTrue(np.array_equal(buffer, state['obs']))
+
+                    legal_actions = list(state['legal_actions'].keys())
+                    action = legal_actions[np_random.randint(len(legal_actions))]
+                    if all(next_shape == env.state_shape[0] for next_shape in env.state_shape):
+                        # The next player is not known before the step, the shape must not depend on it
+                        state, player_id = env.step(action, obs_out=np.zeros(shape, dtype=np.float32))
+                        self.assertTrue(np.array_equal(env.get_state(player_id)['obs'], state['obs']))
+                    else:
+                        state, player_id = env.step(action)
+                    t += 1
+
+    def test_obs_out_shape(self):
+        env = rlcard.make('leduc-holdem')
+        with self.assertRaises(ValueError):
+            env.reset(obs_out=np.zeros(35, dtype=np.float32))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,96 @@
+import unittest
+import numpy as np
+
+import rlcard
+from rlcard.envs import VectorEnv
+from rlcard.agents.random_agent import RandomAgent
+
+
+class FoldJackAgent(object):
+    ''' Fold or check with a jack, call or raise otherwise, so that
+        the games have different lengths
+    '''
+    use_raw = False
+
+    def eval_step(self, state):
+        legal_actions = sorted(state['legal_actions'].keys())
+        if state['raw_obs']['hand'][1] == 'J':
+            return legal_actions[-1], {}
+        return legal_actions[0], {}
+
+
+class TestVectorEnv(unittest.TestCase):
+
+    def test_reset_and_stack_states(self):
+        env = VectorEnv('leduc-holdem', 4, config={'seed': 0})
+        states, player_ids = env.reset()
+        self.assertEqual(len(states), 4)
+        self.assertEqual(player_ids.shape, (4,))
+        batch = env.stack_states(states)
+        self.assertEqual(batch['obs'].shape, (4, 36))
+        self.assertEqual(batch['legal_actions'].shape, (4, env.num_actions))
+        for state, mask in zip(states, batch['legal_actions']):
+            self.assertEqual(list(np.flatnonzero(mask)), sorted(state['legal_actions'].keys()))
+
+    def test_step_auto_reset(self):
+        env = VectorEnv('blackjack', 3)
+        states, _ = env.reset()
+        # Stand in every game, which finishes blackjack immediately
+        _, player_ids, dones, payoffs = env.step([1, 1, 1])
+        self.assertTrue(dones.all())
+        for payoff in payoffs:
+            self.assertEqual(len(payoff), 1)
+        for e in env.envs:
+            self.assertFalse(e.is_over())
+
+    def test_run(self):
+        env = VectorEnv('leduc-holdem', 8)
+        agents = [RandomAgent(env.num_actions) for _ in range(env.num_players)]
+        env.set_agents(agents)
+        trajectories, payoffs = env.run(20)
+        self.assertEqual(len(trajectories), 20)
+        self.assertEqual(len(payoffs), 20)
+        for payoff in payoffs:
+            self.assertEqual(sum(payoff), 0)
+        for trajectory in trajectories:
+            self.assertEqual(len(trajectory), env.num_players)
+
+    def test_run_payoffs(self):
+        # Every table plays one game, whatever the lengths of the games
+        for num_games in [3, 8]:
+            env = VectorEnv('leduc-holdem', 8, config={'seed': 0})
+            env.set_agents([FoldJackAgent() for _ in range(env.num_players)])
+            _, payoffs = env.run(num_games)
+            expected_payoffs = []
+            for seed in range(num_games):
+                single_env = rlcard.make('leduc-holdem', config={'seed': seed})
+                single_env.set_agents([FoldJackAgent() for _ in range(single_env.num_players)])
+                expected_payoffs.append(single_env.run()[1])
+            self.assertEqual(sorted(map(tuple, payoffs)), sorted(map(tuple, expected_payoffs)))
+            self.assertTrue(np.allclose(np.mean(payoffs, axis=0), np.mean(expected_payoffs, axis=0)))
+
+    def test_run_num_started(self):
+        env = VectorEnv('leduc-holdem', 4, config={'seed': 0})
+        env.set_agents([FoldJackAgent() for _ in range(env.num_players)])
+        num_resets = [0]
+        for e in env.envs:
+            def reset(reset=e.reset):
+                num_resets[0] += 1
+                return reset()
+            e.reset = reset
+        trajectories, payoffs = env.run(21)
+        self.assertEqual(num_resets[0], 21)
+        self.assertEqual(len(trajectories), 21)
+        self.assertEqual(len(payoffs), 21)
+        for e in env.envs:
+            self.assertTrue(e.is_over())
+
+    def test_run_different_state_shapes(self):
+        env = VectorEnv('doudizhu', 2)
+        agents = [RandomAgent(env.num_actions) for _ in range(env.num_players)]
+        env.set_agents(agents)
+        _, payoffs = env.run(2, is_training=True)
+        self.assertEqual(len(payoffs), 2)
+
+if __name__ == '__main__':
+    unittest.main()
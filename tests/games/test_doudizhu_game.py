@@ -65,10 +65,9 @@ class TestDoudizhuGame(unittest.TestCase):
         game = Game(allow_step_back=True)
         state, player_id = game.init_game()
         action = state['actions'][0]
-        playable_cards = game.judger.playable_cards
         game.step(action)
         game.step_back()
-        self.assertEqual(game.judger.playable_cards, playable_cards)
+        self.assertEqual(sorted(game.get_state(player_id)['actions']), sorted(state['actions']))
         self.assertEqual(game.round.greater_player, None)
         self.assertEqual(game.round.current_player, player_id)
         self.assertEqual(len(game.history), 0)
@@ -83,12 +82,12 @@ class TestDoudizhuGame(unittest.TestCase):
         action = state['actions'][0]
         game.step(action)
         actions = game.state['actions']
-        playable_cards = game.judger.playable_cards
+        legal_actions = [sorted(game.get_state(i)['actions']) for i in range(3)]
         played_cards = game.players[game.round.current_player].played_cards
         game.step('pass')
         game.step_back()
-        #judger.playable_cards should be the same
-        self.assertEqual(game.judger.playable_cards, playable_cards)
+        #legal actions of all the players should be the same
+        self.assertEqual([sorted(game.get_state(i)['actions']) for i in range(3)], legal_actions)
         #players[current_player].played_cards should be the same
         self.assertEqual(game.players[game.round.current_player].played_cards, played_cards)
         #greater_player should be the same
@@ -106,12 +105,12 @@ class TestDoudizhuGame(unittest.TestCase):
         game.step('pass')
         game.step('pass')
         actions = game.state['actions']
-        playable_cards = game.judger.playable_cards
+        legal_actions = [sorted(game.get_state(i)['actions']) for i in range(3)]
         played_cards = game.players[game.round.current_player].played_cards
         game.step(actions[0])
         game.step_back()
-        #judger.playable_cards should be the same
-        self.assertEqual(game.judger.playable_cards, playable_cards)
+        #legal actions of all the players should be the same
+        self.assertEqual([sorted(game.get_state(i)['actions']) for i in range(3)], legal_actions)
         #players[current_player].played_cards should be the same
         self.assertEqual(game.players[game.round.current_player].played_cards, played_cards)
         #greater_player should be the same
@@ -1,6 +1,14 @@
+import os
+import json
+import tempfile
 import unittest
+from collections import OrderedDict
+import numpy as np
 
-from rlcard.games.doudizhu.utils import CARD_TYPE
+from rlcard.games.doudizhu.game import DoudizhuGame as Game
+from rlcard.games.doudizhu.utils import CARD_TYPE, ID_2_ACTION, cards2str, get_gt_cards
+from rlcard.games.doudizhu.utils import get_playable_action_ids, get_gt_action_ids
+from rlcard.games.doudizhu import utils
 from rlcard.games.doudizhu.judger import DoudizhuJudger as Judger
 
 class TestDoudizhuGame(unittest.TestCase):
@@ -155,5 +163,87 @@ class TestDoudizhuGame(unittest.TestCase):
             self.assertIn(c, playable_cards)
         self.assertEqual(len(playable_cards), len(all_cards_list))
 
+    def test_legal_move_generator(self):
+        # Compare with the judger and get_gt_cards over random deals
+        game = Game()
+        game.np_random = np.random.RandomState(0)
+        for _ in range(20):
+            state, player_id = game.init_game()
+            while not game.is_over():
+                player = game.players[player_id]
+                greater_player = game.round.greater_player
+                if greater_player is None or greater_player.player_id == player_id:
+                    expected = Judger.playable_cards_from_hand(cards2str(player.current_hand))
+                else:
+                    expected = get_gt_cards(player, greater_player)
+                self.assertEqual(len(state['actions']), len(set(state['actions'])))
+                self.assertEqual(set(state['actions']), set(expected))
+                action = state['actions'][game.np_random.randint(len(state['actions']))]
+                state, player_id = game.step(action)
+
+    def test_deprecated_playable_cards(self):
+        game = Game()
+        game.init_game()
+        with self.assertWarns(DeprecationWarning):
+            playable_cards = game.judger.playable_cards
+        for player in game.players:
+            expected = Judger.playable_cards_from_hand(cards2str(player.current_hand))
+            self.assertEqual(playable_cards[player.player_id], expected)
+
+    def test_legal_action_ids(self):
+        action_ids = get_playable_action_ids('3333444455556666777788889999TTTTJJJJQQQQKKKKAAAA2222BR')
+        self.assertEqual(len(action_ids), len(ID_2_ACTION) - 1)
+        self.assertEqual([ID_2_ACTION[i] for i in get_gt_action_ids('33456BR', '4')], ['pass', '5', '6', 'B', 'R', 'BR'])
+        self.assertEqual(get_gt_action_ids('3333', 'BR'), [len(ID_2_ACTION) - 1])
+
+    def test_compiled_tables(self):
+        def load(name):
+            with open(os.path.join(utils.JSONDATA_PATH, name), 'r') as f:
+                return json.load(f, object_pairs_hook=OrderedDict)
+        utils._get_tables()
+        stamp = utils._get_tables_stamp()
+        self.assertTrue(os.path.isfile(os.path.join(utils.JSONDATA_PATH, 'tables', stamp, 'masks.npy')))
+        with open(os.path.join(utils.JSONDATA_PATH, 'action_space.txt'), 'r') as f:
+            self.assertEqual(ID_2_ACTION, f.readline().strip().split())
+        card_type = load('card_type.json')
+        self.assertEqual(list(CARD_TYPE[0].items()), list(card_type.items()))
+        self.assertEqual(CARD_TYPE[2], set(card_type))
+        type_card = load('type_card.json')
+        self.assertEqual(list(utils.TYPE_CARD), list(type_card))
+        for card_type, candidate in type_card.items():
+            self.assertEqual(list(utils.TYPE_CARD[card_type].items()), list(candidate.items()))
+        compiled_tables = utils._compile_tables()
+        for name in utils._TABLE_NAMES:
+            self.assertTrue(np.array_equal(compiled_tables[name], utils._get_tables()[name]))
+            self.assertFalse(utils._get_tables()[name].flags.writeable)
+        self.assertEqual(utils.get_action_space()[1]['pass'], len(ID_2_ACTION) - 1)
+        self.assertIn('TYPE_CARD', dir(utils))
+        with self.assertRaises(AttributeError):
+            utils.NOT_A_TABLE
+
+    def test_cache_tables(self):
+        tables = utils._compile_tables()
+        stamp = utils._get_tables_stamp()
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, 'tables', stamp)
+            cached_tables = utils._cache_tables(tables, path, stamp)
+            self.assertIs(cached_tables, tables)
+            self.assertEqual(set(os.listdir(os.path.join(tmp_dir, 'tables'))), {stamp})
+            # A complete cache is kept, its tables are used
+            mtime = os.path.getmtime(os.path.join(path, 'masks.npy'))
+            cached_tables = utils._cache_tables(tables, path, stamp)
+            self.assertIsNot(cached_tables, tables)
+            self.assertEqual(os.path.getmtime(os.path.join(path, 'masks.npy')), mtime)
+            self.assertTrue(np.array_equal(cached_tables['masks'], tables['masks']))
+            # A cache of another stamp is not loaded
+            self.assertIsNone(utils._load_cached_tables(path, 'v0-' + stamp))
+            # An incomplete cache is replaced
+            os.remove(os.path.join(path, 'stamp.txt'))
+            self.assertIsNone(utils._load_cached_tables(path, stamp))
+            self.assertIs(utils._cache_tables(tables, path, stamp), tables)
+            for name in utils._TABLE_NAMES:
+                self.assertTrue(np.array_equal(utils._load_cached_tables(path, stamp)[name], tables[name]))
+            self.assertEqual(set(os.listdir(os.path.join(tmp_dir, 'tables'))), {stamp})
+
 if __name__ == '__main__':
     unittest.main()
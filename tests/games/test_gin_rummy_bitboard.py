@@ -0,0 +1,92 @@
+import itertools
+import unittest
+import numpy as np
+
+from rlcard.games.gin_rummy.utils import bitboard
+from rlcard.games.gin_rummy.utils import melding
+from rlcard.games.gin_rummy.utils import utils
+import rlcard.games.gin_rummy.judge as judge
+
+def brute_force_meld_clusters(hand):
+    ''' All the clusters of 1, 2 or 3 disjoint melds, as sets of frozensets of cards
+    '''
+    melds = [frozenset(meld) for meld in melding.get_all_run_melds(hand) + melding.get_all_set_melds(hand)]
+    result = set()
+    for count in range(1, 4):
+        for meld_cluster in itertools.combinations(melds, count):
+            cards = [card for meld in meld_cluster for card in meld]
+            if len(cards) == len(set(cards)):
+                result.add(frozenset(meld_cluster))
+    return result
+
+def brute_force_going_out_cards(hand, going_out_deadwood_count):
+    ''' The cards that can be knocked and ginned, by discarding each card of the hand
+    '''
+    knock_cards, gin_cards = set(), set()
+    for card in hand:
+        next_hand = [x for x in hand if x != card]
+        for meld_cluster in melding.get_meld_clusters(next_hand):
+            deadwood_count = utils.get_deadwood_count(next_hand, meld_cluster)
+            if deadwood_count == 0:
+                gin_cards.add(card)
+            elif deadwood_count <= going_out_deadwood_count:
+                knock_cards.add(card)
+    return knock_cards, gin_cards
+
+def random_hands(num_cards, num_hands, seed):
+    np_random = np.random.RandomState(seed)
+    deck = utils.get_deck()
+    # Draw from the low ranks so that the hands have many melds
+    card_ids = [rank_id + 13 * suit_id for suit_id in range(4) for rank_id in range(6)]
+    for _ in range(num_hands):
+        yield [deck[card_id] for card_id in np_random.choice(card_ids, num_cards, replace=False)]
+
+class TestGinRummyBitboard(unittest.TestCase):
+
+    def test_masks(self):
+        self.assertEqual(len(bitboard.RUN_MELDS), 264)
+        self.assertEqual(len(bitboard.SET_MELDS), 65)
+        deck = utils.get_deck()
+        self.assertEqual(bitboard.get_cards(bitboard.get_mask(deck[::-1])), deck)
+        self.assertEqual(bitboard.get_deadwood_count(bitboard.get_mask(deck)), 340)
+        self.assertEqual(bitboard.get_cards(bitboard.SET_MELDS[0]), [card for card in deck if card.rank == 'A'])
+
+    def test_update_encoded_masks(self):
+        np_random = np.random.RandomState(3)
+        planes = np.zeros((5, 52), dtype=np.int8)
+        encoded_masks = [0] * 5
+        for _ in range(50):
+            masks = [int(np_random.randint(1 << 26)) << int(np_random.randint(27)) for _ in range(5)]
+            bitboard.update_encoded_masks(planes, encoded_masks, masks)
+            self.assertEqual(encoded_masks, masks)
+            self.assertTrue(np.array_equal(planes, bitboard.encode_masks(masks)))
+
+    def test_meld_clusters(self):
+        for hand in random_hands(11, 200, 0):
+            meld_clusters = bitboard.get_meld_clusters(bitboard.get_mask(hand))
+            self.assertEqual(len(meld_clusters), len(set(meld_clusters)))
+            self.assertEqual({frozenset(frozenset(bitboard.get_cards(meld)) for meld in meld_cluster)
+                              for meld_cluster in meld_clusters}, brute_force_meld_clusters(hand))
+
+    def test_min_deadwood_count(self):
+        for hand in random_hands(10, 200, 1):
+            meld_clusters = [[]] + melding.get_meld_clusters(hand)
+            deadwood_count = min(utils.get_deadwood_count(hand, meld_cluster) for meld_cluster in meld_clusters)
+            self.assertEqual(melding.get_min_deadwood_count(hand), deadwood_count)
+            best_meld_clusters = melding.get_best_meld_clusters(hand)
+            if best_meld_clusters:
+                self.assertEqual(utils.get_deadwood_count(hand, best_meld_clusters[0]), deadwood_count)
+
+    def test_going_out_cards(self):
+        for hand in random_hands(11, 200, 2):
+            knock_cards, gin_cards = judge.get_going_out_cards(hand, 10)
+            expected_knock_cards, expected_gin_cards = brute_force_going_out_cards(hand, 10)
+            self.assertEqual(set(knock_cards), expected_knock_cards)
+            if expected_gin_cards:
+                self.assertTrue(gin_cards)
+                self.assertTrue(set(gin_cards) <= expected_gin_cards)
+            else:
+                self.assertEqual(gin_cards, [])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -9,6 +9,7 @@ import numpy as np
 
 import rlcard.games.gin_rummy.judge as judge
 import rlcard.games.gin_rummy.utils.utils as utils
+import rlcard.games.gin_rummy.utils.bitboard as bitboard
 
 from rlcard.games.gin_rummy.dealer import GinRummyDealer
 from rlcard.games.gin_rummy.game import GinRummyGame as Game
@@ -193,6 +194,51 @@ class TestGinRummyGame(unittest.TestCase):
         self.assertEqual(settings.is_allowed_pick_up_discard,
                          default_setting[Setting.is_allowed_pick_up_discard])
 
+    def test_bitboard_masks(self):
+        game = Game()
+        game.np_random = np.random.RandomState(0)
+        for _ in range(20):
+            game.init_game()
+            while not game.is_over():
+                dealer = game.round.dealer
+                self.assertEqual(dealer.stock_mask, bitboard.get_mask(dealer.stock_pile))
+                self.assertEqual(dealer.discard_mask, bitboard.get_mask(dealer.discard_pile))
+                for player in game.round.players:
+                    self.assertEqual(player.hand_mask, bitboard.get_mask(player.hand))
+                    self.assertEqual(player.known_mask, bitboard.get_mask(player.known_cards))
+                    self.assertEqual(player.get_melds(), bitboard.get_melds(player.hand_mask))
+                legal_actions = game.judge.get_legal_actions()
+                game.step(legal_actions[game.np_random.randint(len(legal_actions))])
+
+    def test_step_back(self):
+        def snapshot(game):
+            dealer = game.round.dealer
+            players = [(list(player.hand), player.hand_mask, list(player.known_cards), player.known_mask,
+                        player.get_melds()) for player in game.round.players]
+            return (game.get_state(game.get_player_id()), list(game.actions), len(game.round.move_sheet),
+                    game.round.current_player_id, game.round.going_out_action, game.is_over(),
+                    list(dealer.stock_pile), list(dealer.discard_pile), dealer.stock_mask, dealer.discard_mask,
+                    players, [action.action_id for action in game.judge.get_legal_actions()])
+
+        game = Game(allow_step_back=True)
+        game.np_random = np.random.RandomState(1)
+        for _ in range(10):
+            game.init_game()
+            snapshots = [snapshot(game)]
+            while not game.is_over():
+                legal_actions = game.judge.get_legal_actions()
+                for action in legal_actions:
+                    game.step(action)
+                    game.step_back()
+                    self.assertEqual(snapshot(game), snapshots[-1])
+                game.step(legal_actions[game.np_random.randint(len(legal_actions))])
+                snapshots.append(snapshot(game))
+            self.assertEqual(len(game.history), len(game.actions))
+            while game.step_back():
+                snapshots.pop()
+                self.assertEqual(snapshot(game), snapshots[-1])
+            self.assertEqual(len(game.actions), 0)
+
     def test_decode_cards(self):
         deck = utils.get_deck()
         encoded_cards = utils.encode_cards(deck)
@@ -0,0 +1,56 @@
+import itertools
+import unittest
+
+from rlcard.games.limitholdem.equity import EquityCalculator, canonical_cards
+from rlcard.games.limitholdem.evaluator import CARD_IDS, cards2ids
+from rlcard.games.limitholdem.utils import compare_hands
+
+
+class TestLimitholdemEquity(unittest.TestCase):
+
+    def test_canonical_cards(self):
+        hole, public = canonical_cards(cards2ids(['SA', 'HK']), cards2ids(['D2', 'HQ', 'S9']))
+        self.assertEqual((hole, public), canonical_cards(cards2ids(['CA', 'DK']), cards2ids(['S2', 'DQ', 'C9'])))
+        self.assertNotEqual(hole, canonical_cards(cards2ids(['SA', 'SK']), [])[0])
+
+    def test_exact_river(self):
+        hole, public = ['SA', 'HK'], ['D2', 'C7', 'HQ', 'S9', 'DK']
+        counts = [0, 0, 0]
+        for opponent in itertools.combinations([c for c in CARD_IDS if c not in hole + public], 2):
+            winners = compare_hands([hole + public, list(opponent) + public])
+            counts[[[1, 0], [1, 1], [0, 1]].index(winners)] += 1
+        expected = [count / sum(counts) for count in counts]
+        calculator = EquityCalculator()
+        for result, p in zip(calculator.equity(hole, public), expected):
+            self.assertAlmostEqual(result, p)
+
+    def test_sampling(self):
+        calculator = EquityCalculator(num_samples=20000, seed=0)
+        hole, public = ['SA', 'HK'], ['D2', 'C7', 'HQ', 'S9']
+        exact = calculator.equity(hole, public)
+        sampled = calculator.equity(hole, public, exact=False)
+        for e, s in zip(exact, sampled):
+            self.assertAlmostEqual(e, s, delta=0.02)
+        win, tie, lose = calculator.equity(['SA', 'HA'], num_opponents=1)
+        self.assertAlmostEqual(win, 0.85, delta=0.02)
+        self.assertAlmostEqual(win + tie + lose, 1)
+        self.assertLess(calculator.equity(['SA', 'HA'], num_opponents=4)[0], win)
+
+    def test_cache(self):
+        calculator = EquityCalculator(num_samples=100, cache_size=2)
+        result = calculator.equity(['SA', 'SK'], ['S2', 'H7', 'DQ'])
+        self.assertEqual(calculator.equity(['HK', 'HA'], ['C7', 'H2', 'DQ']), result)
+        self.assertEqual(len(calculator.cache), 1)
+        calculator.equity(['SA', 'SK'])
+        calculator.equity(['SA', 'HK'])
+        self.assertEqual(len(calculator.cache), 2)
+
+    def test_wrong_cards(self):
+        calculator = EquityCalculator()
+        with self.assertRaises(ValueError):
+            calculator.equity(['SA', 'SA'])
+        with self.assertRaises(ValueError):
+            calculator.equity(['SA', 'SK'], ['S2', 'H7', 'DQ'], exact=True)
+
+if __name__ == '__main__':
+    unittest.main()
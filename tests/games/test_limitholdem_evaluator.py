@@ -0,0 +1,64 @@
+import unittest
+import numpy as np
+
+from rlcard.games.limitholdem.evaluator import CARD_IDS, cards2ids, evaluate_hand, evaluate_hands, get_category
+from rlcard.games.limitholdem.judger import LimitHoldemJudger
+from rlcard.games.limitholdem.utils import Hand, compare_hands
+from rlcard.utils.utils import init_standard_deck
+
+
+class TestLimitholdemEvaluator(unittest.TestCase):
+
+    def test_card_ids(self):
+        deck = init_standard_deck()
+        self.assertEqual(cards2ids(deck), list(range(52)))
+        self.assertEqual(cards2ids(['SA', 'CK']), [0, 51])
+
+    def test_categories(self):
+        hands = {9: ['SA', 'S2', 'S3', 'S4', 'S5', 'HK', 'DK'],
+                 8: ['ST', 'HT', 'DT', 'CT', 'S5', 'HK', 'DK'],
+                 7: ['ST', 'HT', 'DT', 'CK', 'S5', 'HK', 'DK'],
+                 6: ['S2', 'S4', 'S6', 'S8', 'ST', 'HT', 'DT'],
+                 5: ['SA', 'H2', 'S3', 'D4', 'C5', 'HK', 'DK'],
+                 4: ['S9', 'H9', 'D9', 'C5', 'S4', 'HK', 'D2'],
+                 3: ['S9', 'H9', 'D5', 'C5', 'S4', 'H4', 'D2'],
+                 2: ['S9', 'H9', 'D5', 'C6', 'S4', 'HK', 'D2'],
+                 1: ['S9', 'H7', 'D5', 'C6', 'S4', 'HK', 'D2']}
+        for category, hand in hands.items():
+            self.assertEqual(get_category(evaluate_hand(cards2ids(hand))), category)
+
+    def test_evaluate_hands(self):
+        np_random = np.random.RandomState(0)
+        card_ids = np.array([np_random.choice(52, 7, replace=False) for _ in range(1000)])
+        strengths = evaluate_hands(card_ids)
+        self.assertEqual(strengths.shape, (1000,))
+        self.assertEqual(strengths.tolist(), [evaluate_hand(hand) for hand in card_ids.tolist()])
+        self.assertEqual(evaluate_hands(card_ids.reshape(10, 100, 7)).shape, (10, 100))
+        self.assertEqual(evaluate_hands(card_ids[:, :5]).tolist(), [evaluate_hand(hand) for hand in card_ids[:, :5].tolist()])
+        with self.assertRaises(ValueError):
+            evaluate_hands(card_ids[:, :4])
+
+    def test_same_as_compare_hands(self):
+        np_random = np.random.RandomState(1)
+        cards = list(CARD_IDS)
+        for i in range(3000):
+            deck = np_random.permutation(52)
+            num_players = 2 + i % 4
+            hands = [[cards[c] for c in deck[5+2*p:7+2*p].tolist() + deck[:5].tolist()] for p in range(num_players)]
+            if i % 5 == 0:
+                hands[0] = None
+            self.assertEqual(LimitHoldemJudger.get_winners(hands), compare_hands(hands))
+            for hand in hands:
+                if hand is not None:
+                    reference = Hand(hand)
+                    reference.evaluateHand()
+                    self.assertEqual(get_category(evaluate_hand(cards2ids(hand))), reference.category)
+
+    def test_ties(self):
+        board = ['SA', 'HA', 'DK', 'CK', 'SQ']
+        hands = [['H2', 'D3'] + board, ['C2', 'S4'] + board, ['SK', 'D3'] + board, None]
+        self.assertEqual(LimitHoldemJudger.get_winners(hands), [0, 0, 1, 0])
+        self.assertEqual(LimitHoldemJudger.get_winners(hands[:2]), [1, 1])
+
+if __name__ == '__main__':
+    unittest.main()
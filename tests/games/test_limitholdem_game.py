@@ -99,6 +99,23 @@ class TestLimitHoldemMethods(unittest.TestCase):
             action = np.random.choice(legal_actions)
             game.step(action)
 
+    def test_step_back_to_start(self):
+        game = Game(allow_step_back=True)
+        game.init_game()
+        def snapshot():
+            return ([card.get_index() for card in game.dealer.deck],
+                    [card.get_index() for card in game.public_cards],
+                    [(p.in_chips, p.status) for p in game.players],
+                    list(game.round.raised), list(game.history_raise_nums),
+                    game.game_pointer, game.round_counter)
+        snapshots = []
+        while not game.is_over():
+            snapshots.append(snapshot())
+            game.step(np.random.choice(game.get_legal_actions()))
+        while snapshots:
+            self.assertTrue(game.step_back())
+            self.assertEqual(snapshot(), snapshots.pop())
+
     def test_payoffs(self):
         game = Game()
         np.random.seed(0)
@@ -0,0 +1,98 @@
+import unittest
+import numpy as np
+
+from rlcard.games.mahjong.decomposer import NUM_TILES, cards2counts, decompose, find_sets
+from rlcard.games.mahjong.judger import MahjongJudger as Judger
+from rlcard.games.mahjong.player import MahjongPlayer as Player
+from rlcard.games.mahjong.utils import card_decoding_dict, init_deck
+
+def brute_force_sets(counts):
+    ''' The most sets of a hand, by trying all the sets containing its first tile
+    '''
+    first = next((i for i in range(NUM_TILES) if counts[i] > 0), None)
+    if first is None:
+        return 0
+    counts = list(counts)
+    counts[first] -= 1
+    best = brute_force_sets(counts)
+    counts[first] += 1
+    if counts[first] >= 3:
+        counts[first] -= 3
+        best = max(best, 1 + brute_force_sets(counts))
+        counts[first] += 3
+    if first < 27 and first % 9 < 7 and counts[first+1] > 0 and counts[first+2] > 0:
+        for i in range(first, first + 3):
+            counts[i] -= 1
+        best = max(best, 1 + brute_force_sets(counts))
+    return best
+
+def brute_force_pair_sets(counts):
+    ''' The most sets of a hand with a pair set aside, -1 without pair
+    '''
+    best = -1
+    for i in range(NUM_TILES):
+        if counts[i] >= 2:
+            counts = list(counts)
+            counts[i] -= 2
+            best = max(best, brute_force_sets(counts))
+            counts[i] += 2
+    return best
+
+def make_player(card_strs, num_piles=0):
+    deck = {card.get_str(): card for card in init_deck()}
+    player = Player(0, np.random.RandomState())
+    player.hand = [deck[card] for card in card_strs]
+    player.hand_counts = cards2counts(player.hand)
+    player.pile = [[deck['winds-east']] * 3 for _ in range(num_piles)]
+    return player
+
+class TestMahjongDecomposer(unittest.TestCase):
+
+    def test_cards2counts(self):
+        counts = cards2counts(['bamboo-1', 'bamboo-1', 'winds-south'])
+        self.assertEqual(len(counts), NUM_TILES)
+        self.assertEqual(counts[0], 2)
+        self.assertEqual(counts[33], 1)
+        self.assertEqual(cards2counts(init_deck()), [4] * NUM_TILES)
+
+    def test_decompose(self):
+        # The pair is taken from three nines, no tile is exactly twice in the hand
+        hand = ['dots-' + trait for trait in '11122233378999']
+        pair, sets = decompose(cards2counts(hand))
+        self.assertEqual(card_decoding_dict[pair], 'dots-9')
+        self.assertEqual(len(sets), 4)
+        tiles = [tile for tile_set in sets for tile in tile_set] + [pair] * 2
+        self.assertEqual(cards2counts([card_decoding_dict[tile] for tile in tiles]), cards2counts(hand))
+        self.assertEqual(decompose(cards2counts(['winds-east', 'winds-west']))[0], -1)
+
+    def test_same_as_brute_force(self):
+        np_random = np.random.RandomState(0)
+        tiles = list(range(9)) + [9, 10, 27, 28]
+        for _ in range(500):
+            counts = [0] * NUM_TILES
+            for tile in np_random.choice(tiles * 4, 14, replace=False):
+                counts[tile] += 1
+            pair, sets = decompose(counts)
+            self.assertEqual(len(sets) if pair >= 0 else -1, brute_force_pair_sets(counts))
+            self.assertEqual(len(find_sets(counts)), brute_force_sets(counts))
+            left = list(counts)
+            if pair >= 0:
+                left[pair] -= 2
+            for tile_set in sets:
+                for tile in tile_set:
+                    left[tile] -= 1
+            self.assertGreaterEqual(min(left), 0)
+
+    def test_judge_hu(self):
+        judger = Judger(np.random.RandomState())
+        win = ['bamboo-1', 'bamboo-2', 'bamboo-3', 'bamboo-3', 'bamboo-4', 'bamboo-5',
+               'characters-7', 'characters-7', 'characters-7', 'dragons-red', 'dragons-red',
+               'dots-2', 'dots-3', 'dots-4']
+        self.assertEqual(judger.judge_hu(make_player(win)), (True, 4))
+        self.assertEqual(judger.judge_hu(make_player(win[:-1] + ['dots-6']))[0], False)
+        self.assertEqual(judger.judge_hu(make_player(win[6:], num_piles=2)), (True, 4))
+        self.assertEqual(judger.judge_hu(make_player([], num_piles=4)), (True, 4))
+        self.assertEqual(judger.cal_set(win[:6]), (2, ['bamboo-1', 'bamboo-2', 'bamboo-3', 'bamboo-3', 'bamboo-4', 'bamboo-5']))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -3,6 +3,8 @@ import numpy as np
 
 from rlcard.games.mahjong.game import MahjongGame as Game
 from rlcard.games.mahjong.player import MahjongPlayer as Player
+from rlcard.games.mahjong.decomposer import cards2counts
+from rlcard.games.mahjong.utils import pile2list
 
 class TestMahjongMethods(unittest.TestCase):
 
@@ -68,6 +70,25 @@ class TestMahjongMethods(unittest.TestCase):
         success = game.step_back()
         self.assertEqual(success, False)
 
+    def test_tile_counts(self):
+        game = Game(allow_step_back=True)
+        game.np_random = np.random.RandomState(0)
+        for _ in range(5):
+            state, _ = game.init_game()
+            while not game.is_over():
+                for player in game.players:
+                    self.assertEqual(player.hand_counts, cards2counts(player.hand))
+                    self.assertEqual(player.pile_counts, cards2counts(pile2list(player.pile)))
+                self.assertEqual(game.dealer.table_counts, cards2counts(game.dealer.table))
+                self.assertIs(state['hand_counts'], game.players[game.round.current_player].hand_counts)
+                actions = game.get_legal_actions(state)
+                if game.np_random.rand() < 0.2:
+                    counts = [list(player.hand_counts) for player in game.players]
+                    game.step(actions[0])
+                    game.step_back()
+                    self.assertEqual([player.hand_counts for player in game.players], counts)
+                state, _ = game.step(actions[game.np_random.randint(len(actions))])
+
     def test_player_get_player_id(self):
         player = Player(0, np.random.RandomState())
         self.assertEqual(0, player.get_player_id())
@@ -4,7 +4,8 @@ import numpy as np
 from rlcard.games.uno.game import UnoGame as Game
 from rlcard.games.uno.player import UnoPlayer as Player
 from rlcard.games.uno.utils import ACTION_LIST
-from rlcard.games.uno.utils import hand2dict, encode_hand, encode_target
+from rlcard.games.uno.utils import hand2dict, encode_hand, encode_target, encode_hand_counts
+from rlcard.games.uno.utils import cards2list, WILD, WILD_DRAW_4
 
 class TestUnoMethods(unittest.TestCase):
 
@@ -69,6 +70,59 @@ class TestUnoMethods(unittest.TestCase):
         success = game.step_back()
         self.assertEqual(success, False)
 
+    def test_step_back_to_start(self):
+        game = Game(allow_step_back=True)
+        game.init_game()
+        def snapshot():
+            return ([card.str for card in game.dealer.deck],
+                    [[card.str for card in player.hand] for player in game.players],
+                    [card.str for card in game.round.played_cards],
+                    game.round.target.str, game.round.current_player, game.round.direction)
+        snapshots = []
+        while not game.is_over():
+            snapshots.append(snapshot())
+            game.step(np.random.choice(game.get_legal_actions()))
+        while snapshots:
+            self.assertTrue(game.step_back())
+            self.assertEqual(snapshot(), snapshots.pop())
+        self.assertEqual(game.step_back(), False)
+
+    def test_legal_action_ids(self):
+        def reference_legal_actions(hand, target):
+            legal_actions, wild_4_actions = set(), set()
+            for card in hand:
+                if card.trait == 'wild':
+                    legal_actions.update(WILD)
+                elif card.trait == 'wild_draw_4':
+                    wild_4_actions.update(WILD_DRAW_4)
+                elif card.color == target.color or (target.type != 'wild' and card.trait == target.trait):
+                    legal_actions.add(card.str)
+            return legal_actions or wild_4_actions or {'draw'}
+
+        game = Game()
+        game.np_random = np.random.RandomState(0)
+        for _ in range(20):
+            state, player_id = game.init_game()
+            while not game.is_over():
+                player = game.players[player_id]
+                self.assertEqual(player.hand_counts, [sum(card.code == code for card in player.hand) for code in range(60)])
+                legal_actions = game.get_legal_actions()
+                self.assertEqual(set(legal_actions), reference_legal_actions(player.hand, game.round.target))
+                self.assertEqual([ACTION_LIST[action_id] for action_id in game.get_legal_action_ids()], legal_actions)
+                state, player_id = game.step(legal_actions[game.np_random.randint(len(legal_actions))])
+
+    def test_encode_hand_counts(self):
+        game = Game()
+        game.np_random = np.random.RandomState(1)
+        for _ in range(20):
+            state, _ = game.init_game()
+            while not game.is_over():
+                hand = cards2list(game.players[game.round.current_player].hand)
+                self.assertTrue(np.array_equal(encode_hand_counts(np.zeros((3, 4, 15), dtype=int), state['hand_counts']),
+                                               encode_hand(np.zeros((3, 4, 15), dtype=int), hand)))
+                legal_actions = game.get_legal_actions()
+                state, _ = game.step(legal_actions[game.np_random.randint(len(legal_actions))])
+
     def test_hand2dict(self):
         hand_1 = ['y-1', 'r-8', 'b-9', 'y-reverse', 'r-skip']
         hand1_dict = hand2dict(hand_1)
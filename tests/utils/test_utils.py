@@ -1,6 +1,7 @@
 import unittest
 import numpy as np
-from rlcard.utils.utils import init_54_deck, init_standard_deck, rank2int, print_card, elegent_form, reorganize, tournament
+from rlcard.utils.utils import init_54_deck, init_standard_deck, rank2int, print_card, elegent_form, reorganize, tournament, parallel_tournament, is_installed
+from rlcard.utils.utils import _get_chunk_seed
 import rlcard
 from rlcard.agents.random_agent import RandomAgent
 
@@ -41,5 +42,66 @@ class TestUtils(unittest.TestCase):
         payoffs = tournament(env,1000)
         self.assertEqual(len(payoffs), 2)
 
+    def test_parallel_tournament(self):
+        agents = [RandomAgent(4), RandomAgent(4)]
+        payoffs, stderrs = parallel_tournament('leduc-holdem', agents, 250, num_workers=1, seed=3, chunk_size=50)
+        self.assertEqual(len(payoffs), 2)
+        self.assertEqual(len(stderrs), 2)
+        self.assertAlmostEqual(sum(payoffs), 0)
+        _payoffs, _stderrs = parallel_tournament('leduc-holdem', agents, 250, num_workers=2, seed=3, chunk_size=50)
+        self.assertEqual(payoffs, _payoffs)
+        self.assertEqual(stderrs, _stderrs)
+        with self.assertRaises(ValueError):
+            parallel_tournament('leduc-holdem', agents, 0, num_workers=1)
+
+    def test_chunk_seeds(self):
+        seeds = [[_get_chunk_seed(seed, chunk_id) for chunk_id in range(10)] for seed in range(10)]
+        self.assertEqual(len(set(sum(seeds, []))), 100)
+
+    def test_parallel_tournament_rng_states(self):
+        import random
+        import torch
+        agents = [RandomAgent(4), RandomAgent(4)]
+        random.seed(1)
+        np.random.seed(1)
+        torch.manual_seed(1)
+        expected = (random.random(), np.random.random(), torch.rand(1).item())
+        random.seed(1)
+        np.random.seed(1)
+        torch.manual_seed(1)
+        parallel_tournament('leduc-holdem', agents, 20, num_workers=1, seed=3, chunk_size=10)
+        self.assertEqual((random.random(), np.random.random(), torch.rand(1).item()), expected)
+
+    def test_is_installed(self):
+        self.assertTrue(is_installed('numpy'))
+        self.assertFalse(is_installed('rlcard_missing_package'))
+
+    def test_lazy_agents(self):
+        import subprocess
+        import sys
+        code = 'import sys, rlcard.agents; assert "torch" not in sys.modules; rlcard.agents.DQNAgent; assert "torch" in sys.modules'
+        subprocess.check_call([sys.executable, '-c', code])
+        from rlcard.agents import NFSPAgent
+        self.assertEqual(NFSPAgent.__name__, 'NFSPAgent')
+        with self.assertRaises(AttributeError):
+            rlcard.agents.MissingAgent
+
+    def test_lazy_agents_without_torch(self):
+        import subprocess
+        import sys
+        code = '\n'.join([
+            'import rlcard.utils.utils',
+            'rlcard.utils.utils._INSTALLED["torch"] = False',
+            'import rlcard.agents',
+            'assert "DQNAgent" not in dir(rlcard.agents) and "RandomAgent" in dir(rlcard.agents)',
+            'try:',
+            '    rlcard.agents.NFSPAgent',
+            'except ImportError as e:',
+            '    assert "torch" in str(e)',
+            'else:',
+            '    raise AssertionError',
+        ])
+        subprocess.check_call([sys.executable, '-c', code])
+
 if __name__ == '__main__':
     unittest.main()